@@ -26,7 +26,7 @@ from geonode.assets.local import LocalAssetHandler
 from geonode.assets.models import LocalAsset
 from geonode.base.management.commands.helpers import confirm
 from django.core.management.base import BaseCommand
-from geonode.geoserver.helpers import gs_catalog
+from geonode.geoserver.helpers import gs_catalog, gs_catalog_cache
 
 from geonode.base.models import ResourceBase
 
@@ -212,6 +212,7 @@ class Command(BaseCommand):
                         logger.info(f"Updating GeoServer store {store_to_update.name}")
                         if dorun:
                             gs_catalog.save(store_to_update)
+                            gs_catalog_cache.invalidate_store(store_to_update.name)
                     except Exception:
                         logger.error(f"Error during GeoServer update for resource {resource}, please check GeoServer logs")
                     logger.info("Geoserver Updated")
@@ -16,21 +16,105 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 #########################################################################
+import json
+import logging
+
 from django.conf import settings
+from django.db import connections
+from django.db.models import QuerySet
 from rest_framework.response import Response
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+logger = logging.getLogger(__name__)
 
 DEFAULT_PAGE = getattr(settings, "REST_API_DEFAULT_PAGE", 1)
 DEFAULT_PAGE_SIZE = getattr(settings, "REST_API_DEFAULT_PAGE_SIZE", 10)
 DEFAULT_PAGE_QUERY_PARAM = getattr(settings, "REST_API_DEFAULT_PAGE_QUERY_PARAM", "page_size")
+DEFAULT_CURSOR_QUERY_PARAM = getattr(settings, "REST_API_DEFAULT_CURSOR_QUERY_PARAM", "cursor")
+DEFAULT_CURSOR_ORDERING = getattr(settings, "REST_API_DEFAULT_CURSOR_ORDERING", "-pk")
+# values accepted by the "total" query param in cursor mode, by default the total is omitted
+CURSOR_TOTAL_QUERY_PARAM = "total"
+CURSOR_TOTAL_EXACT = "exact"
+CURSOR_TOTAL_APPROXIMATE = "approximate"
+
+
+def estimate_count(queryset):
+    """
+    Return the number of rows estimated by the query planner for the given queryset,
+    without actually scanning it.
+    Falls back to an exact count on backends not supporting the JSON explain output
+    """
+    queryset = queryset.order_by()
+    if connections[queryset.db].vendor == "postgresql":
+        try:
+            plan = queryset.explain(format="json")
+            return int(json.loads(plan)[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            logger.debug(f"Could not estimate the count of the queryset: {e}")
+    return queryset.count()
+
+
+class GeoNodeApiCursorPagination(CursorPagination):
+    """
+    Keyset pagination: the page is selected by filtering on the ordering column
+    instead of using an OFFSET, so that deep pages cost the same as the first one.
+    The ordering must be stable and indexed, by default is the primary key.
+    Views can customize it by defining a `cursor_ordering` attribute.
+    """
+
+    cursor_query_param = DEFAULT_CURSOR_QUERY_PARAM
+    ordering = DEFAULT_CURSOR_ORDERING
+    page_size = DEFAULT_PAGE_SIZE
+    page_size_query_param = DEFAULT_PAGE_QUERY_PARAM
+
+    def get_ordering(self, request, queryset, view):
+        ordering = getattr(view, "cursor_ordering", None) or self.ordering
+        if isinstance(ordering, str):
+            return (ordering,)
+        return tuple(ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.total = self.get_total(queryset, request)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_total(self, queryset, request):
+        total = request.query_params.get(CURSOR_TOTAL_QUERY_PARAM)
+        if total == CURSOR_TOTAL_EXACT:
+            return queryset.count()
+        elif total == CURSOR_TOTAL_APPROXIMATE:
+            return estimate_count(queryset)
+        return None
+
+    def get_paginated_response(self, data):
+        _paginated_response = {
+            "links": {"next": self.get_next_link(), "previous": self.get_previous_link()},
+            "total": self.total,
+            DEFAULT_PAGE_QUERY_PARAM: self.page_size,
+        }
+        _paginated_response.update(data)
+        return Response(_paginated_response)
 
 
 class GeoNodeApiPagination(PageNumberPagination):
     page = DEFAULT_PAGE
     page_size = DEFAULT_PAGE_SIZE
     page_size_query_param = DEFAULT_PAGE_QUERY_PARAM
+    cursor_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        # the cursor mode is opt-in: it is enabled by passing the cursor param (even empty)
+        if DEFAULT_CURSOR_QUERY_PARAM in request.query_params and isinstance(queryset, QuerySet):
+            self.cursor_paginator = GeoNodeApiCursorPagination()
+            page_size = self.get_page_size(request)
+            if page_size:
+                self.cursor_paginator.page_size = int(page_size)
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        self.cursor_paginator = None
+        return super().paginate_queryset(queryset, request, view)
 
     def get_paginated_response(self, data):
+        if self.cursor_paginator:
+            return self.cursor_paginator.get_paginated_response(data)
         _paginated_response = {
             "links": {"next": self.get_next_link(), "previous": self.get_previous_link()},
             "total": self.page.paginator.count,
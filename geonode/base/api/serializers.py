@@ -782,14 +782,27 @@ class ResourceBaseSerializer(MultiLangOutputMixin, DynamicModelSerializer):
     def get_perms(self, instance):
         """
         Returns the permissions for the resource instance using Django cache.
+        When serializing a list, the permissions of the whole page are resolved at once.
         """
         request = self.context.get("request")
-        permissions = (
-            permissions_registry.get_perms(instance=instance, user=request.user, use_cache=True)
-            if request and request.user and instance
-            else []
-        )
-        return permissions
+        if not (request and request.user and instance):
+            return []
+
+        bulk_perms = self._get_bulk_perms(request.user)
+        if instance.pk in bulk_perms:
+            return bulk_perms[instance.pk]
+        return permissions_registry.get_perms(instance=instance, user=request.user, use_cache=True)
+
+    def _get_bulk_perms(self, user):
+        """
+        Returns the permissions of the user on all the resources of the parent list serializer, keyed by pk.
+        """
+        parent = getattr(self, "parent", None)
+        if not isinstance(parent, serializers.ListSerializer) or parent.instance is None:
+            return {}
+        if getattr(parent, "_bulk_perms", None) is None:
+            parent._bulk_perms = permissions_registry.get_perms_bulk(list(parent.instance), user, use_cache=True)
+        return parent._bulk_perms
 
     def get_is_copyable(self, instance):
         from geonode.resource.registry import resource_manager_registry
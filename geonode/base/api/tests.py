@@ -32,6 +32,7 @@ from PIL import Image
 from io import BytesIO
 from time import sleep
 from uuid import uuid4
+from functools import partial
 from unittest.mock import patch
 from urllib.parse import urljoin
 from datetime import date, timedelta
@@ -94,6 +95,7 @@ from geonode.base.populate_test_data import (
 from geonode.resource.api.tasks import resouce_service_dispatcher
 from guardian.shortcuts import assign_perm
 from geonode.security.registry import permissions_registry
+from geonode.security.utils import get_resources_with_perms
 
 from django.contrib.auth.models import AnonymousUser
 from django.core.cache import cache
@@ -727,6 +729,38 @@ class BaseApiTests(APITestCase):
             resource.tkeywords.set(ThesaurusKeyword.objects.none())
             self.assertEqual(0, resource.tkeywords.count())
 
+    def test_base_resources_cursor_pagination(self):
+        """
+        Ensure the Resource Base list can be walked with the cursor pagination
+        """
+        url = f"{reverse('base-resources-list')}?filter{{metadata_only}}=false&page_size=10&cursor="
+        response = self.client.get(url, format="json")
+        self.assertEqual(response.status_code, 200)
+        # the total is omitted unless requested
+        self.assertIsNone(response.data["total"])
+        self.assertNotIn("page", response.data)
+        self.assertEqual(len(response.data["resources"]), 10)
+        self.assertIsNone(response.data["links"]["previous"])
+
+        seen = [r["pk"] for r in response.data["resources"]]
+        next_link = response.data["links"]["next"]
+        while next_link:
+            response = self.client.get(next_link, format="json")
+            self.assertEqual(response.status_code, 200)
+            self.assertIsNotNone(response.data["links"]["previous"])
+            seen.extend(r["pk"] for r in response.data["resources"])
+            next_link = response.data["links"]["next"]
+
+        # pages are stable and ordered by primary key
+        self.assertEqual(len(seen), 26)
+        self.assertEqual(len(seen), len(set(seen)))
+        self.assertEqual(seen, sorted(seen, key=int, reverse=True))
+
+        response = self.client.get(f"{url}&total=exact", format="json")
+        self.assertEqual(response.data["total"], 26)
+        response = self.client.get(f"{url}&total=approximate", format="json")
+        self.assertIsInstance(response.data["total"], int)
+
     def test_write_resources(self):
         """
         Ensure we can perform write operation against the Resource Bases.
@@ -1610,6 +1644,32 @@ class BaseApiTests(APITestCase):
                 f"{_key} : {r_type_perms['map']['compact'].get(_key)}",
             )
 
+    @override_settings(RESOURCE_TYPES_CACHE_TIMEOUT=60)
+    def test_resource_types_cache(self):
+        """
+        Ensure the resource types counts are cached per user and invalidated on resource changes
+        """
+        url = urljoin(f"{reverse('base-resources-list')}/", "resource_types/")
+
+        def _get_count(name):
+            response = self.client.get(url, format="json")
+            self.assertEqual(response.status_code, 200)
+            return next(r_type["count"] for r_type in response.data["resource_types"] if r_type["name"] == name)
+
+        self.assertTrue(self.client.login(username="admin", password="admin"))
+        count = _get_count("document")
+        with patch("geonode.base.api.views.get_resources_with_perms", wraps=get_resources_with_perms) as _mock:
+            # the counts come from the cache
+            self.assertEqual(_get_count("document"), count)
+            _mock.assert_not_called()
+
+        document = create_single_doc("test_resource_types_cache")
+        try:
+            self.assertEqual(_get_count("document"), count + 1)
+        finally:
+            document.delete()
+        self.assertEqual(_get_count("document"), count)
+
     def test_get_favorites(self):
         """
         Ensure we get user's favorite resources.
@@ -4127,6 +4187,13 @@ class TestAPIPermissionCache(GeoNodeBaseTestSupport):
         cache.clear()
         self.client.login(username="admin", password="admin")
 
+    def _cached_perms(self, resource_pk, user=None, group=None):
+        """Return the permissions cached under the current generation of the resource and user/group"""
+        cache_key = permissions_registry._get_cache_key(
+            [resource_pk], users=[user] if user else None, groups=[group] if group else None
+        )
+        return cache.get(cache_key)
+
     def _create_test_resource(self, owner=None):
         """Helper method to create a test resource with permissions"""
         if owner is None:
@@ -4167,20 +4234,20 @@ class TestAPIPermissionCache(GeoNodeBaseTestSupport):
         cache_keys = {}
 
         permissions_registry.get_perms(instance=resource, user=self.test_user, use_cache=True)
-        cache_keys["test_user"] = f"resource_perms:{resource.pk}:user:{self.test_user.pk}"
+        cache_keys["test_user"] = partial(self._cached_perms, resource.pk, user=self.test_user)
 
         permissions_registry.get_perms(instance=resource, user=self.admin_user, use_cache=True)
-        cache_keys["admin_user"] = f"resource_perms:{resource.pk}:user:{self.admin_user.pk}"
+        cache_keys["admin_user"] = partial(self._cached_perms, resource.pk, user=self.admin_user)
 
         anonymous_user = AnonymousUser()
         permissions_registry.get_perms(instance=resource, user=anonymous_user, use_cache=True)
-        cache_keys["anonymous"] = f"resource_perms:{resource.pk}:anonymous"
+        cache_keys["anonymous"] = partial(self._cached_perms, resource.pk, user=anonymous_user)
 
         permissions_registry.get_perms(instance=resource, group=self.test_group, use_cache=True)
-        cache_keys["group"] = f"resource_perms:{resource.pk}:group:{self.test_group.pk}"
+        cache_keys["group"] = partial(self._cached_perms, resource.pk, group=self.test_group)
 
         permissions_registry.get_perms(instance=resource, use_cache=True)
-        cache_keys["all"] = f"resource_perms:{resource.pk}:__ALL__"
+        cache_keys["all"] = partial(self._cached_perms, resource.pk)
 
         return cache_keys
 
@@ -4195,13 +4262,13 @@ class TestAPIPermissionCache(GeoNodeBaseTestSupport):
         resource.set_permissions(perm_spec)
 
         permissions_registry.get_perms(instance=resource, user=temp_user, use_cache=True)
-        temp_user_cache_key = f"resource_perms:{resource.pk}:user:{temp_user.pk}"
+        temp_user_cache_key = partial(self._cached_perms, resource.pk, user=temp_user)
 
-        self.assertIsNotNone(cache.get(temp_user_cache_key))
+        self.assertIsNotNone(temp_user_cache_key())
 
         other_cache_keys = self._populate_cache_for_resource(resource)
         for key in other_cache_keys.values():
-            self.assertIsNotNone(cache.get(key))
+            self.assertIsNotNone(key())
 
         response = self.client.delete(reverse("users-detail", kwargs={"pk": temp_user.pk}))
 
@@ -4209,12 +4276,10 @@ class TestAPIPermissionCache(GeoNodeBaseTestSupport):
 
         self.assertFalse(get_user_model().objects.filter(pk=temp_user.pk).exists())
 
-        self.assertIsNone(cache.get(temp_user_cache_key), "Cache should be cleared after user deletion via API")
+        self.assertIsNone(temp_user_cache_key(), "Cache should be cleared after user deletion via API")
 
         for cache_type, cache_key in other_cache_keys.items():
-            self.assertIsNotNone(
-                cache.get(cache_key), f"Cache for {cache_type} should not be affected by user deletion"
-            )
+            self.assertIsNotNone(cache_key(), f"Cache for {cache_type} should not be affected by user deletion")
 
     def test_group_delete_api_cache_invalidation(self):
         """Test that cache is properly invalidated when group is deleted via API"""
@@ -4238,16 +4303,16 @@ class TestAPIPermissionCache(GeoNodeBaseTestSupport):
         resource.set_permissions(new_perm_spec)
 
         permissions_registry.get_perms(instance=resource, group=temp_group, use_cache=True)
-        temp_group_cache_key = f"resource_perms:{resource.pk}:group:{temp_group.pk}"
+        temp_group_cache_key = partial(self._cached_perms, resource.pk, group=temp_group)
 
-        self.assertIsNotNone(cache.get(temp_group_cache_key))
+        self.assertIsNotNone(temp_group_cache_key())
 
-        print(cache.get(temp_group_cache_key), "temp_group_cache_key")
+        print(temp_group_cache_key(), "temp_group_cache_key")
         print(temp_group_cache_key, "temp_group_cache_key")
 
         other_cache_keys = self._populate_cache_for_resource(resource)
         for key in other_cache_keys.values():
-            self.assertIsNotNone(cache.get(key))
+            self.assertIsNotNone(key())
 
         response = self.client.post(reverse("group_remove", args=[temp_group_profile.slug]))
 
@@ -4255,12 +4320,10 @@ class TestAPIPermissionCache(GeoNodeBaseTestSupport):
 
         self.assertFalse(GroupProfile.objects.filter(pk=temp_group.pk).exists())
 
-        self.assertIsNone(cache.get(temp_group_cache_key), "Cache should be cleared after group deletion via API")
+        self.assertIsNone(temp_group_cache_key(), "Cache should be cleared after group deletion via API")
 
         for cache_type, cache_key in other_cache_keys.items():
-            self.assertIsNotNone(
-                cache.get(cache_key), f"Cache for {cache_type} should not be affected by group deletion"
-            )
+            self.assertIsNotNone(cache_key(), f"Cache for {cache_type} should not be affected by group deletion")
 
     def test_resource_delete_api_cache_invalidation(self):
         """Test that cache is properly invalidated when resource is deleted via API"""
@@ -4269,12 +4332,12 @@ class TestAPIPermissionCache(GeoNodeBaseTestSupport):
         cache_keys = self._populate_cache_for_resource(resource)
 
         for cache_type, cache_key in cache_keys.items():
-            self.assertIsNotNone(cache.get(cache_key), f"Cache for {cache_type} should exist before deletion")
+            self.assertIsNotNone(cache_key(), f"Cache for {cache_type} should exist before deletion")
 
         other_resource = self._create_test_resource()
-        other_cache_key = f"resource_perms:{other_resource.pk}:user:{self.test_user.pk}"
+        other_cache_key = partial(self._cached_perms, other_resource.pk, user=self.test_user)
         permissions_registry.get_perms(instance=other_resource, user=self.test_user, use_cache=True)
-        self.assertIsNotNone(cache.get(other_cache_key))
+        self.assertIsNotNone(other_cache_key())
 
         response = self.client.delete(reverse("base-resources-detail", kwargs={"pk": resource.pk}))
 
@@ -4283,11 +4346,9 @@ class TestAPIPermissionCache(GeoNodeBaseTestSupport):
         self.assertFalse(ResourceBase.objects.filter(pk=resource.pk).exists())
 
         for cache_type, cache_key in cache_keys.items():
-            self.assertIsNone(
-                cache.get(cache_key), f"Cache for {cache_type} should be cleared after resource deletion via API"
-            )
+            self.assertIsNone(cache_key(), f"Cache for {cache_type} should be cleared after resource deletion via API")
 
-        self.assertIsNotNone(cache.get(other_cache_key), "Cache for other resources should not be affected")
+        self.assertIsNotNone(other_cache_key(), "Cache for other resources should not be affected")
 
     def tearDown(self):
         cache.clear()
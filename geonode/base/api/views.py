@@ -27,12 +27,11 @@ from uuid import uuid4
 from urllib.parse import urljoin, urlparse
 from PIL import Image
 
-from django.apps import apps
 from django.core.validators import URLValidator
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.conf import settings
-from django.db.models import Subquery, QuerySet
+from django.db.models import Count, Subquery, QuerySet
 from django.http.request import QueryDict
 from django.contrib.auth import get_user_model
 from django.http import HttpResponse
@@ -106,7 +105,7 @@ from .serializers import (
 )
 from geonode.people.api.serializers import UserSerializer
 from .pagination import GeoNodeApiPagination
-from geonode.base.utils import patch_perms
+from geonode.base.utils import patch_perms, resource_types_cache
 from geonode.base.api.deprecated_extra_metadata import DeprecatedExtraMetadataMixin
 from geonode.assets.models import Asset
 from geonode.assets.utils import create_asset_and_link, unlink_asset
@@ -289,6 +288,90 @@ class ApiPresetsInitializer(APIView):
             request.GET._mutable = False
 
 
+# allowed perms of the resource types, they do not change at runtime so are built once per process
+_resource_types_allowed_perms = {}
+
+
+def _to_compact_perms_list(
+    allowed_perms: dict, resource_type: str, resource_subtype: str, compact_perms_labels: dict = {}
+) -> list:
+    _compact_perms_list = {}
+    for _k, _v in allowed_perms.items():
+        _is_owner = _k not in ["anonymous", groups_settings.REGISTERED_MEMBERS_GROUP_NAME]
+        _is_none_allowed = not _is_owner
+        _compact_perms_list[_k] = get_compact_perms_list(
+            _v, resource_type, resource_subtype, _is_owner, _is_none_allowed, compact_perms_labels
+        )
+    return _compact_perms_list
+
+
+def _get_resource_base_subclasses():
+    return [_m for _m in ResourceBase.__subclasses__() if _m.__name__.lower() not in ["service"]]
+
+
+def _get_resource_types() -> list:
+    """
+    Returns the names of the available ResourceBase polymorphic_ctypes,
+    the GeoApp is replaced by its client application types
+    """
+    _types = [_m.__name__.lower() for _m in _get_resource_base_subclasses()]
+    if settings.GEONODE_APPS_ENABLE and "geoapp" in _types:
+        _types.remove("geoapp")
+        if hasattr(settings, "CLIENT_APP_LIST") and settings.CLIENT_APP_LIST:
+            _types += settings.CLIENT_APP_LIST
+        else:
+            from geonode.geoapps.models import GeoApp
+
+            _types += list(GeoApp.objects.order_by().values_list("resource_type", flat=True).distinct())
+    return _types
+
+
+def _get_resource_types_allowed_perms(types: list) -> dict:
+    """
+    Returns the allowed perms for the requested resource types.
+    The perms are computed only the first time a type is requested
+    """
+    if not _resource_types_allowed_perms:
+        for _m in _get_resource_base_subclasses():
+            _resource_types_allowed_perms[_m.__name__.lower()] = {
+                "perms": _m.allowed_permissions,
+                "compact": _to_compact_perms_list(
+                    _m.allowed_permissions,
+                    _m.__name__.lower(),
+                    _m.__name__.lower(),
+                    _m.compact_permission_labels,
+                ),
+            }
+        if settings.GEONODE_APPS_ENABLE and getattr(settings, "CLIENT_APP_ALLOWED_PERMS_LIST", None):
+            for _type in settings.CLIENT_APP_ALLOWED_PERMS_LIST:
+                for _type_name, _type_perms in _type.items():
+                    _compact_permission_labels = {}
+                    if hasattr(settings, "CLIENT_APP_COMPACT_PERM_LABELS"):
+                        _compact_permission_labels = settings.CLIENT_APP_COMPACT_PERM_LABELS.get(_type_name, {})
+                    _resource_types_allowed_perms[_type_name] = {
+                        "perms": _type_perms,
+                        "compact": _to_compact_perms_list(
+                            _type_perms, _type_name, _type_name, _compact_permission_labels
+                        ),
+                    }
+
+    if settings.GEONODE_APPS_ENABLE and not getattr(settings, "CLIENT_APP_ALLOWED_PERMS_LIST", None):
+        from geonode.geoapps.models import GeoApp
+
+        for _type in types:
+            if _type in _resource_types_allowed_perms:
+                continue
+            _m = GeoApp.objects.filter(resource_type=_type).only("resource_type", "subtype").first()
+            if _m:
+                _resource_types_allowed_perms[_type] = {
+                    "perms": _m.allowed_permissions,
+                    "compact": _to_compact_perms_list(
+                        _m.allowed_permissions, _m.resource_type, _m.subtype, _m.compact_permission_labels
+                    ),
+                }
+    return {_type: _resource_types_allowed_perms[_type] for _type in types if _type in _resource_types_allowed_perms}
+
+
 class ResourceBaseViewSet(ApiPresetsInitializer, MultiLangViewMixin, DeprecatedExtraMetadataMixin, DynamicModelViewSet):
     """
     API endpoint that allows base resources to be viewed or edited.
@@ -400,78 +483,22 @@ class ResourceBaseViewSet(ApiPresetsInitializer, MultiLangViewMixin, DeprecatedE
         ```
         """
 
-        def _to_compact_perms_list(
-            allowed_perms: dict, resource_type: str, resource_subtype: str, compact_perms_labels: dict = {}
-        ) -> list:
-            _compact_perms_list = {}
-            for _k, _v in allowed_perms.items():
-                _is_owner = _k not in ["anonymous", groups_settings.REGISTERED_MEMBERS_GROUP_NAME]
-                _is_none_allowed = not _is_owner
-                _compact_perms_list[_k] = get_compact_perms_list(
-                    _v, resource_type, resource_subtype, _is_owner, _is_none_allowed, compact_perms_labels
-                )
-            return _compact_perms_list
-
-        resource_types = []
-        _types = []
-        _allowed_perms = {}
-        for _model in apps.get_models():
-            if _model.__name__ == "ResourceBase":
-                for _m in _model.__subclasses__():
-                    if _m.__name__.lower() not in ["service"]:
-                        _types.append(_m.__name__.lower())
-                        _allowed_perms[_m.__name__.lower()] = {
-                            "perms": _m.allowed_permissions,
-                            "compact": _to_compact_perms_list(
-                                _m.allowed_permissions,
-                                _m.__name__.lower(),
-                                _m.__name__.lower(),
-                                _m.compact_permission_labels,
-                            ),
-                        }
-
-        if settings.GEONODE_APPS_ENABLE and "geoapp" in _types:
-            _types.remove("geoapp")
-            if hasattr(settings, "CLIENT_APP_LIST") and settings.CLIENT_APP_LIST:
-                _types += settings.CLIENT_APP_LIST
-            else:
-                from geonode.geoapps.models import GeoApp
-
-                geoapp_types = [x for x in GeoApp.objects.values_list("resource_type", flat=True).all().distinct()]
-                _types += geoapp_types
-
-            if hasattr(settings, "CLIENT_APP_ALLOWED_PERMS_LIST") and settings.CLIENT_APP_ALLOWED_PERMS_LIST:
-                for _type in settings.CLIENT_APP_ALLOWED_PERMS_LIST:
-                    for _type_name, _type_perms in _type.items():
-                        _compact_permission_labels = {}
-                        if hasattr(settings, "CLIENT_APP_COMPACT_PERM_LABELS"):
-                            _compact_permission_labels = settings.CLIENT_APP_COMPACT_PERM_LABELS.get(_type_name, {})
-                        _allowed_perms[_type_name] = {
-                            "perms": _type_perms,
-                            "compact": _to_compact_perms_list(
-                                _type_perms, _type_name, _type_name, _compact_permission_labels
-                            ),
-                        }
-            else:
-                from geonode.geoapps.models import GeoApp
-
-                for _m in GeoApp.objects.filter(resource_type__in=_types).iterator():
-                    if hasattr(_m, "resource_type") and _m.resource_type and _m.resource_type not in _allowed_perms:
-                        _allowed_perms[_m.resource_type] = {
-                            "perms": _m.allowed_permissions,
-                            "compact": _to_compact_perms_list(
-                                _m.allowed_permissions, _m.resource_type, _m.subtype, _m.compact_permission_labels
-                            ),
-                        }
-
-        for _type in _types:
-            resource_types.append(
-                {
-                    "name": _type,
-                    "count": get_resources_with_perms(request.user).filter(resource_type=_type).count(),
-                    "allowed_perms": _allowed_perms[_type] if _type in _allowed_perms else [],
-                }
+        resource_types = resource_types_cache.get(request.user)
+        if resource_types is None:
+            _types = _get_resource_types()
+            _counts = dict(
+                get_resources_with_perms(request.user)
+                .filter(resource_type__in=_types)
+                .order_by()
+                .values("resource_type")
+                .annotate(count=Count("pk", distinct=True))
+                .values_list("resource_type", "count")
             )
+            resource_types = [{"name": _type, "count": _counts.get(_type, 0)} for _type in _types]
+            resource_types_cache.set(request.user, resource_types)
+
+        _allowed_perms = _get_resource_types_allowed_perms([_type["name"] for _type in resource_types])
+        resource_types = [{**_type, "allowed_perms": _allowed_perms.get(_type["name"], [])} for _type in resource_types]
         return Response({"resource_types": resource_types})
 
     @action(
@@ -153,7 +153,10 @@ class I18nCache:
             self.lang_cache.clear()
 
     def force_check(self):
-        """For testing: forces a check against the DB on the next get_entry call."""
+        """
+        Forces a check against the DB on the next get_entry call, so that a thesaurus update
+        not yet noticed invalidates the cached entries right away.
+        """
         with self._lock:
             self._last_check = 0
 
@@ -0,0 +1,27 @@
+from django.db import migrations
+
+INDEX_NAME = "base_resourcebase_ll_bbox_area_idx"
+
+
+def create_ll_bbox_area_index(apps, schema_editor):
+    # Supports the spatial sort of the CSW records, see GeoNodeRepository.query
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {INDEX_NAME} ON base_resourcebase (ST_Area(ll_bbox_polygon));"
+        )
+
+
+def drop_ll_bbox_area_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {INDEX_NAME};")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0101_remove_source_type_copyremote"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_ll_bbox_area_index, drop_ll_bbox_area_index),
+    ]
@@ -1,7 +1,7 @@
 import logging
 from datetime import datetime, timedelta
 
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 
 from geonode.base.i18n import I18N_THESAURUS_IDENTIFIER
 from geonode.base.models import Thesaurus, ThesaurusKeyword, ThesaurusKeywordLabel
@@ -16,6 +16,27 @@ def connect_signals():
     post_save.connect(thesauruskl_changed, sender=ThesaurusKeywordLabel, weak=False, dispatch_uid="metadata_reset_tkl")
     logger.debug("Thesaurus signals connected")
 
+    from guardian.models import UserObjectPermission, GroupObjectPermission
+
+    from geonode.cache_utils import connect_resource_signals
+
+    connect_resource_signals(resource_types_reset, "resource_types_reset")
+    for action, signal in (("save", post_save), ("delete", post_delete)):
+        for sender in (UserObjectPermission, GroupObjectPermission):
+            signal.connect(
+                resource_types_reset,
+                sender=sender,
+                weak=False,
+                dispatch_uid=f"resource_types_reset_{sender.__name__}_{action}",
+            )
+    logger.debug("Resource types signals connected")
+
+
+def resource_types_reset(*args, **kwargs):
+    from geonode.base.utils import resource_types_cache
+
+    resource_types_cache.invalidate()
+
 
 def thesaurus_changed(sender, instance, **kwargs):
     if instance.identifier == I18N_THESAURUS_IDENTIFIER:
@@ -27,14 +27,16 @@ from dateutil.parser import isoparse
 from datetime import datetime, timedelta
 
 # Django functionality
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
 
 # Geonode functionality
 from geonode.layers.models import Dataset
 from geonode.base.models import ResourceBase, Link, Configuration
-from geonode.security.utils import AdvancedSecurityWorkflowManager
+from geonode.security.utils import AdvancedSecurityWorkflowManager, get_user_visibility_fingerprint
 from geonode.thumbs.utils import get_thumbs, remove_thumb
 from geonode.utils import get_legend_url
+from geonode.cache_utils import GenerationCache
 from geonode.security.permissions import PermSpecCompactDiff
 
 logger = logging.getLogger("geonode.base.utils")
@@ -196,3 +198,30 @@ def patch_perms(current_perms_compact, perms_diff, resource):
     if not isinstance(perms_diff, PermSpecCompactDiff):
         perms_diff = PermSpecCompactDiff.from_dict(perms_diff)
     return perms_diff.apply(current_perms_compact, resource)
+
+
+class ResourceTypesCache(GenerationCache):
+    """
+    Cache of the resource types and counts returned by the resource_types API.
+
+    Entries are keyed by the visibility fingerprint of the requesting user.
+    They are invalidated whenever resources or object permissions change.
+    """
+
+    KEY_PREFIX = "resource_types"
+    TIMEOUT_SETTING = "RESOURCE_TYPES_CACHE_TIMEOUT"
+
+    def get_key(self, user):
+        return self.make_key(get_user_visibility_fingerprint(user))
+
+    def get(self, user):
+        if not self.timeout:
+            return None
+        return cache.get(self.get_key(user))
+
+    def set(self, user, resource_types):
+        if self.timeout:
+            cache.set(self.get_key(user), resource_types, self.timeout)
+
+
+resource_types_cache = ResourceTypesCache()
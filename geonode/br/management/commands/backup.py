@@ -25,10 +25,21 @@ import requests
 import re
 import logging
 
+from concurrent.futures import ThreadPoolExecutor
+
 from geonode.assets.local import LocalAssetHandler
 from geonode.assets.models import LocalAsset
 
 from .utils import utils
+from .utils.archive import ARCHIVE_FORMATS, StreamingArchive
+from .utils.snapshot import (
+    SNAPSHOT_EXTENSION,
+    STORE_FOLDER,
+    ChunkStore,
+    SnapshotWriter,
+    find_latest_snapshot,
+    load_snapshot,
+)
 
 from requests.auth import HTTPBasicAuth
 from xmltodict import parse as parse_xml
@@ -81,6 +92,33 @@ class Command(BaseCommand):
             help="Destination folder where to store the backup archive. It must be writable.",
         )
 
+        parser.add_argument(
+            "--archive-format",
+            dest="archive_format",
+            choices=list(ARCHIVE_FORMATS),
+            default="zip",
+            help="Format of the backup archive. The 'tar' and 'tgz' formats are streamed: files are archived "
+            "directly, without being copied into a temporary folder first, while GeoServer and DB dumps run "
+            "concurrently. Default: zip",
+        )
+
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            dest="incremental",
+            default=False,
+            help="Store the files into a deduplicated chunk store in the backup folder and write a snapshot "
+            "of the backup instead of an archive. Only the files changed since the previous snapshot are written.",
+        )
+
+        parser.add_argument(
+            "--jobs",
+            dest="jobs",
+            type=int,
+            default=4,
+            help="Number of concurrent pg_dump processes used to dump the GeoServer vector data. Default: 4",
+        )
+
         parser.add_argument(
             "--skip-read-only",
             action="store_true",
@@ -126,6 +164,9 @@ class Command(BaseCommand):
         force_exec = options.get("force_exec")
         backup_dir = options.get("backup_dir")
         skip_geoserver = options.get("skip_geoserver")
+        archive_format = options.get("archive_format") or "zip"
+        jobs = options.get("jobs") or 1
+        incremental = options.get("incremental")
 
         if not backup_dir or len(backup_dir) == 0:
             raise CommandError("Destination folder '--backup-dir' is mandatory")
@@ -146,10 +187,33 @@ class Command(BaseCommand):
             # Temporary folder to store backup files. It will be deleted at the end.
             os.chmod(target_folder, 0o777)
 
+            if incremental:
+                return self.execute_incremental_backup(
+                    config,
+                    backup_dir,
+                    dir_time_suffix,
+                    target_folder,
+                    jobs,
+                    skip_geoserver,
+                    ignore_errors,
+                )
+
+            if archive_format != "zip":
+                return self.execute_streaming_backup(
+                    config,
+                    backup_dir,
+                    dir_time_suffix,
+                    target_folder,
+                    archive_format,
+                    jobs,
+                    skip_geoserver,
+                    ignore_errors,
+                )
+
             if not skip_geoserver:
                 self.create_geoserver_backup(config, settings, target_folder, ignore_errors)
                 self.dump_geoserver_raster_data(config, settings, target_folder)
-                self.dump_geoserver_vector_data(config, settings, target_folder)
+                self.dump_geoserver_vector_data(config, settings, target_folder, workers=jobs)
                 self.dump_geoserver_externals(config, settings, target_folder)
             else:
                 logger.info("Skipping geoserver backup")
@@ -157,20 +221,7 @@ class Command(BaseCommand):
             # Deactivate GeoNode Signals
             with DisableDjangoSignals():
                 # Dump Fixtures
-                logger.info("*** Dumping GeoNode fixtures...")
-
-                fixtures_target = os.path.join(target_folder, "fixtures")
-                os.makedirs(fixtures_target, exist_ok=True)
-
-                for app_name, dump_name in zip(config.app_names, config.dump_names):
-                    # prevent dumping BackupRestore application
-                    if app_name == "br":
-                        continue
-
-                    logger.info(f" - Dumping '{app_name}' into '{dump_name}.json'")
-                    # Point stdout at a file for dumping data to.
-                    output_file = os.path.join(fixtures_target, f"{dump_name}.json")
-                    call_command("dumpdata", app_name, output=output_file)
+                self.dump_fixtures(config, target_folder)
 
                 # Store Media Root
 
@@ -181,9 +232,7 @@ class Command(BaseCommand):
                 logger.info("*** Dumping GeoNode assets folder...")
                 assets_folder = os.path.join(target_folder, utils.ASSETS_ROOT)
                 self.backup_folder(folder=assets_folder, root=settings.ASSETS_ROOT, config=config)
-                for instance in LocalAsset.objects.iterator():
-                    if not LocalAssetHandler._are_files_managed(instance):
-                        logger.warning(f"The file for the asset with id {instance.pk} were not backup since is not managed by GeoNode")
+                self.check_unmanaged_assets()
 
                 # Create Final ZIP Archive
                 logger.info("*** Creating final ZIP archive...")
@@ -215,6 +264,136 @@ class Command(BaseCommand):
 
                 return str(os.path.join(backup_dir, f"{dir_time_suffix}.zip"))
 
+    def execute_streaming_backup(
+        self, config, backup_dir, dir_time_suffix, target_folder, archive_format, jobs, skip_geoserver, ignore_errors
+    ):
+        """Stream the backup into a tar archive."""
+        backup_archive = os.path.join(backup_dir, f"{dir_time_suffix}.{archive_format}")
+        logger.info(f"*** Streaming backup into '{backup_archive}'...")
+
+        archive = StreamingArchive(backup_archive, archive_format)
+        try:
+            self.stream_backup_data(archive, config, target_folder, jobs, skip_geoserver, ignore_errors)
+            archive_md5 = archive.close()
+        except Exception:
+            archive.abort()
+            raise
+        finally:
+            logger.info("*** Final cleanup...")
+            shutil.rmtree(target_folder, ignore_errors=True)
+
+        # The md5 of the archive has been computed while writing it
+        with open(os.path.join(backup_dir, f"{dir_time_suffix}.md5"), "w") as md5_file:
+            md5_file.write(archive_md5)
+
+        # The manifest lists the sha256 of each archived file
+        with open(os.path.join(backup_dir, f"{dir_time_suffix}_manifest.json"), "w") as manifest_file:
+            json.dump(archive.get_manifest(), manifest_file, indent=2)
+
+        with open(os.path.join(backup_dir, f"{dir_time_suffix}.ini"), "w") as configfile:
+            config.config_parser.write(configfile)
+
+        logger.info("Backup Finished. Archive generated.")
+
+        return str(backup_archive)
+
+    def execute_incremental_backup(
+        self, config, backup_dir, dir_time_suffix, target_folder, jobs, skip_geoserver, ignore_errors
+    ):
+        """Add the backup to the chunk store of the backup folder and write its snapshot."""
+        store = ChunkStore(os.path.join(backup_dir, STORE_FOLDER))
+        previous_snapshot = find_latest_snapshot(backup_dir)
+        logger.info(f"*** Incremental backup into '{store.root}' (previous snapshot: {previous_snapshot})...")
+
+        writer = SnapshotWriter(store, previous=load_snapshot(previous_snapshot) if previous_snapshot else None)
+        try:
+            self.stream_backup_data(writer, config, target_folder, jobs, skip_geoserver, ignore_errors)
+        finally:
+            logger.info("*** Final cleanup...")
+            shutil.rmtree(target_folder, ignore_errors=True)
+
+        backup_snapshot = os.path.join(backup_dir, f"{dir_time_suffix}.{SNAPSHOT_EXTENSION}")
+        writer.save(backup_snapshot)
+
+        with open(os.path.join(backup_dir, f"{dir_time_suffix}.md5"), "w") as md5_file:
+            md5_file.write(utils.md5_file_hash(backup_snapshot))
+
+        with open(os.path.join(backup_dir, f"{dir_time_suffix}.ini"), "w") as configfile:
+            config.config_parser.write(configfile)
+
+        logger.info(
+            "Backup Finished. Snapshot generated: {files} files, {unchanged_files} unchanged, "
+            "{chunks_written} new chunks ({bytes_written} bytes written).".format(**writer.stats)
+        )
+
+        return str(backup_snapshot)
+
+    def stream_backup_data(self, archive, config, target_folder, jobs, skip_geoserver, ignore_errors):
+        """Feed the backup data to `archive`.
+
+        GeoServer catalog, vector data and external resources are dumped concurrently into
+        the temporary folder, while fixtures, media, assets and raster data are archived.
+        Folders are read directly from their location, so that only the dumps need to be
+        stored temporarily.
+        """
+        ignore = utils.ignore_time(config.gs_data_dt_filter[0], config.gs_data_dt_filter[1])
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = []
+            if not skip_geoserver:
+                futures = [
+                    executor.submit(self.create_geoserver_backup, config, settings, target_folder, ignore_errors),
+                    executor.submit(self.dump_geoserver_vector_data, config, settings, target_folder, jobs),
+                    executor.submit(self.dump_geoserver_externals, config, settings, target_folder),
+                ]
+            else:
+                logger.info("Skipping geoserver backup")
+
+            # Deactivate GeoNode Signals
+            with DisableDjangoSignals():
+                self.dump_fixtures(config, target_folder)
+
+                logger.info("*** Archiving GeoNode media folder...")
+                archive.add_tree(settings.MEDIA_ROOT, utils.MEDIA_ROOT, ignore=ignore)
+
+                logger.info("*** Archiving GeoNode assets folder...")
+                archive.add_tree(settings.ASSETS_ROOT, utils.ASSETS_ROOT, ignore=ignore)
+                self.check_unmanaged_assets()
+
+            if not skip_geoserver and config.gs_data_dir and config.gs_dump_raster_data:
+                logger.info("*** Archiving GeoServer raster data")
+                for source_root, dest_folder in self.get_geoserver_raster_data_folders(config, settings):
+                    archive.add_tree(source_root, dest_folder, ignore=ignore)
+
+            for future in futures:
+                future.result()
+
+        logger.info("*** Archiving GeoServer and GeoNode dumps...")
+        archive.add_tree(target_folder, "")
+
+    def dump_fixtures(self, config, target_folder):
+        logger.info("*** Dumping GeoNode fixtures...")
+
+        fixtures_target = os.path.join(target_folder, "fixtures")
+        os.makedirs(fixtures_target, exist_ok=True)
+
+        for app_name, dump_name in zip(config.app_names, config.dump_names):
+            # prevent dumping BackupRestore application
+            if app_name == "br":
+                continue
+
+            logger.info(f" - Dumping '{app_name}' into '{dump_name}.json'")
+            # Point stdout at a file for dumping data to.
+            output_file = os.path.join(fixtures_target, f"{dump_name}.json")
+            call_command("dumpdata", app_name, output=output_file)
+
+    def check_unmanaged_assets(self):
+        for instance in LocalAsset.objects.iterator():
+            if not LocalAssetHandler._are_files_managed(instance):
+                logger.warning(
+                    f"The file for the asset with id {instance.pk} were not backup since is not managed by GeoNode"
+                )
+
     def backup_folder(self, folder, root, config):
         if not os.path.exists(folder):
             os.makedirs(root, exist_ok=True)
@@ -320,22 +499,30 @@ class Command(BaseCommand):
             else:
                 raise ValueError(error_backup.format(url, r.status_code, r.text))
 
+    def get_geoserver_raster_data_folders(self, config, settings):
+        """Return the GeoServer raster data folders along with their path in the backup"""
+        folders = []
+        for source_root, dest_folder in (
+            (
+                os.path.join(config.gs_data_dir, "geonode"),  # Dump '$config.gs_data_dir/geonode'
+                os.path.join("gs_data_dir", "geonode"),
+            ),
+            (
+                os.path.join(config.gs_data_dir, "data", "geonode"),  # Dump '$config.gs_data_dir/data/geonode'
+                os.path.join("gs_data_dir", "data", "geonode"),
+            ),
+        ):
+            if not os.path.isabs(source_root):
+                source_root = os.path.join(settings.PROJECT_ROOT, "..", source_root)
+            folders.append((source_root, dest_folder))
+        return folders
+
     def dump_geoserver_raster_data(self, config, settings, target_folder):
         if config.gs_data_dir and config.gs_dump_raster_data:
             logger.info("*** Dump GeoServer raster data")
 
-            for source_root, dest_folder in (
-                (
-                    os.path.join(config.gs_data_dir, "geonode"),  # Dump '$config.gs_data_dir/geonode'
-                    os.path.join(target_folder, "gs_data_dir", "geonode"),
-                ),
-                (
-                    os.path.join(config.gs_data_dir, "data", "geonode"),  # Dump '$config.gs_data_dir/data/geonode'
-                    os.path.join(target_folder, "gs_data_dir", "data", "geonode"),
-                ),
-            ):
-                if not os.path.isabs(source_root):
-                    source_root = os.path.join(settings.PROJECT_ROOT, "..", source_root)
+            for source_root, dest_folder in self.get_geoserver_raster_data_folders(config, settings):
+                dest_folder = os.path.join(target_folder, dest_folder)
                 logger.info(f"Dumping raster data from '{source_root}'...")
                 if os.path.exists(source_root):
                     if not os.path.exists(dest_folder):
@@ -349,7 +536,7 @@ class Command(BaseCommand):
                 else:
                     logger.info(f"Skipped raster data directory '{source_root}' because it does not exist")
 
-    def dump_geoserver_vector_data(self, config, settings, target_folder):
+    def dump_geoserver_vector_data(self, config, settings, target_folder, workers=1):
         if config.gs_dump_vector_data:
             logger.info("*** Dump GeoServer vector data")
 
@@ -370,6 +557,7 @@ class Command(BaseCommand):
                     datastore["HOST"],
                     datastore["PASSWORD"],
                     gs_data_folder,
+                    workers=workers,
                 )
 
     def dump_geoserver_externals(self, config, settings, target_folder):
@@ -23,15 +23,19 @@ import time
 import uuid
 import shutil
 import logging
+import tarfile
 import zipfile
 import requests
 import tempfile
 import warnings
 import pathlib
+import dateutil.parser
 from typing import Union
 from datetime import datetime
 
 from .utils import utils
+from .utils.archive import verify_manifest
+from .utils.snapshot import is_snapshot, restore_snapshot
 
 from requests.auth import HTTPBasicAuth
 from urllib.parse import urlparse, urljoin
@@ -123,6 +127,14 @@ class Command(BaseCommand):
             "if no backup was yet restored on the GeoNode instance).",
         )
 
+        parser.add_argument(
+            "--point-in-time",
+            dest="point_in_time",
+            default=None,
+            help="ISO date used along with '--backup-files-dir': restore the newest backup or incremental "
+            "snapshot created at or before this date.",
+        )
+
         parser.add_argument(
             "-l",
             "--with-logs",
@@ -200,11 +212,12 @@ class Command(BaseCommand):
         with_logs = options.get("with_logs")
         notify = options.get("notify")
         soft_reset = options.get("soft_reset")
+        point_in_time = options.get("point_in_time")
 
         # choose backup_file from backup_files_dir, if --backup-files-dir was provided
         if backup_files_dir:
             logger.info("*** Looking for backup file...")
-            backup_file = self.parse_backup_files_dir(backup_files_dir)
+            backup_file = self.parse_backup_files_dir(backup_files_dir, point_in_time=point_in_time)
         else:
             backup_files_dir = os.path.dirname(backup_file)
 
@@ -259,7 +272,18 @@ class Command(BaseCommand):
             try:
                 # Extract ZIP Archive to Target Folder
                 logger.info("*** Unzipping backup file...")
-                target_folder = extract_archive(backup_file, restore_folder)
+                if is_snapshot(backup_file):
+                    target_folder = restore_snapshot(backup_file, restore_folder)
+                else:
+                    target_folder = extract_archive(backup_file, restore_folder)
+
+                # Streamed archives provide the checksums of their files
+                failures = verify_manifest(target_folder)
+                if failures:
+                    raise RuntimeError(
+                        f"Backup archive integrity failure. {len(failures)} extracted files do not match "
+                        f"the archive manifest: {', '.join(failures[:10])}"
+                    )
 
                 # Write Checks
                 media_root = settings.MEDIA_ROOT
@@ -472,26 +496,38 @@ class Command(BaseCommand):
             raise CommandError("Exclusive option (--backup-file|--backup-dir|--backup-files-dir)")
 
         if backup_file:
-            if not os.path.isfile(backup_file) or not zipfile.is_zipfile(backup_file):
-                raise CommandError("Provided '--backup-file' is not a .zip file")
+            if not os.path.isfile(backup_file) or not self.is_backup_archive(backup_file):
+                raise CommandError("Provided '--backup-file' is not a .zip file or a tar archive")
 
         if backup_files_dir and not os.path.isdir(backup_files_dir):
             raise CommandError("Provided '--backup-files-dir' is not a directory")
 
-    def parse_backup_files_dir(self, backup_files_dir: str) -> Union[str, None]:
+    def is_backup_archive(self, file_path: str) -> bool:
+        return (
+            zipfile.is_zipfile(file_path)
+            or (file_path.endswith((".tar", ".tgz")) and tarfile.is_tarfile(file_path))
+            or is_snapshot(file_path)
+        )
+
+    def parse_backup_files_dir(self, backup_files_dir: str, point_in_time: str = None) -> Union[str, None]:
         """
         Method picking the Backup Archive to be restored from the Backup Files Directory.
-        Only archives created/modified AFTER the last restored dumps are considered.
+        Only archives created/modified AFTER the last restored dumps are considered, unless
+        a point in time is requested.
 
         :param backup_files_dir: path to the directory containing backup files
+        :param point_in_time: ISO date, only archives created/modified at or before it are considered
         :return: backup file path, if a proper backup archive was found, and None otherwise
         """
         # get the latest modified backup file available in backup directory
         backup_file = None
+        max_timestamp = dateutil.parser.isoparse(point_in_time).timestamp() if point_in_time else None
 
         for file_name in os.listdir(backup_files_dir):
             file = os.path.join(backup_files_dir, file_name)
-            if zipfile.is_zipfile(file):
+            if max_timestamp is not None and os.path.getmtime(file) > max_timestamp:
+                continue
+            if os.path.isfile(file) and self.is_backup_archive(file):
                 backup_file = (
                     file
                     if backup_file is None or os.path.getmtime(file) > os.path.getmtime(backup_file)
@@ -504,6 +540,9 @@ class Command(BaseCommand):
             )
             return
 
+        if point_in_time:
+            return backup_file
+
         # get the latest restored backup file
         try:
             last_restored_backup = RestoredBackup.objects.latest("restoration_date")
@@ -0,0 +1,197 @@
+#########################################################################
+#
+# Copyright (C) 2025 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+"""Streaming backup archives
+
+Files are read once and written straight into a tar stream: the sha256 of every member
+is computed while it is being archived and collected in a manifest, and the md5 of the
+whole archive is computed while the archive is being written. This avoids copying the
+backed up folders into a temporary folder before archiving them, as well as reading the
+archive again to compute its hash.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import tarfile
+import time
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FORMATS = {
+    "zip": None,
+    "tar": "w|",
+    "tgz": "w|gz",
+}
+
+MANIFEST_NAME = "manifest.json"
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class HashingReader:
+    """File-like object updating a hash with the data read from the wrapped file"""
+
+    def __init__(self, fd, algorithm="sha256"):
+        self.fd = fd
+        self.hash = hashlib.new(algorithm)
+
+    def read(self, size=-1):
+        data = self.fd.read(size)
+        self.hash.update(data)
+        return data
+
+    def hexdigest(self):
+        return self.hash.hexdigest()
+
+
+class HashingWriter:
+    """File-like object updating a hash with the data written to the wrapped file"""
+
+    def __init__(self, fd, algorithm="md5"):
+        self.fd = fd
+        self.hash = hashlib.new(algorithm)
+
+    def write(self, data):
+        self.hash.update(data)
+        return self.fd.write(data)
+
+    def flush(self):
+        self.fd.flush()
+
+    def hexdigest(self):
+        return self.hash.hexdigest()
+
+
+def file_sha256(file_path):
+    hash_sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            hash_sha256.update(chunk)
+    return hash_sha256.hexdigest()
+
+
+def walk_tree(root, arcname, ignore=None):
+    """Yield the path of the files in `root` along with their name in the archive.
+
+    `ignore` follows the `shutil.copytree()` protocol, as the callables returned by
+    `utils.ignore_time()` do.
+    """
+    if not os.path.isdir(root):
+        logger.info(f"Skipped '{root}' because it does not exist")
+        return
+    for dirpath, dirnames, filenames in os.walk(root):
+        if ignore:
+            ignored = set(ignore(dirpath, dirnames + filenames))
+            dirnames[:] = [name for name in dirnames if name not in ignored]
+            filenames = [name for name in filenames if name not in ignored]
+        dirnames.sort()
+        relpath = os.path.relpath(dirpath, root)
+        for filename in sorted(filenames):
+            member = filename if relpath == os.curdir else os.path.join(relpath, filename)
+            yield os.path.join(dirpath, filename), os.path.join(arcname, member) if arcname else member
+
+
+class StreamingArchive:
+    """Tar archive written in a single pass, along with the manifest of its members.
+
+    Usage:
+        archive = StreamingArchive("/backups/2025-01-01_000000.tgz", "tgz")
+        archive.add_tree(settings.MEDIA_ROOT, "uploaded")
+        archive_md5 = archive.close()
+    """
+
+    def __init__(self, archive_path, archive_format="tar"):
+        if not ARCHIVE_FORMATS.get(archive_format):
+            raise ValueError(f"Unsupported streaming archive format '{archive_format}'")
+        self.archive_path = archive_path
+        self.archive_format = archive_format
+        self.entries = []
+        self._output = open(archive_path, "wb")
+        self._writer = HashingWriter(self._output)
+        self._tar = tarfile.open(fileobj=self._writer, mode=ARCHIVE_FORMATS[archive_format], bufsize=CHUNK_SIZE)
+
+    def add_file(self, path, arcname):
+        tarinfo = self._tar.gettarinfo(path, arcname)
+        if not tarinfo.isreg():
+            self._tar.addfile(tarinfo)
+            return
+        with open(path, "rb") as fd:
+            reader = HashingReader(fd)
+            self._tar.addfile(tarinfo, reader)
+        self.entries.append(
+            {"path": tarinfo.name, "size": tarinfo.size, "mtime": int(tarinfo.mtime), "sha256": reader.hexdigest()}
+        )
+
+    def add_bytes(self, data, arcname):
+        tarinfo = tarfile.TarInfo(arcname)
+        tarinfo.size = len(data)
+        tarinfo.mtime = int(time.time())
+        self._tar.addfile(tarinfo, io.BytesIO(data))
+
+    def add_tree(self, root, arcname, ignore=None):
+        """Add the files of a folder to the archive. Empty folders are not archived."""
+        for path, member in walk_tree(root, arcname, ignore=ignore):
+            try:
+                self.add_file(path, member)
+            except FileNotFoundError:
+                logger.warning(f"File '{path}' disappeared while archiving it")
+        logger.info(f"Archived files from '{root}'")
+
+    def get_manifest(self):
+        return {
+            "format": self.archive_format,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "files": self.entries,
+        }
+
+    def abort(self):
+        """Discard an incomplete archive"""
+        self._output.close()
+        if os.path.exists(self.archive_path):
+            os.remove(self.archive_path)
+
+    def close(self):
+        """Write the manifest as the last member of the archive and return the md5 of the archive"""
+        manifest = json.dumps(self.get_manifest(), indent=2).encode("utf-8")
+        self.add_bytes(manifest, MANIFEST_NAME)
+        self._tar.close()
+        self._output.close()
+        return self._writer.hexdigest()
+
+
+def verify_manifest(folder):
+    """Check the files extracted into `folder` against the manifest of the archive.
+
+    :return: the list of the paths that are missing or whose content differs from the
+        archived one, or None if the archive did not provide a manifest
+    """
+    manifest_path = os.path.join(folder, MANIFEST_NAME)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as fd:
+        manifest = json.load(fd)
+    failures = []
+    for entry in manifest.get("files", []):
+        path = os.path.join(folder, entry["path"])
+        if not os.path.isfile(path) or os.path.getsize(path) != entry["size"] or file_sha256(path) != entry["sha256"]:
+            failures.append(entry["path"])
+    return failures
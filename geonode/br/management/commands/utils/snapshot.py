@@ -0,0 +1,209 @@
+#########################################################################
+#
+# Copyright (C) 2025 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+"""Incremental backups
+
+Files are split into fixed size chunks which are stored once in a content-addressed
+store, keyed by their sha256. Each backup run writes a snapshot: a JSON manifest listing
+the backed up files along with the chunks they are made of. Chunks already present in the
+store are never written again, and files whose size and modification time did not change
+since the previous snapshot are not even read, so that a run only writes the changed bytes.
+
+Any snapshot can be rebuilt from the store, which gives point-in-time restores.
+
+Layout of the backup folder:
+    <backup_dir>/store/objects/<2 first chars of the hash>/<sha256>
+    <backup_dir>/<time suffix>.snapshot
+    <backup_dir>/<time suffix>.md5
+    <backup_dir>/<time suffix>.ini
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+from .archive import walk_tree
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_EXTENSION = "snapshot"
+SNAPSHOT_TYPE = "geonode-incremental-backup"
+STORE_FOLDER = "store"
+CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class ChunkStore:
+    """Content-addressed store of the chunks of the backed up files"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def get_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest)
+
+    def exists(self, digest):
+        return os.path.exists(self.get_path(digest))
+
+    def put(self, data):
+        """Store a chunk, unless already stored, and return its digest along with the number of written bytes"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.get_path(digest)
+        if os.path.exists(path):
+            return digest, 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to a temporary file first, so that an interrupted backup cannot leave a truncated chunk
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return digest, len(data)
+
+    def get(self, digest):
+        with open(self.get_path(digest), "rb") as f:
+            data = f.read()
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise RuntimeError(f"Backup store integrity failure. Chunk {digest} is corrupted")
+        return data
+
+
+class SnapshotWriter:
+    """Add files to the chunk store and collect the snapshot of a backup run.
+
+    Its `add_tree()` method has the same signature as the one of `StreamingArchive`, so
+    that both can be fed by the backup command.
+    """
+
+    def __init__(self, store, previous=None):
+        self.store = store
+        self.previous = {entry["path"]: entry for entry in (previous or {}).get("files", [])}
+        self.entries = []
+        self.stats = {"files": 0, "unchanged_files": 0, "chunks_written": 0, "bytes_written": 0}
+
+    def _is_unchanged(self, arcname, stat):
+        entry = self.previous.get(arcname)
+        return (
+            entry is not None
+            and entry["size"] == stat.st_size
+            and entry["mtime"] == int(stat.st_mtime)
+            and all(self.store.exists(digest) for digest in entry["chunks"])
+        )
+
+    def add_file(self, path, arcname):
+        stat = os.stat(path)
+        self.stats["files"] += 1
+        if self._is_unchanged(arcname, stat):
+            self.stats["unchanged_files"] += 1
+            self.entries.append(self.previous[arcname])
+            return
+        chunks = []
+        size = 0
+        with open(path, "rb") as f:
+            for data in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest, written = self.store.put(data)
+                chunks.append(digest)
+                size += len(data)
+                if written:
+                    self.stats["chunks_written"] += 1
+                    self.stats["bytes_written"] += written
+        self.entries.append({"path": arcname, "size": size, "mtime": int(stat.st_mtime), "chunks": chunks})
+
+    def add_tree(self, root, arcname, ignore=None):
+        for path, member in walk_tree(root, arcname, ignore=ignore):
+            try:
+                self.add_file(path, member)
+            except FileNotFoundError:
+                logger.warning(f"File '{path}' disappeared while backing it up")
+        logger.info(f"Backed up files from '{root}'")
+
+    def save(self, snapshot_path):
+        snapshot = {
+            "type": SNAPSHOT_TYPE,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "store": os.path.relpath(self.store.root, os.path.dirname(os.path.abspath(snapshot_path))),
+            "chunk_size": CHUNK_SIZE,
+            "files": self.entries,
+        }
+        tmp_path = f"{snapshot_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, snapshot_path)
+        return snapshot
+
+
+def is_snapshot(file_path):
+    return file_path.endswith(f".{SNAPSHOT_EXTENSION}") and load_snapshot(file_path) is not None
+
+
+def load_snapshot(file_path):
+    """Return the content of a snapshot, or None if the file is not a snapshot"""
+    try:
+        with open(file_path) as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(snapshot, dict) or snapshot.get("type") != SNAPSHOT_TYPE:
+        return None
+    return snapshot
+
+
+def find_latest_snapshot(backup_dir):
+    """Return the path of the most recent snapshot in `backup_dir`, if any"""
+    snapshots = sorted(
+        file_name for file_name in os.listdir(backup_dir) if file_name.endswith(f".{SNAPSHOT_EXTENSION}")
+    )
+    for file_name in reversed(snapshots):
+        file_path = os.path.join(backup_dir, file_name)
+        if load_snapshot(file_path) is not None:
+            return file_path
+    return None
+
+
+def restore_snapshot(snapshot_path, dst):
+    """Rebuild the files of a snapshot into a subfolder of `dst` and return its path"""
+    snapshot = load_snapshot(snapshot_path)
+    if snapshot is None:
+        raise RuntimeError(f"'{snapshot_path}' is not a valid backup snapshot")
+    store = ChunkStore(os.path.join(os.path.dirname(os.path.abspath(snapshot_path)), snapshot["store"]))
+    target_folder = os.path.join(dst, os.path.splitext(os.path.basename(snapshot_path))[0])
+    os.makedirs(target_folder, exist_ok=True)
+    real_target_folder = os.path.realpath(target_folder)
+
+    for entry in snapshot["files"]:
+        path = os.path.realpath(os.path.join(target_folder, entry["path"]))
+        if os.path.commonpath([real_target_folder, path]) != real_target_folder:
+            raise RuntimeError(f"Invalid path in backup snapshot: '{entry['path']}'")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            for digest in entry["chunks"]:
+                if not store.exists(digest):
+                    raise RuntimeError(
+                        f"Backup store integrity failure. Chunk {digest} of '{entry['path']}' is missing"
+                    )
+                f.write(store.get(digest))
+        os.utime(path, (entry["mtime"], entry["mtime"]))
+
+    return target_folder
@@ -30,6 +30,8 @@ import dateutil.parser
 import logging
 import subprocess
 
+from concurrent.futures import ThreadPoolExecutor
+
 from configparser import ConfigParser
 
 from django.conf import settings
@@ -227,8 +229,11 @@ def truncate_tables(db_name, db_user, db_port, db_host, db_passwd):
         conn.close()
 
 
-def dump_db(config, db_name, db_user, db_port, db_host, db_passwd, target_folder):
-    """Dump Full DB into target folder"""
+def dump_db(config, db_name, db_user, db_port, db_host, db_passwd, target_folder, workers=1):
+    """Dump Full DB into target folder
+
+    Tables are dumped by `workers` concurrent pg_dump processes.
+    """
     db_host = db_host if db_host is not None else "localhost"
     db_port = db_port if db_port is not None else 5432
 
@@ -255,7 +260,8 @@ def dump_db(config, db_name, db_user, db_port, db_host, db_passwd, target_folder
 
     logger.debug(f"Cleaning up destination folder {target_folder}...")
     empty_folder(target_folder)
-    for table in sorted(pg_tables):
+
+    def dump_table(table):
         logger.info(f" - Dumping data table: {db_name}:{table}")
         command = (
             f"{config.pg_dump_cmd} "
@@ -268,6 +274,9 @@ def dump_db(config, db_name, db_user, db_port, db_host, db_passwd, target_folder
         if ret != 0:
             logger.error(f"DUMP FAILED FOR TABLE {table}")
 
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        list(executor.map(dump_table, sorted(pg_tables)))
+
 
 def restore_db(config, db_name, db_user, db_port, db_host, db_passwd, source_folder, preserve_tables):
     """Restore Full DB into target folder"""
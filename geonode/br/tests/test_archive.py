@@ -0,0 +1,82 @@
+#########################################################################
+#
+# Copyright (C) 2025 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+import os
+import json
+import hashlib
+import tempfile
+
+from django.test import SimpleTestCase
+
+from geonode.utils import extract_archive
+from geonode.br.management.commands.utils.utils import md5_file_hash
+from geonode.br.management.commands.utils.archive import MANIFEST_NAME, StreamingArchive, verify_manifest
+from geonode.br.management.commands.restore import Command as RestoreCommand
+
+
+class StreamingArchiveTests(SimpleTestCase):
+    def _create_tree(self, root):
+        os.makedirs(os.path.join(root, "documents"))
+        with open(os.path.join(root, "documents", "doc.txt"), "w") as f:
+            f.write("Some Content Here")
+        with open(os.path.join(root, "thumb.png"), "wb") as f:
+            f.write(b"\x89PNG")
+
+    def test_streaming_archive_manifest_and_hash(self):
+        for archive_format in ("tar", "tgz"):
+            with tempfile.TemporaryDirectory() as tmp:
+                source = os.path.join(tmp, "media")
+                self._create_tree(source)
+                archive_path = os.path.join(tmp, f"backup.{archive_format}")
+
+                archive = StreamingArchive(archive_path, archive_format)
+                archive.add_tree(source, "uploaded")
+                archive_md5 = archive.close()
+
+                self.assertEqual(archive_md5, md5_file_hash(archive_path))
+                manifest = {entry["path"]: entry for entry in archive.get_manifest()["files"]}
+                self.assertSetEqual(set(manifest), {"uploaded/documents/doc.txt", "uploaded/thumb.png"})
+                self.assertEqual(
+                    manifest["uploaded/documents/doc.txt"]["sha256"], hashlib.sha256(b"Some Content Here").hexdigest()
+                )
+                self.assertTrue(RestoreCommand().is_backup_archive(archive_path))
+
+                target_folder = extract_archive(archive_path, os.path.join(tmp, "restore"))
+                with open(os.path.join(target_folder, MANIFEST_NAME)) as f:
+                    self.assertEqual(len(json.load(f)["files"]), 2)
+                self.assertListEqual(verify_manifest(target_folder), [])
+
+                with open(os.path.join(target_folder, "uploaded", "thumb.png"), "wb") as f:
+                    f.write(b"corrupted")
+                self.assertListEqual(verify_manifest(target_folder), ["uploaded/thumb.png"])
+
+    def test_streaming_archive_ignore(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "media")
+            self._create_tree(source)
+
+            archive = StreamingArchive(os.path.join(tmp, "backup.tar"), "tar")
+            archive.add_tree(source, "uploaded", ignore=lambda directory, contents: ["documents"])
+            archive.close()
+
+            self.assertListEqual([entry["path"] for entry in archive.entries], ["uploaded/thumb.png"])
+
+    def test_verify_manifest_without_manifest(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.assertIsNone(verify_manifest(tmp))
@@ -0,0 +1,110 @@
+#########################################################################
+#
+# Copyright (C) 2025 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+import os
+import datetime
+import tempfile
+
+from django.test import SimpleTestCase
+
+from geonode.br.management.commands.restore import Command as RestoreCommand
+from geonode.br.management.commands.utils.snapshot import (
+    ChunkStore,
+    SnapshotWriter,
+    find_latest_snapshot,
+    load_snapshot,
+    restore_snapshot,
+)
+
+
+class IncrementalBackupTests(SimpleTestCase):
+    def _write(self, path, content):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+
+    def _read(self, path):
+        with open(path, "rb") as f:
+            return f.read()
+
+    def _backup(self, backup_dir, source, name):
+        store = ChunkStore(os.path.join(backup_dir, "store"))
+        previous_snapshot = find_latest_snapshot(backup_dir)
+        writer = SnapshotWriter(store, previous=load_snapshot(previous_snapshot) if previous_snapshot else None)
+        writer.add_tree(source, "uploaded")
+        snapshot_path = os.path.join(backup_dir, f"{name}.snapshot")
+        writer.save(snapshot_path)
+        return snapshot_path, writer.stats
+
+    def test_incremental_backup_only_writes_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "media")
+            backup_dir = os.path.join(tmp, "backups")
+            os.makedirs(backup_dir)
+            self._write(os.path.join(source, "documents", "doc.txt"), b"first version")
+            self._write(os.path.join(source, "thumbs", "thumb.png"), b"\x89PNG")
+
+            first_snapshot, stats = self._backup(backup_dir, source, "2025-01-01_000000")
+            self.assertEqual(stats["files"], 2)
+            self.assertEqual(stats["chunks_written"], 2)
+
+            self._write(os.path.join(source, "documents", "doc.txt"), b"second version")
+            os.utime(os.path.join(source, "documents", "doc.txt"), (0, 0))
+            second_snapshot, stats = self._backup(backup_dir, source, "2025-01-02_000000")
+            self.assertEqual(stats["unchanged_files"], 1)
+            self.assertEqual(stats["chunks_written"], 1)
+            self.assertEqual(stats["bytes_written"], len(b"second version"))
+            self.assertEqual(find_latest_snapshot(backup_dir), second_snapshot)
+
+            # every snapshot can be rebuilt from the store
+            first_folder = restore_snapshot(first_snapshot, os.path.join(tmp, "restore"))
+            second_folder = restore_snapshot(second_snapshot, os.path.join(tmp, "restore"))
+            self.assertEqual(
+                self._read(os.path.join(first_folder, "uploaded", "documents", "doc.txt")), b"first version"
+            )
+            self.assertEqual(
+                self._read(os.path.join(second_folder, "uploaded", "documents", "doc.txt")), b"second version"
+            )
+            self.assertEqual(self._read(os.path.join(second_folder, "uploaded", "thumbs", "thumb.png")), b"\x89PNG")
+
+    def test_restore_snapshot_detects_corrupted_chunks(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "media")
+            self._write(os.path.join(source, "doc.txt"), b"content")
+            snapshot_path, _ = self._backup(tmp, source, "2025-01-01_000000")
+
+            digest = load_snapshot(snapshot_path)["files"][0]["chunks"][0]
+            self._write(ChunkStore(os.path.join(tmp, "store")).get_path(digest), b"corrupted")
+
+            with self.assertRaises(RuntimeError):
+                restore_snapshot(snapshot_path, os.path.join(tmp, "restore"))
+
+    def test_parse_backup_files_dir_point_in_time(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "media")
+            self._write(os.path.join(source, "doc.txt"), b"content")
+            first_snapshot, _ = self._backup(tmp, source, "2025-01-01_000000")
+            second_snapshot, _ = self._backup(tmp, source, "2025-01-02_000000")
+            first_date = datetime.datetime(2025, 1, 1, 12)
+            os.utime(first_snapshot, (first_date.timestamp(), first_date.timestamp()))
+
+            self.assertTrue(RestoreCommand().is_backup_archive(second_snapshot))
+            self.assertEqual(
+                RestoreCommand().parse_backup_files_dir(tmp, point_in_time="2025-01-01T18:00:00"), first_snapshot
+            )
@@ -0,0 +1,77 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import signals
+
+
+class GenerationCache:
+    """
+    Base class of the caches stored in the default cache whose entries are all invalidated at once.
+
+    The keys embed a generation counter, which is bumped on invalidation: the entries built on a previous
+    generation are never read again and expire on their own.
+    Subclasses define the KEY_PREFIX of their keys and the TIMEOUT_SETTING enabling them.
+    """
+
+    KEY_PREFIX = None
+    TIMEOUT_SETTING = None
+
+    @property
+    def generation_key(self):
+        return f"{self.KEY_PREFIX}:generation"
+
+    @property
+    def timeout(self):
+        return getattr(settings, self.TIMEOUT_SETTING, 0)
+
+    def make_key(self, *parts):
+        return ":".join([self.KEY_PREFIX, str(self.get_generation()), *(str(part) for part in parts)])
+
+    def get_generation(self):
+        generation = cache.get(self.generation_key)
+        if generation is None:
+            # seeded with the current time, so that an evicted generation never goes back to an already used value
+            cache.add(self.generation_key, time.time_ns(), None)
+            generation = cache.get(self.generation_key)
+        return generation
+
+    def invalidate(self):
+        """Bump the generation, returning the new one"""
+        try:
+            return cache.incr(self.generation_key)
+        except ValueError:
+            cache.add(self.generation_key, time.time_ns(), None)
+            return cache.get(self.generation_key)
+
+
+def connect_resource_signals(receiver, dispatch_uid):
+    """
+    Connect a receiver to the post_save and post_delete signals of ResourceBase and of its subclasses,
+    which send the signals with the concrete resource class as sender.
+    """
+    from geonode.base.models import ResourceBase
+
+    for model in apps.get_models():
+        if issubclass(model, ResourceBase):
+            for action, signal in (("save", signals.post_save), ("delete", signals.post_delete)):
+                signal.connect(receiver, sender=model, dispatch_uid=f"{dispatch_uid}.{model.__name__}.{action}")
@@ -17,11 +17,14 @@
 #
 #########################################################################
 
+import json
+import hashlib
 import logging
 
 from django.db import connection
-from django.db.models import Max, Min, Count
+from django.db.models import F, FloatField, Func, Max, Min, Count
 from django.conf import settings
+from django.core.cache import cache
 
 from pycsw.core.repository import Repository, query_spatial, get_geometry_area
 
@@ -41,6 +44,10 @@ GEONODE_SERVICE_TYPES = {
     "urn:x-esri:serviceType:ArcGIS:ImageServer": "ESRI:ArcGIS:ImageServer",
 }
 
+# pycsw property holding the WKT of the lat/lon bounding box of the resources,
+# which is kept in sync with the indexed ResourceBase.ll_bbox_polygon column
+CSW_GEOMETRY_PROPERTY = "csw_wkt_geometry"
+
 
 class GeoNodeRepository(Repository):
     """
@@ -162,7 +169,7 @@ class GeoNodeRepository(Repository):
         else:  # GetRecords sans constraint
             query = self._get_repo_filter(ResourceBase.objects.filter(**pycsw_filters))
 
-        total = query.count()
+        total = self._get_total(query, constrained="where" in constraint)
 
         # apply sorting, limit and offset
         if sortby is not None:
@@ -170,6 +177,12 @@ class GeoNodeRepository(Repository):
                 desc = False
                 if sortby["order"] == "DESC":
                     desc = True
+                area = self._get_geometry_area_expression(sortby["propertyname"])
+                if area is not None:
+                    query = query.annotate(csw_geometry_area=area).order_by(
+                        "-csw_geometry_area" if desc else "csw_geometry_area", "pk"
+                    )
+                    return [str(total), query[startposition : startposition + int(maxrecords)]]
                 query = query.all()
                 return [
                     str(total),
@@ -202,6 +215,62 @@ class GeoNodeRepository(Repository):
         results.delete()
         return deleted
 
+    def _get_geometry_area_expression(self, propertyname):
+        """
+        Return the DB expression computing the area of the geometry property used to sort
+        the records, or None if the records have to be sorted in Python
+        """
+        if self.dbtype == "postgresql+postgis+wkt" and propertyname == CSW_GEOMETRY_PROPERTY:
+            # Backed by the base_resourcebase_ll_bbox_area_idx expression index. Resources without
+            # ll_bbox_polygon get the whole world as CSW geometry: PostgreSQL sorts NULLs as the
+            # largest values, which matches the ordering of their CSW geometry area
+            return Func(F("ll_bbox_polygon"), function="ST_Area", output_field=FloatField())
+        if self.dbtype in {"sqlite", "sqlite3"}:
+            return Func(F(propertyname), function="get_geometry_area", output_field=FloatField())
+        return None
+
+    def _get_total(self, query, constrained=False):
+        """
+        Count the records matched by the query.
+
+        The total of GetRecords sans constraint can be cached (PYCSW["TOTAL_CACHE_TIMEOUT"])
+        and, on PostgreSQL, estimated from the query plan when larger than
+        PYCSW["TOTAL_ESTIMATE_THRESHOLD"], to avoid counting large catalogues on each request.
+        """
+        cache_timeout = int(settings.PYCSW.get("TOTAL_CACHE_TIMEOUT", 0) or 0)
+        estimate_threshold = int(settings.PYCSW.get("TOTAL_ESTIMATE_THRESHOLD", 0) or 0)
+        if constrained or not (cache_timeout or estimate_threshold):
+            return query.count()
+
+        sql, params = query.query.sql_with_params()
+        cache_key = f"pycsw:total:{hashlib.md5(f'{sql}{params}'.encode('utf-8')).hexdigest()}"
+        total = cache.get(cache_key) if cache_timeout else None
+        if total is None:
+            if estimate_threshold and connection.vendor == "postgresql":
+                estimate = self._estimate_count(sql, params)
+                if estimate is not None and estimate >= estimate_threshold:
+                    total = estimate
+            if total is None:
+                total = query.count()
+            if cache_timeout:
+                cache.set(cache_key, total, cache_timeout)
+        return total
+
+    def _estimate_count(self, sql, params):
+        """
+        Return the number of rows estimated by the PostgreSQL planner for the query
+        """
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            LOGGER.warning(f"Could not estimate the number of CSW records: {e}")
+            return None
+
     def _get_repo_filter(self, query):
         """
         Apply repository wide side filter / mask query
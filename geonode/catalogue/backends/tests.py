@@ -1,4 +1,7 @@
 import ast
+from unittest.mock import MagicMock
+from django.contrib.gis.geos import Polygon
+from django.core.cache import cache
 from django.test.utils import override_settings
 from owslib.etree import etree
 from geonode.base.populate_test_data import create_single_doc, create_single_dataset, create_single_map
@@ -7,11 +10,15 @@ from django.test.client import RequestFactory
 from geonode.catalogue.views import csw_global_dispatch
 from django.test import TestCase
 from django.conf import settings
+from geonode.base.models import ResourceBase
+from geonode.catalogue.backends.pycsw_plugin import GeoNodeRepository
 
 pycsw_settings = settings.PYCSW.copy()
 pycsw_settings_all = settings.PYCSW.copy()
 pycsw_settings["FILTER"] = {"resource_type__in": ["dataset", "map"]}
 pycsw_settings_all["FILTER"] = {"resource_type__in": ["dataset", "map", "document"]}
+pycsw_settings_cached_total = settings.PYCSW.copy()
+pycsw_settings_cached_total["TOTAL_CACHE_TIMEOUT"] = 60
 
 
 class TestGeoNodeRepository(TestCase):
@@ -46,6 +53,38 @@ class TestGeoNodeRepository(TestCase):
         returned_results = ast.literal_eval(child[0].get("numberOfRecordsMatched", "0")) if child else 0
         self.assertEqual(3, returned_results)
 
+    def test_spatial_sort_is_performed_by_the_database(self):
+        small = create_single_dataset("small_dataset")
+        ResourceBase.objects.filter(id=self.layer.id).update(ll_bbox_polygon=Polygon.from_bbox((0, 0, 10, 10)))
+        ResourceBase.objects.filter(id=small.id).update(ll_bbox_polygon=Polygon.from_bbox((0, 0, 1, 1)))
+        repository = self.__repository()
+        sortby = {"propertyname": "csw_wkt_geometry", "spatial": True, "order": "ASC"}
+
+        total, results = repository.query({}, sortby=sortby, maxrecords=10)
+        self.assertEqual("2", total)
+        self.assertListEqual([small.id, self.layer.id], [r.id for r in results])
+
+        sortby["order"] = "DESC"
+        total, results = repository.query({}, sortby=sortby, maxrecords=1)
+        self.assertListEqual([self.layer.id], [r.id for r in results])
+
+    @override_settings(PYCSW=pycsw_settings_cached_total)
+    def test_total_sans_constraint_is_cached(self):
+        cache.clear()
+        repository = self.__repository()
+        self.assertEqual("1", repository.query({})[0])
+        create_single_dataset("another_dataset")
+        self.assertEqual("1", repository.query({})[0])
+        cache.clear()
+        self.assertEqual("2", repository.query({})[0])
+
+    @staticmethod
+    def __repository():
+        context = MagicMock()
+        context.model = {"typenames": {}, "operations": {}}
+        context.md_core_model = {"mappings": {}}
+        return GeoNodeRepository(context)
+
     @staticmethod
     def __request_factory():
         factory = RequestFactory()
@@ -19,19 +19,40 @@
 #########################################################################
 
 import logging
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.models import Q
 
 from geonode.base.management import command_utils
 from geonode.base.models import ResourceBase
-from geonode.catalogue.models import catalogue_post_save
+from geonode.catalogue.models import bulk_regenerate_csw_metadata, catalogue_post_save
 from geonode.layers.models import Dataset
 
 
 logger = logging.getLogger(__name__)
 
 
+def get_uuid_handler_class():
+    if hasattr(settings, "LAYER_UUID_HANDLER") and settings.LAYER_UUID_HANDLER:
+        from geonode.layers.utils import get_uuid_handler
+
+        return get_uuid_handler()
+    return None
+
+
+def regenerate_batch(resource_ids):
+    """Regenerates the metadata of a batch of datasets, in the current or in a worker process"""
+    try:
+        return bulk_regenerate_csw_metadata(resource_ids, uuid_handler_class=get_uuid_handler_class())
+    finally:
+        connections.close_all()
+
+
 class Command(BaseCommand):
     help = "Re-create XML metadata documents"
 
@@ -57,6 +78,19 @@ class Command(BaseCommand):
             dest="setup_logger",
             help='Skips setup of the "geonode.br" logger, "br" handler and "br" format if not present in settings',
         )
+        parser.add_argument(
+            '-w',
+            '--workers',
+            dest="workers",
+            type=int,
+            default=0,
+            help="Regenerate the metadata in bulk, partitioning the datasets across this number of processes")
+        parser.add_argument(
+            '--batch-size',
+            dest="batch_size",
+            type=int,
+            default=100,
+            help="Number of datasets processed per batch in bulk mode (default: 100)")
         parser.add_argument(
             '-d',
             '--dry-run',
@@ -80,10 +114,13 @@ class Command(BaseCommand):
         logger.debug(f"LAYERS is {requested_layers}")
         logger.debug(f"IDS is {requested_ids}")
 
-        uuid_handler_class = None
-        if hasattr(settings, "LAYER_UUID_HANDLER") and settings.LAYER_UUID_HANDLER:
-            from geonode.layers.utils import get_uuid_handler
-            uuid_handler_class = get_uuid_handler()
+        if options.get("workers"):
+            self.handle_bulk(
+                requested_layers, requested_ids, options.get("workers"), options.get("batch_size"), dry_run
+            )
+            return
+
+        uuid_handler_class = get_uuid_handler_class()
 
         try:
             resources = Dataset.objects.all().order_by("id")
@@ -144,3 +181,55 @@ class Command(BaseCommand):
         logger.info(f"- Metadata regenerated : {cnt_ok}")
         logger.info(f"- Metadata in error    : {cnt_bad}")
         logger.info(f"- Resources skipped    : {cnt_skip}")
+
+    def handle_bulk(self, requested_layers, requested_ids, workers, batch_size, dry_run):
+        resources = Dataset.objects.exclude(metadata_uploaded=True, metadata_uploaded_preserve=True)
+        if requested_layers or requested_ids:
+            resources = resources.filter(Q(id__in=requested_ids or []) | Q(typename__in=requested_layers or []))
+        resource_ids = list(resources.order_by("id").values_list("id", flat=True))
+        tot = len(resource_ids)
+        batches = [resource_ids[i : i + batch_size] for i in range(0, tot, batch_size)]
+        logger.info(f"Regenerating the metadata of {tot} datasets in {len(batches)} batches with {workers} workers")
+        if dry_run:
+            logger.info("Work completed [DRYRUN]")
+            return
+
+        start = time.monotonic()
+        cnt_ok = 0
+        failed = []
+
+        def log_progress(i):
+            done = cnt_ok + len(failed)
+            elapsed = time.monotonic() - start
+            rate = done / elapsed if elapsed else 0
+            eta = (tot - done) / rate if rate else 0
+            logger.info(f"- Batch {i}/{len(batches)}: {done}/{tot} datasets ({rate:.1f} res/s, ETA {eta:.0f}s)")
+
+        if workers == 1:
+            for i, batch in enumerate(batches, start=1):
+                ok, batch_failed = bulk_regenerate_csw_metadata(batch, uuid_handler_class=get_uuid_handler_class())
+                cnt_ok += ok
+                failed.extend(batch_failed)
+                log_progress(i)
+        else:
+            # the forked workers must not share the DB connections of this process
+            connections.close_all()
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+                futures = {executor.submit(regenerate_batch, batch): batch for batch in batches}
+                for i, future in enumerate(as_completed(futures), start=1):
+                    try:
+                        ok, batch_failed = future.result()
+                    except Exception as e:
+                        logger.exception(f"Error processing a batch of datasets: {e}")
+                        ok, batch_failed = 0, futures[future]
+                    cnt_ok += ok
+                    failed.extend(batch_failed)
+                    log_progress(i)
+
+        elapsed = time.monotonic() - start
+        logger.info("Work completed")
+        logger.info(f"- Metadata regenerated : {cnt_ok}")
+        logger.info(f"- Metadata in error    : {len(failed)}")
+        logger.info(f"- Elapsed              : {elapsed:.1f}s ({(cnt_ok / elapsed) if elapsed else 0:.1f} res/s)")
+        if failed:
+            logger.warning(f"Metadata couldn't be regenerated for datasets {sorted(failed)}")
@@ -16,10 +16,15 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 #########################################################################
+import uuid
 import errno
 import logging
 
 from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
 from django.db.models import signals
 from lxml import etree
 from owslib.etree import etree as dlxml
@@ -66,6 +71,43 @@ def catalogue_post_save(instance, sender, **kwargs):
     update_csw_metadata(instance, catalogue)
 
 
+def get_pending_update_key(resource_id):
+    return f"catalogue:pending_update:{resource_id}"
+
+
+def catalogue_post_save_debounced(instance, sender, **kwargs):
+    """Schedules the update of the catalogue record once the resource has not been saved
+    for settings.CATALOGUE_UPDATE_DEBOUNCE seconds.
+
+    Each committed save stores a new token for the resource and schedules a task carrying it:
+    only the task holding the latest token updates the record, so that the several saves
+    performed while a resource is being created or updated are coalesced.
+
+    The tokens must be shared with the workers, hence the update is performed synchronously
+    when the default cache is local to the process and the tasks are not run eagerly.
+    """
+    debounce = getattr(settings, "CATALOGUE_UPDATE_DEBOUNCE", 0)
+    if not debounce:
+        return catalogue_post_save(instance, sender, **kwargs)
+    if isinstance(caches["default"], (LocMemCache, DummyCache)) and not getattr(
+        settings, "CELERY_TASK_ALWAYS_EAGER", False
+    ):
+        LOGGER.warning("CATALOGUE_UPDATE_DEBOUNCE requires a cache shared with the workers, updating synchronously")
+        return catalogue_post_save(instance, sender, **kwargs)
+
+    from geonode.catalogue.tasks import update_catalogue_record
+
+    _id = instance.resourcebase_ptr.id if hasattr(instance, "resourcebase_ptr") else instance.id
+    token = uuid.uuid4().hex
+
+    def schedule_update():
+        # the token is stored on commit only, not to supersede a committed save with a rolled back one
+        cache.set(get_pending_update_key(_id), token, timeout=debounce * 10 + 60)
+        update_catalogue_record.apply_async(args=(_id, token), countdown=debounce)
+
+    transaction.on_commit(schedule_update)
+
+
 def _recreate_links(instance, record):
     if not hasattr(record, "links"):
         msg = f"Metadata record for {instance.title} should contain links."
@@ -87,6 +129,12 @@ def _recreate_links(instance, record):
 
 
 def update_csw_metadata(instance, catalogue=None):
+    md_doc, csw_anytext = generate_csw_metadata(instance, catalogue)
+    ResourceBase.objects.filter(pk=instance.id).update(metadata_xml=md_doc, csw_anytext=csw_anytext)
+
+
+def generate_csw_metadata(instance, catalogue=None):
+    """Returns the metadata XML document and the ANYTEXT of a resource"""
     if not catalogue:
         catalogue = get_catalogue()
 
@@ -108,11 +156,70 @@ def update_csw_metadata(instance, catalogue=None):
         LOGGER.exception(f"Error while generating ANYTEXT: {e}", exc_info=e)
         csw_anytext = ""
 
-    ResourceBase.objects.filter(pk=instance.id).update(metadata_xml=md_doc, csw_anytext=csw_anytext)
+    return md_doc, csw_anytext
+
+
+def bulk_regenerate_csw_metadata(resource_ids, catalogue=None, uuid_handler_class=None):
+    """Regenerates the catalogue records of many datasets at once.
+
+    Related objects are fetched once for the whole batch, and the generated documents and
+    metadata links are written with bulk queries.
+
+    :return: the number of regenerated records and the list of the ids of the failed ones
+    """
+    if not catalogue:
+        catalogue = get_catalogue()
+
+    datasets = (
+        Dataset.objects.filter(id__in=resource_ids)
+        .select_related("owner", "license", "category", "restriction_code_type", "spatial_representation_type", "group")
+        .prefetch_related("keywords", "tkeywords", "regions", "attribute_set", "styles")
+    )
+
+    updates = []
+    failed = []
+    for instance in datasets:
+        try:
+            if uuid_handler_class:
+                _uuid = uuid_handler_class(instance).create_uuid()
+                if _uuid != instance.uuid:
+                    LOGGER.info(f"Replacing UUID: {instance.uuid} --> {_uuid}")
+                    instance.uuid = _uuid
+                    ResourceBase.objects.filter(id=instance.id).update(uuid=_uuid)
+            catalogue.create_record(instance)
+            md_doc, csw_anytext = generate_csw_metadata(instance, catalogue)
+            updates.append(
+                ResourceBase(
+                    id=instance.id,
+                    uuid=instance.uuid,
+                    metadata_xml=md_doc,
+                    csw_anytext=csw_anytext,
+                    csw_wkt_geometry=instance.geographic_bounding_box,
+                )
+            )
+        except Exception as e:
+            LOGGER.exception(f"Error regenerating the metadata of '{instance.title}': {e}")
+            failed.append(instance.id)
+
+    with transaction.atomic():
+        ResourceBase.objects.bulk_update(updates, ["metadata_xml", "csw_anytext", "csw_wkt_geometry"])
+        # get_or_create() in _recreate_links() matches any link of the resource with the same url
+        existing_links = set(
+            Link.objects.filter(resource_id__in=[r.id for r in updates]).values_list("resource_id", "url")
+        )
+        links = [
+            Link(resource_id=r.id, url=metadata_url, name=name, extension="xml", mime=mime, link_type="metadata")
+            for r in updates
+            for mime, name, metadata_url in catalogue.catalogue.urls_for_uuid(r.uuid)
+            if (r.id, metadata_url) not in existing_links
+        ]
+        Link.objects.bulk_create(links)
+
+    return len(updates), failed
 
 
 if "geonode.catalogue" in settings.INSTALLED_APPS:
-    signals.post_save.connect(catalogue_post_save, sender=Dataset)
+    signals.post_save.connect(catalogue_post_save_debounced, sender=Dataset)
     signals.pre_delete.connect(catalogue_pre_delete, sender=Dataset)
-    signals.post_save.connect(catalogue_post_save, sender=Document)
+    signals.post_save.connect(catalogue_post_save_debounced, sender=Document)
     signals.pre_delete.connect(catalogue_pre_delete, sender=Document)
@@ -0,0 +1,55 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+"""celery tasks for geonode.catalogue."""
+from celery.utils.log import get_task_logger
+from django.core.cache import cache
+
+from geonode.base.models import ResourceBase
+from geonode.celery_app import app
+from geonode.catalogue.models import catalogue_post_save, get_pending_update_key
+
+logger = get_task_logger(__name__)
+
+
+@app.task(
+    bind=True,
+    name="geonode.catalogue.tasks.update_catalogue_record",
+    queue="update",
+    time_limit=600,
+    acks_late=False,
+    ignore_result=True,
+)
+def update_catalogue_record(self, resource_id, token):
+    """
+    Updates the catalogue record of a resource, unless the resource has been saved again
+    after this update was scheduled: in this case the update scheduled by the latest save
+    takes care of it.
+    """
+    key = get_pending_update_key(resource_id)
+    if cache.get(key) != token:
+        logger.debug(f"Catalogue update of resource {resource_id} superseded by a more recent save")
+        return
+    cache.delete(key)
+    try:
+        instance = ResourceBase.objects.get(id=resource_id).get_real_instance()
+    except ResourceBase.DoesNotExist:
+        logger.debug(f"Resource {resource_id} does not exist anymore, skipping its catalogue update")
+        return
+    catalogue_post_save(instance=instance, sender=instance.__class__)
@@ -18,7 +18,9 @@
 #########################################################################
 import logging
 import xml.etree.ElementTree as ET
+from unittest.mock import patch
 
+from django.db import IntegrityError, transaction
 from django.db.models import Q
 from django.template.loader import get_template
 from django.test import RequestFactory, override_settings
@@ -30,9 +32,10 @@ from geonode.catalogue.templatetags import multilang as tags
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 
-from geonode.base.models import Thesaurus, ThesaurusKeyword, ThesaurusKeywordLabel
+from geonode.base.models import Link, ResourceBase, Thesaurus, ThesaurusKeyword, ThesaurusKeywordLabel
 from geonode.tests.base import GeoNodeBaseTestSupport
-from geonode.catalogue.models import catalogue_post_save
+from geonode.catalogue.models import bulk_regenerate_csw_metadata, catalogue_post_save
+from geonode.catalogue.tasks import update_catalogue_record
 
 from geonode.catalogue.views import csw_global_dispatch, resolve_uuid
 from geonode.layers.populate_datasets_data import create_dataset_data
@@ -84,6 +87,59 @@ class CatalogueTest(GeoNodeBaseTestSupport):
         if len(record.identification[0].otherconstraints) > 0:
             self.assertEqual(record.identification[0].otherconstraints[0], dataset.raw_constraints_other)
 
+    @override_settings(CATALOGUE_UPDATE_DEBOUNCE=30)
+    @patch("geonode.catalogue.tasks.update_catalogue_record.apply_async")
+    def test_catalogue_updates_are_debounced(self, apply_async):
+        dataset = Dataset.objects.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            dataset.save()
+            dataset.save()
+        self.assertEqual(2, apply_async.call_count)
+        self.assertEqual(30, apply_async.call_args.kwargs["countdown"])
+        tokens = [call.kwargs["args"][1] for call in apply_async.call_args_list]
+
+        with patch("geonode.catalogue.tasks.catalogue_post_save") as post_save:
+            # the update scheduled by the first save has been superseded by the second one
+            update_catalogue_record(dataset.id, tokens[0])
+            post_save.assert_not_called()
+            update_catalogue_record(dataset.id, tokens[1])
+            post_save.assert_called_once()
+            # the pending update has been consumed
+            update_catalogue_record(dataset.id, tokens[1])
+            post_save.assert_called_once()
+
+    @override_settings(CATALOGUE_UPDATE_DEBOUNCE=30)
+    @patch("geonode.catalogue.tasks.update_catalogue_record.apply_async")
+    def test_rolled_back_save_does_not_supersede_committed_one(self, apply_async):
+        dataset = Dataset.objects.first()
+        with self.captureOnCommitCallbacks(execute=True):
+            dataset.save()
+            try:
+                with transaction.atomic():
+                    dataset.save()
+                    raise IntegrityError()
+            except IntegrityError:
+                pass
+        apply_async.assert_called_once()
+
+        with patch("geonode.catalogue.tasks.catalogue_post_save") as post_save:
+            update_catalogue_record(dataset.id, apply_async.call_args.kwargs["args"][1])
+            post_save.assert_called_once()
+
+    def test_bulk_regenerate_csw_metadata(self):
+        dataset_ids = list(Dataset.objects.order_by("id").values_list("id", flat=True)[:3])
+        ResourceBase.objects.filter(id__in=dataset_ids).update(metadata_xml="", csw_anytext="")
+        Link.objects.filter(resource_id__in=dataset_ids, link_type="metadata").delete()
+
+        cnt_ok, failed = bulk_regenerate_csw_metadata(dataset_ids)
+
+        self.assertEqual(len(dataset_ids), cnt_ok)
+        self.assertListEqual([], failed)
+        for resource in ResourceBase.objects.filter(id__in=dataset_ids):
+            self.assertIn(resource.uuid, resource.metadata_xml)
+            self.assertTrue(resource.csw_anytext)
+            self.assertTrue(Link.objects.filter(resource_id=resource.id, link_type="metadata").exists())
+
     def test_given_a_simple_request_should_return_200(self):
         actual = csw_global_dispatch(self.request)
         self.assertEqual(200, actual.status_code)
@@ -19,6 +19,7 @@
 import logging
 
 from django.apps import AppConfig
+from django.db.models import signals
 
 
 logger = logging.getLogger(__name__)
@@ -30,3 +31,42 @@ class GeoNodeFacetsConfig(AppConfig):
 
     def ready(self):
         super(GeoNodeFacetsConfig, self).ready()
+
+        # Invalidate the cached facet topics when resources, keywords, categories or object permissions change
+        from guardian.models import UserObjectPermission, GroupObjectPermission
+        from geonode.cache_utils import connect_resource_signals
+        from geonode.base.models import (
+            HierarchicalKeyword,
+            Region,
+            ResourceBase,
+            TaggedContentItem,
+            ThesaurusKeyword,
+            TopicCategory,
+        )
+        from geonode.facets.models import invalidate_facet_topics_cache
+
+        connect_resource_signals(invalidate_facet_topics_cache, "geonode.facets.invalidate_facet_topics_cache")
+        for action, signal in (("save", signals.post_save), ("delete", signals.post_delete)):
+            for sender in (
+                HierarchicalKeyword,
+                ThesaurusKeyword,
+                TopicCategory,
+                Region,
+                UserObjectPermission,
+                GroupObjectPermission,
+            ):
+                signal.connect(
+                    invalidate_facet_topics_cache,
+                    sender=sender,
+                    dispatch_uid=f"geonode.facets.invalidate_facet_topics_cache.{sender.__name__}.{action}",
+                )
+        for through in (
+            TaggedContentItem,
+            ResourceBase.tkeywords.through,
+            ResourceBase.regions.through,
+        ):
+            signals.m2m_changed.connect(
+                invalidate_facet_topics_cache,
+                sender=through,
+                dispatch_uid=f"geonode.facets.invalidate_facet_topics_cache.{through.__name__}",
+            )
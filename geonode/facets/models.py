@@ -17,9 +17,14 @@
 #
 #########################################################################
 
+import json
+import hashlib
 import logging
 
 from django.conf import settings
+from django.core.cache import cache
+
+from geonode.cache_utils import GenerationCache
 
 DEFAULT_FACET_PAGE_SIZE = 10
 
@@ -160,3 +165,47 @@ class FacetsRegistry:
 
 
 facet_registry = FacetsRegistry()
+
+
+class FacetTopicsCache(GenerationCache):
+    """
+    Cache of the facet topics (items and counts) computed for a facet request.
+
+    Entries are keyed by the visibility fingerprint of the requesting user (identity, groups and admin flags),
+    by the provider and by the applied filters, language and pagination.
+    They are invalidated whenever resources, keywords, categories, regions or object permissions change.
+    """
+
+    KEY_PREFIX = "facets"
+    TIMEOUT_SETTING = "FACETS_CACHE_TIMEOUT"
+
+    def get_visibility_fingerprint(self, user):
+        from geonode.security.utils import get_user_visibility_fingerprint
+
+        return get_user_visibility_fingerprint(user)
+
+    def get_key(self, user, provider_name, filters, **params):
+        payload = json.dumps(
+            {
+                "visibility": self.get_visibility_fingerprint(user),
+                "provider": provider_name,
+                "filters": sorted((key, sorted(values)) for key, values in filters.items()),
+                "params": {key: sorted(value) if isinstance(value, set) else value for key, value in params.items()},
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return self.make_key(hashlib.sha256(payload.encode("utf-8")).hexdigest())
+
+    def get(self, key):
+        return cache.get(key)
+
+    def set(self, key, topics):
+        cache.set(key, topics, self.timeout)
+
+
+facet_topics_cache = FacetTopicsCache()
+
+
+def invalidate_facet_topics_cache(*args, **kwargs):
+    facet_topics_cache.invalidate()
@@ -21,10 +21,13 @@ import logging
 import json
 from tastypie.test import TestApiClient
 from uuid import uuid4
+from unittest.mock import patch
+
+from guardian.shortcuts import assign_perm, remove_perm
 
 from django.contrib.auth import get_user_model
 from django.http import JsonResponse
-from django.test import RequestFactory
+from django.test import RequestFactory, override_settings
 from django.urls import reverse
 
 from geonode.base.models import (
@@ -38,7 +41,7 @@ from geonode.base.models import (
     HierarchicalKeyword,
     GroupProfile,
 )
-from geonode.facets.models import facet_registry
+from geonode.facets.models import facet_registry, facet_topics_cache
 from geonode.facets.providers.baseinfo import FeaturedFacetProvider
 from geonode.facets.providers.category import CategoryFacetProvider
 from geonode.facets.providers.group import GroupFacetProvider
@@ -431,6 +434,44 @@ class TestFacets(GeoNodeBaseTestSupport):
                 count0, obj["topics"]["items"][0]["count"], f"Bad count0 for facet '{facet}\nRESPONSE: {obj}"
             )
 
+    @override_settings(FACETS_CACHE_TIMEOUT=60)
+    def test_facet_topics_cache(self):
+        catinfo = CategoryFacetProvider().get_info()
+        req = self.rf.get(reverse("get_facet", args=[catinfo["name"]]))
+
+        with patch.object(GetFacetView, "_prefilter_topics", wraps=GetFacetView._prefilter_topics) as prefilter:
+            first = json.loads(GetFacetView.as_view()(req, catinfo["name"]).content)
+            second = json.loads(GetFacetView.as_view()(req, catinfo["name"]).content)
+            self.assertEqual(first, second)
+            self.assertEqual(1, prefilter.call_count, "Cached topics should not be prefiltered again")
+
+            # changing a category invalidates the cached topics
+            self.cats["C0"].save()
+            GetFacetView.as_view()(req, catinfo["name"])
+            self.assertEqual(2, prefilter.call_count)
+
+            # different filters are cached separately
+            req = self.rf.get(reverse("get_facet", args=[catinfo["name"]]), data={catinfo["filter"]: "C0"})
+            GetFacetView.as_view()(req, catinfo["name"])
+            self.assertEqual(3, prefilter.call_count)
+
+    def test_facet_topics_cache_invalidation(self):
+        resource = ResourceBase.objects.first()
+
+        generation = facet_topics_cache.get_generation()
+        assign_perm("base.view_resourcebase", self.user, resource)
+        self.assertNotEqual(generation, facet_topics_cache.get_generation())
+
+        # revoking a permission invalidates the cached topics as well
+        generation = facet_topics_cache.get_generation()
+        remove_perm("base.view_resourcebase", self.user, resource)
+        self.assertNotEqual(generation, facet_topics_cache.get_generation())
+
+        # saving models unrelated to the facets does not
+        generation = facet_topics_cache.get_generation()
+        Group.objects.create(name="facets_unrelated_group")
+        self.assertEqual(generation, facet_topics_cache.get_generation())
+
     def test_prefiltering_tkeywords(self):
         regname = RegionFacetProvider().name
         featname = FeaturedFacetProvider().name
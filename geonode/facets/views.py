@@ -27,7 +27,8 @@ from django.urls import reverse
 from django.conf import settings
 
 from geonode.base.api.views import ResourceBaseViewSet
-from geonode.facets.models import FacetProvider, DEFAULT_FACET_PAGE_SIZE, facet_registry
+from geonode.base.models import ResourceBase
+from geonode.facets.models import FacetProvider, DEFAULT_FACET_PAGE_SIZE, facet_registry, facet_topics_cache
 from geonode.security.utils import get_visible_resources
 
 PARAM_PAGE = "page"
@@ -72,6 +73,27 @@ class BaseFacetingView(APIView):
 
         return {"page": page, "page_size": page_size, "start": start, "total": cnt, "items": items}
 
+    @classmethod
+    def _get_cached_topics(cls, request, provider, get_queryset, **kwargs):
+        """
+        Return the topics of a provider, using the facet topics cache when FACETS_CACHE_TIMEOUT is set.
+        The prefiltered queryset is only built, through the `get_queryset` callable, when the topics are not cached.
+        """
+        if not facet_topics_cache.timeout:
+            return cls._get_topics(provider, queryset=get_queryset(), user=request.user, **kwargs)
+
+        key = facet_topics_cache.get_key(request.user, provider.name, cls._get_filters(request), **kwargs)
+        topics = facet_topics_cache.get(key)
+        if topics is None:
+            topics = cls._get_topics(provider, queryset=get_queryset(), user=request.user, **kwargs)
+            facet_topics_cache.set(key, topics)
+        return topics
+
+    @classmethod
+    def _get_filters(cls, request):
+        # will be {} if no filter applied
+        return {k: vlist for k, vlist in request.query_params.lists() if k.startswith("filter{")}
+
     @classmethod
     def _prefilter_topics(cls, request):
         """
@@ -82,13 +104,22 @@ class BaseFacetingView(APIView):
         :return: a QuerySet on ResourceBase
         """
         logger.debug("Filtering by user '%s'", request.user)
-        filters = {k: vlist for k, vlist in request.query_params.lists() if k.startswith("filter{")}
+        filters = cls._get_filters(request)
         logger.warning(f"FILTERING BY  {filters}")
         # kwargs will be {} if no filter applied
         viewset = ResourceBaseViewSet(request=request, format_kwarg={}, kwargs=filters)
         viewset.initial(request)
         return get_visible_resources(queryset=viewset.filter_queryset(viewset.get_queryset()), user=request.user)
 
+    @classmethod
+    def _ids_queryset(cls, queryset):
+        """
+        Reduce the prefiltered resources to a plain subquery on their ids, so that the providers computing their
+        facets on the returned queryset don't carry the ordering, annotations and joins of the viewset queryset.
+        Each provider still runs its own aggregate, with the subquery embedded.
+        """
+        return ResourceBase.objects.filter(id__in=queryset.values("id"))
+
     @classmethod
     def _resolve_language(cls, request) -> (str, bool):
         """
@@ -131,6 +162,12 @@ class ListFacetsView(BaseFacetingView):
         facets = []
         prefiltered = None
 
+        def get_prefiltered():
+            nonlocal prefiltered
+            if prefiltered is None:
+                prefiltered = self._ids_queryset(self._prefilter_topics(request))
+            return prefiltered
+
         for provider in facet_registry.get_providers():
             logger.debug("Fetching data from provider %r", provider)
             info = provider.get_info(lang=lang)
@@ -145,8 +182,7 @@ class ListFacetsView(BaseFacetingView):
                 info["link"] = f"{reverse('get_facet', args=[info['name']])}?{urlencode(link_args)}"
 
             if include_topics:
-                prefiltered = prefiltered or self._prefilter_topics(request)
-                info["topics"] = self._get_topics(provider, queryset=prefiltered, lang=lang, user=request.user)
+                info["topics"] = self._get_cached_topics(request, provider, get_prefiltered, lang=lang)
 
             facets.append(info)
 
@@ -178,16 +214,15 @@ class GetFacetView(BaseFacetingView):
         if include_config:
             info["config"] = provider.config
 
-        qs = self._prefilter_topics(request)
-        topics = self._get_topics(
+        topics = self._get_cached_topics(
+            request,
             provider,
-            queryset=qs,
+            lambda: self._prefilter_topics(request),
             page=page,
             page_size=page_size,
             lang=lang,
             topic_contains=topic_contains,
             keys=keys,
-            user=request.user,
         )
 
         if add_link:
@@ -0,0 +1,146 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+"""Cache of the GeoServer catalog objects
+
+The workspaces, stores, resources and layers read from the GeoServer REST API are kept
+for a timeout depending on their type, so that syncing many datasets does not fetch the
+same documents again and again. The objects are bound to the catalog connection which
+fetched them, hence the cache lives in the process memory.
+
+Missing objects are never cached, and the entries of the objects GeoNode changes or
+deletes must be invalidated explicitly through `invalidate_dataset()` and `invalidate_store()`.
+The cached objects are shared, so an object changed before being saved must be invalidated
+even when the save fails, not to serve its unsaved changes.
+
+An invalidation drops the matching entries of the current process and bumps a generation
+counter stored in the default Django cache: the other processes (web workers, Celery workers)
+drop all their entries as soon as they see the generation change. This requires a cache shared
+by all the processes (e.g. Memcached or Redis), with a per-process cache the other processes
+keep serving the invalidated objects until their timeout.
+"""
+
+import logging
+import threading
+import time
+
+from geonode.cache_utils import GenerationCache
+
+logger = logging.getLogger(__name__)
+
+WORKSPACE = "workspace"
+STORE = "store"
+RESOURCE = "resource"
+LAYER = "layer"
+
+
+def _unqualified(name):
+    return str(name).split(":")[-1] if name else name
+
+
+class CatalogCacheGeneration(GenerationCache):
+    """Generation of the catalog caches shared by all the processes"""
+
+    KEY_PREFIX = "geoserver_catalog_cache"
+
+
+class CatalogCache:
+    """Time based cache of the objects read from a GeoServer catalog.
+
+    Usage:
+        cache = CatalogCache({"layer": 30})
+        layer = cache.get(gs_catalog, "layer", "geonode:roads", lambda: gs_catalog.get_layer("geonode:roads"))
+    """
+
+    def __init__(self, timeouts=None):
+        self.timeouts = dict(timeouts or {})
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._shared_generation = CatalogCacheGeneration()
+        # the shared generation the entries of this process are up to date with
+        self._generation = None
+
+    def _check_generation(self):
+        """Drop all the entries if another process invalidated some objects since they were cached"""
+        generation = self._shared_generation.get_generation()
+        with self._lock:
+            if generation != self._generation:
+                self._entries.clear()
+                self._generation = generation
+
+    def get(self, catalog, kind, key, fetch):
+        """Return the cached object, or call `fetch` and cache its result if it is not None"""
+        timeout = self.timeouts.get(kind, 0)
+        if not timeout:
+            return fetch()
+        cache_key = (getattr(catalog, "service_url", None), kind, key)
+        self._check_generation()
+        with self._lock:
+            entry = self._entries.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        value = fetch()
+        with self._lock:
+            if value is not None:
+                self._entries[cache_key] = (time.monotonic() + timeout, value)
+            else:
+                self._entries.pop(cache_key, None)
+        return value
+
+    def _invalidate(self, matches):
+        if not any(self.timeouts.values()):
+            return
+        generation = self._shared_generation.invalidate()
+        with self._lock:
+            if self._generation is not None and generation == self._generation + 1:
+                for cache_key in [cache_key for cache_key in self._entries if matches(cache_key[1], cache_key[2])]:
+                    del self._entries[cache_key]
+            else:
+                # another process invalidated some objects which might be cached here as well
+                self._entries.clear()
+            self._generation = generation
+
+    def invalidate_dataset(self, *names):
+        """Drop the layers and the resources named as one of `names`, with or without their workspace prefix"""
+        names = {_unqualified(name) for name in names if name}
+
+        def matches(kind, key):
+            if kind == LAYER:
+                return _unqualified(key) in names
+            if kind == RESOURCE:
+                return _unqualified(key[-1]) in names
+            return False
+
+        self._invalidate(matches)
+
+    def invalidate_store(self, name, workspace=None):
+        """Drop a store, in any workspace if `workspace` is None, along with its resources"""
+
+        def matches(kind, key):
+            if kind not in (STORE, RESOURCE):
+                return False
+            key_workspace, key_store = key[0], key[1]
+            return key_store == name and (workspace is None or key_workspace in (None, workspace))
+
+        self._invalidate(matches)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._generation = None
@@ -207,6 +207,10 @@ class Batch:
         operation.update(rule.get_object())
         self.operations.append(operation)
 
+    def extend(self, batch: "Batch"):
+        """Append all the operations of another batch"""
+        self.operations.extend(batch.operations)
+
     def length(self) -> int:
         return len(self.operations)
 
@@ -37,7 +37,7 @@ import xml.etree.ElementTree as ET
 
 from django.conf import settings
 from django.utils import timezone
-from django.db import transaction
+from django.db import connections, transaction
 from django.utils.module_loading import import_string
 from django.core.exceptions import ImproperlyConfigured
 from django.template.loader import render_to_string
@@ -79,6 +79,7 @@ from geonode.utils import (
 )
 
 from .geofence import GeoFenceClient, GeoFenceUtils
+from .catalog_cache import CatalogCache, LAYER, RESOURCE, STORE, WORKSPACE
 
 logger = logging.getLogger(__name__)
 
@@ -439,6 +440,7 @@ def set_dataset_style(saved_dataset, title, sld, base_file=None):
             )
         layer.default_style = style
         gs_catalog.save(layer)
+        gs_catalog_cache.invalidate_dataset(layer.name)
         for _s in _old_styles:
             try:
                 gs_catalog.delete(_s)
@@ -491,6 +493,7 @@ def cascading_delete(dataset_name=None, catalog=None):
     finally:
         # Let's reset the connections first
         cat._cache.clear()
+        gs_catalog_cache.invalidate_dataset(dataset_name)
 
     if resource is None:
         # If there is no associated resource,
@@ -536,6 +539,7 @@ def cascading_delete(dataset_name=None, catalog=None):
         except Exception:
             pass
 
+        gs_catalog_cache.invalidate_store(store.name, workspace=store.workspace.name)
         if (
             store.resource_type == "dataStore"
             and "dbtype" in store.connection_parameters
@@ -1103,34 +1107,41 @@ def set_attributes_from_geoserver(layer, overwrite=False):
             attribute_map = []
     # Get attribute statistics & package for call to really_set_attributes()
     attribute_stats = defaultdict(dict)
+    existing_attributes = set(Attribute.objects.filter(dataset=layer).values_list("attribute", flat=True))
+    new_attributes = [
+        (field, ftype) for field, ftype in attribute_map if field is not None and field not in existing_attributes
+    ]
+    aggregable_fields = [
+        field for field, ftype in new_attributes if is_dataset_attribute_aggregable(layer.subtype, field, ftype)
+    ]
+    # Compute the statistics of all the fields at once on the datastore table, if any
+    datastore_stats = get_datastore_attribute_statistics(layer, aggregable_fields) if aggregable_fields else None
     # Add new layer attributes if they don't already exist
-    for attribute in attribute_map:
-        field, ftype = attribute
-        if field is not None:
-            if Attribute.objects.filter(dataset=layer, attribute=field).exists():
-                continue
-            elif is_dataset_attribute_aggregable(layer.subtype, field, ftype):
-                logger.debug("Generating layer attribute statistics")
-                result = get_attribute_statistics(layer.alternate or layer.typename, field)
-            else:
-                result = None
-            attribute_stats[layer.name][field] = result
+    for field, ftype in new_attributes:
+        if field not in aggregable_fields:
+            result = None
+        elif datastore_stats is not None:
+            result = datastore_stats.get(field)
+        else:
+            logger.debug("Generating layer attribute statistics")
+            result = get_attribute_statistics(layer.alternate or layer.typename, field)
+        attribute_stats[layer.name][field] = result
     logger.info(f"Found {len(attribute_map)} attributes for {layer.subtype}")
     set_attributes(layer, attribute_map, overwrite=overwrite, attribute_stats=attribute_stats)
 
 
 def get_dataset(layer, gs_catalog: Catalog):
-    gs_catalog.reset()
     gs_dataset = None
     try:
-        gs_dataset = gs_catalog.get_layer(layer.name)
+        gs_dataset = gs_catalog_cache.get(gs_catalog, LAYER, layer.name, lambda: gs_catalog.get_layer(layer.name))
     except Exception:
         tb = traceback.format_exc()
         logger.exception(tb)
 
     if not gs_dataset:
         try:
-            gs_dataset = gs_catalog.get_layer(layer.alternate or layer.typename)
+            name = layer.alternate or layer.typename
+            gs_dataset = gs_catalog_cache.get(gs_catalog, LAYER, name, lambda: gs_catalog.get_layer(name))
         except Exception:
             tb = traceback.format_exc()
             logger.error(tb)
@@ -1173,7 +1184,11 @@ def set_styles(layer, gs_catalog: Catalog):
                     logger.debug(f'set_style: Setting default style "{_gs_default_style.name}" for layer "{layer.name}')
 
                     gs_dataset.default_style = _gs_default_style
-                    gs_catalog.save(gs_dataset)
+                    try:
+                        gs_catalog.save(gs_dataset)
+                    finally:
+                        # drop the cached layer, which carries the change even if it has not been saved
+                        gs_catalog_cache.invalidate_dataset(layer.name, layer.alternate)
                     if default_style.name not in DEFAULT_STYLE_NAME:
                         logger.debug(
                             f'set_style: Retrieving no-workspace default style "{default_style.name}" for deletion'
@@ -1293,8 +1308,8 @@ def is_dataset_attribute_aggregable(store_type, field_name, field_type):
     Decipher whether layer attribute is suitable for statistical derivation
     """
 
-    # must be vector layer
-    if store_type != "dataStore":
+    # must be vector layer, "dataStore" is the store type the vector datasets had before being given a subtype
+    if store_type not in ("vector", "vector_time", "dataStore"):
         return False
     # must be a numeric data type
     if field_type not in LAYER_ATTRIBUTE_NUMERIC_DATA_TYPES:
@@ -1324,6 +1339,93 @@ def get_attribute_statistics(dataset_name, field):
         logger.exception("Error generating layer aggregate statistics")
 
 
+def get_datastore_attribute_statistics(layer, fields):
+    """
+    Generate the statistics of many attributes of a dataset stored in the GeoNode datastore,
+    scanning its table once instead of executing a WPS process per attribute.
+
+    Returns a dictionary of results in the format of get_attribute_statistics() keyed by
+    field name, or None if the dataset is not published from a GeoServer store of the
+    datastore or if the statistics are disabled along with the WPS.
+    """
+    if not ogc_server_settings.WPS_ENABLED:
+        return None
+    datastore = ogc_server_settings.DATASTORE
+    if not datastore or datastore not in settings.DATABASES or not layer.name:
+        return None
+    # the datastore is published by the importer as GEONODE_GEODATABASE and by create_geoserver_db_featurestore()
+    # as DATASTORE: a dataset of any other store might share its name with an unrelated table of the datastore
+    if layer.store not in (os.environ.get("GEONODE_GEODATABASE", "geonode_data"), datastore):
+        return None
+    try:
+        connection = connections[datastore]
+        if connection.vendor != "postgresql":
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT column_name FROM information_schema.columns "
+                "WHERE table_schema = current_schema() AND table_name = %s",
+                [layer.name],
+            )
+            columns = {row[0] for row in cursor.fetchall()}
+            if not columns or not set(fields).issubset(columns):
+                return None
+
+            qn = connection.ops.quote_name
+            aggregates = []
+            for field in fields:
+                column = qn(field)
+                aggregates.extend(
+                    [
+                        f"count({column})",
+                        f"min({column})",
+                        f"max({column})",
+                        f"avg({column})",
+                        f"percentile_cont(0.5) WITHIN GROUP (ORDER BY {column})",
+                        f"stddev_pop({column})",
+                        f"sum({column})",
+                        f"count(DISTINCT {column})",
+                    ]
+                )
+            cursor.execute(f"SELECT {', '.join(aggregates)} FROM {qn(layer.name)}")
+            row = cursor.fetchone()
+
+            def _format(value):
+                return "NA" if value is None else str(value)
+
+            results = {}
+            for index, field in enumerate(fields):
+                count, _min, _max, average, median, stddev, _sum, distinct = row[index * 8 : index * 8 + 8]
+                results[field] = {
+                    "Count": count,
+                    "Min": _format(_min),
+                    "Max": _format(_max),
+                    "Average": _format(average),
+                    "Median": _format(median),
+                    "StandardDeviation": _format(stddev),
+                    "Sum": _format(_sum),
+                    "unique_values": "NA",
+                    "distinct": distinct,
+                }
+
+            # list the unique values of the fields having just a few of them
+            max_unique_values = getattr(settings, "ATTRIBUTE_STATISTICS_MAX_UNIQUE_VALUES", 50)
+            few_values = [field for field in fields if 0 < results[field]["distinct"] <= max_unique_values]
+            if few_values:
+                values_aggregates = [
+                    f"string_agg(DISTINCT {qn(field)}::text, ',' ORDER BY {qn(field)}::text)" for field in few_values
+                ]
+                cursor.execute(f"SELECT {', '.join(values_aggregates)} FROM {qn(layer.name)}")
+                for field, values in zip(few_values, cursor.fetchone()):
+                    results[field]["unique_values"] = _format(values)
+        for result in results.values():
+            result.pop("distinct")
+        return results
+    except Exception:
+        logger.exception(f"Error generating the attribute statistics of {layer.name} from the datastore")
+        return None
+
+
 def get_wcs_record(instance, retry=True):
     wcs = WebCoverageService(f"{ogc_server_settings.LOCATION}wcs", "1.0.0")
     key = f"{instance.workspace}:{instance.name}"
@@ -1395,6 +1497,8 @@ def cleanup(name, uuid):
             cat.delete(gs_store)
         except Exception:
             logger.warning("Couldn't delete GeoServer store during cleanup()")
+    gs_catalog_cache.invalidate_dataset(name)
+    gs_catalog_cache.invalidate_store(name)
 
     logger.warning("Deleting dangling Catalogue record for [%s] " "(no Django record to match)", name)
 
@@ -1480,6 +1584,7 @@ def create_geoserver_db_featurestore(
 def _create_featurestore(name, data, overwrite=False, charset="UTF-8", workspace=None):
     cat = gs_catalog
     cat.create_featurestore(name, data, workspace=workspace, overwrite=overwrite, charset=charset)
+    gs_catalog_cache.invalidate_store(name, workspace=getattr(workspace, "name", workspace))
     store = get_store(cat, name, workspace=workspace)
     return store, cat.get_resource(name=name, store=store, workspace=workspace)
 
@@ -1487,6 +1592,7 @@ def _create_featurestore(name, data, overwrite=False, charset="UTF-8", workspace
 def _create_coveragestore(name, data, overwrite=False, charset="UTF-8", workspace=None):
     cat = gs_catalog
     cat.create_coveragestore(name, path=data, workspace=workspace, overwrite=overwrite, upload_data=True)
+    gs_catalog_cache.invalidate_store(name, workspace=getattr(workspace, "name", workspace))
     store = get_store(cat, name, workspace=workspace)
     return store, cat.get_resource(name=name, store=store, workspace=workspace)
 
@@ -1523,47 +1629,59 @@ def get_store(cat, name, workspace=None):
     # Make sure workspace is a workspace object and not a string.
     # If the workspace does not exist, continue as if no workspace had been defined.
     if isinstance(workspace, str):
-        workspace = cat.get_workspace(workspace)
+        workspace_name = workspace
+        workspace = gs_catalog_cache.get(cat, WORKSPACE, workspace_name, lambda: cat.get_workspace(workspace_name))
 
     if workspace is None:
-        workspace = cat.get_default_workspace()
+        workspace = gs_catalog_cache.get(cat, WORKSPACE, None, cat.get_default_workspace)
 
     if workspace:
+        return gs_catalog_cache.get(cat, STORE, (workspace.name, name), lambda: _get_store(cat, name, workspace))
+    else:
+        raise FailedRequestError(f"No store found named: {name}")
+
+
+def _get_store(cat, name, workspace):
+    try:
+        store = cat.get_xml(f"{workspace.datastore_url[:-4]}/{name}.xml")
+    except FailedRequestError:
         try:
-            store = cat.get_xml(f"{workspace.datastore_url[:-4]}/{name}.xml")
+            store = cat.get_xml(f"{workspace.coveragestore_url[:-4]}/{name}.xml")
         except FailedRequestError:
             try:
-                store = cat.get_xml(f"{workspace.coveragestore_url[:-4]}/{name}.xml")
+                store = cat.get_xml(f"{workspace.wmsstore_url[:-4]}/{name}.xml")
             except FailedRequestError:
-                try:
-                    store = cat.get_xml(f"{workspace.wmsstore_url[:-4]}/{name}.xml")
-                except FailedRequestError:
-                    raise FailedRequestError(f"No store found named: {name}")
-        if store:
-            if store.tag == "dataStore":
-                store = datastore_from_index(cat, workspace, store)
-            elif store.tag == "coverageStore":
-                store = coveragestore_from_index(cat, workspace, store)
-            elif store.tag == "wmsStore":
-                store = wmsstore_from_index(cat, workspace, store)
-            return store
-        else:
-            raise FailedRequestError(f"No store found named: {name}")
+                raise FailedRequestError(f"No store found named: {name}")
+    if store:
+        if store.tag == "dataStore":
+            store = datastore_from_index(cat, workspace, store)
+        elif store.tag == "coverageStore":
+            store = coveragestore_from_index(cat, workspace, store)
+        elif store.tag == "wmsStore":
+            store = wmsstore_from_index(cat, workspace, store)
+        return store
     else:
         raise FailedRequestError(f"No store found named: {name}")
 
 
+def _get_resource(name, store=None, workspace=None):
+    return gs_catalog_cache.get(
+        gs_catalog,
+        RESOURCE,
+        (workspace, store, name),
+        lambda: gs_catalog.get_resource(name=name, store=store, workspace=workspace),
+    )
+
+
 def fetch_gs_resource(instance, values, tries):
     try:
-        gs_resource = gs_catalog.get_resource(name=instance.name, store=instance.store, workspace=instance.workspace)
+        gs_resource = _get_resource(instance.name, store=instance.store, workspace=instance.workspace)
     except Exception:
         try:
-            gs_resource = gs_catalog.get_resource(
-                name=instance.alternate, store=instance.store, workspace=instance.workspace
-            )
+            gs_resource = _get_resource(instance.alternate, store=instance.store, workspace=instance.workspace)
         except Exception:
             try:
-                gs_resource = gs_catalog.get_resource(name=instance.alternate or instance.typename)
+                gs_resource = _get_resource(instance.alternate or instance.typename)
             except Exception:
                 gs_resource = None
     if gs_resource:
@@ -1829,6 +1947,7 @@ def set_time_info(layer, attribute, end_attribute, presentation, precision_value
 
     if resource:
         gs_catalog.save(resource)
+        gs_catalog_cache.invalidate_dataset(resource.name)
 
 
 def get_time_info(layer):
@@ -1874,6 +1993,17 @@ gs_catalog = Catalog(
 )
 gs_uploader = Client(url, _user, _password)
 
+# workspaces are hardly ever changed, hence they are cached longer
+_catalog_cache_timeout = getattr(ogc_server_settings, "CATALOG_CACHE_TIMEOUT", 0) or 0
+gs_catalog_cache = CatalogCache(
+    {
+        WORKSPACE: _catalog_cache_timeout * 10,
+        STORE: _catalog_cache_timeout,
+        RESOURCE: _catalog_cache_timeout,
+        LAYER: _catalog_cache_timeout,
+    }
+)
+
 
 def _create_geofence_client():
     gf_rest_url = f'{url.rstrip("/")}/geofence/'
@@ -1968,9 +2098,8 @@ def sync_instance_with_geoserver(instance_id, *args, **kwargs):
         _is_remote_instance = is_remote_resource(instance)
 
         if not _is_remote_instance:
-            # Let's reset the connections first
-            gs_catalog._cache.clear()
-            gs_catalog.reset()
+            # The dataset may have just been changed in GeoServer, let's drop its cached objects
+            gs_catalog_cache.invalidate_dataset(instance.name, instance.alternate)
 
             gs_resource = None
             values = {"title": instance.title, "abstract": instance.raw_abstract}
@@ -2034,6 +2163,9 @@ def sync_instance_with_geoserver(instance_id, *args, **kwargs):
                         msg = f'Error while trying to save resource named {gs_resource} in GeoServer, try to use: "{e}"'
                         e.args = (msg,)
                         logger.warning(e)
+                    finally:
+                        # drop the cached resource, which carries the changes even if they have not been saved
+                        gs_catalog_cache.invalidate_dataset(instance.name, instance.alternate)
 
                 if updatebbox:
                     # store the resource to avoid another geoserver call in the post_save
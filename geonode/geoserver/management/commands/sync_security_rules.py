@@ -18,7 +18,7 @@
 #########################################################################
 
 from django.core.management.base import BaseCommand
-from geonode.geoserver.security import sync_resources_with_guardian
+from geonode.geoserver.security import sync_resources_with_guardian, bulk_sync_resources_with_guardian
 
 
 class Command(BaseCommand):
@@ -26,5 +26,41 @@ class Command(BaseCommand):
     Sync resources with Guardian and clear their dirty state
     """
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            dest="bulk",
+            default=False,
+            help="Diff the rules of all the datasets against GeoFence and only apply the changes, in large batches",
+        )
+        parser.add_argument(
+            "--workers",
+            dest="workers",
+            type=int,
+            default=4,
+            help="Number of parallel workers running the GeoFence batches (bulk mode only)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            dest="batch_size",
+            type=int,
+            default=1000,
+            help="Approximate number of operations for each GeoFence batch (bulk mode only)",
+        )
+
     def handle(self, *args, **options):
-        sync_resources_with_guardian(force=True)
+        if not options.get("bulk"):
+            sync_resources_with_guardian(force=True)
+            return
+
+        def progress(done, total):
+            self.stdout.write(f"Synced {done}/{total} datasets")
+
+        report = bulk_sync_resources_with_guardian(
+            force=True, workers=options.get("workers"), batch_size=options.get("batch_size"), progress=progress
+        )
+        self.stdout.write(
+            f"Processed {report['datasets']} datasets: {report['unchanged']} unchanged, {report['changed']} updated, "
+            f"{report['failed']} failed ({report['operations']} operations in {report['batches']} batches)"
+        )
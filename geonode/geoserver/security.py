@@ -17,12 +17,14 @@
 #
 #########################################################################
 
+import itertools
 import logging
 import requests
 import traceback
 from packaging import version
 import re
 import typing
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import xml.etree.ElementTree as ET
 
 from lxml import etree
@@ -328,19 +330,46 @@ def create_geofence_rules(layer, perms, user=None, group=None, batch: Batch = No
     return batch
 
 
-def sync_resources_with_guardian(resource=None, force=False):
+def collect_dataset_rules(dataset, batch: Batch) -> Batch:
     """
-    Sync resources with Guardian and clear their dirty state
+    Collect into the batch the GeoFence rules matching the current permissions of the dataset
     """
+    perm_spec = permissions_registry.get_perms(instance=dataset)
+    # All the other users
+    if "users" in perm_spec:
+        for user, perms in perm_spec["users"].items():
+            user = get_user_model().objects.get(username=user)
+            # Set the GeoFence User Rules
+            geofence_user = str(user)
+            if "AnonymousUser" in geofence_user or str(get_anonymous_user()) in geofence_user:
+                geofence_user = None
+            create_geofence_rules(dataset, perms, user=geofence_user, batch=batch)
+    # All the other groups
+    if "groups" in perm_spec:
+        for group, perms in perm_spec["groups"].items():
+            group = Group.objects.get(name=group)
+            if group and group.name and group.name == "anonymous":
+                group = None
+            # Set the GeoFence Group Rules
+            create_geofence_rules(dataset, perms, group=group, batch=batch)
+    return batch
+
+
+def _get_datasets_to_sync(resource=None, force=False):
     from geonode.layers.models import Dataset
 
     if resource:
-        datasets = Dataset.objects.filter(id=resource.id)
-    else:
-        if force:
-            datasets = Dataset.objects.all()
-        else:
-            datasets = Dataset.objects.filter(dirty_state=True)
+        return Dataset.objects.filter(id=resource.id)
+    if force:
+        return Dataset.objects.all()
+    return Dataset.objects.filter(dirty_state=True)
+
+
+def sync_resources_with_guardian(resource=None, force=False):
+    """
+    Sync resources with Guardian and clear their dirty state
+    """
+    datasets = _get_datasets_to_sync(resource, force)
     if datasets and datasets.exists():
         logger.debug(" --------------------------- synching with guardian!")
 
@@ -355,24 +384,7 @@ def sync_resources_with_guardian(resource=None, force=False):
                 batch = AutoPriorityBatch(gf_utils.get_first_available_priority(), f"Sync resources {dataset}")
 
                 gf_utils.collect_delete_layer_rules(get_dataset_workspace(dataset), dataset.name, batch)
-                perm_spec = permissions_registry.get_perms(instance=dataset)
-                # All the other users
-                if "users" in perm_spec:
-                    for user, perms in perm_spec["users"].items():
-                        user = get_user_model().objects.get(username=user)
-                        # Set the GeoFence User Rules
-                        geofence_user = str(user)
-                        if "AnonymousUser" in geofence_user or str(get_anonymous_user()) in geofence_user:
-                            geofence_user = None
-                        create_geofence_rules(dataset, perms, user=geofence_user, batch=batch)
-                # All the other groups
-                if "groups" in perm_spec:
-                    for group, perms in perm_spec["groups"].items():
-                        group = Group.objects.get(name=group)
-                        if group and group.name and group.name == "anonymous":
-                            group = None
-                        # Set the GeoFence Group Rules
-                        create_geofence_rules(dataset, perms, group=group, batch=batch)
+                collect_dataset_rules(dataset, batch)
 
                 logger.info(f"Going to synch permissions in GeoFence for resource {dataset}")
                 rules_committed = geofence.run_batch(batch)
@@ -385,6 +397,114 @@ def sync_resources_with_guardian(resource=None, force=False):
             invalidate_geofence_cache()
 
 
+# Rule fields compared when diffing the desired rules against the ones stored in GeoFence
+RULE_SIGNATURE_FIELDS = ("userName", "roleName", "service", "request", "subfield", "workspace", "layer", "access")
+
+
+def _rule_signature(fields: dict) -> tuple:
+    """
+    Comparable representation of a GeoFence rule, ignoring its id and priority
+    """
+    signature = {field: fields.get(field) for field in RULE_SIGNATURE_FIELDS if fields.get(field) not in (None, "*")}
+    limits = fields.get("limits") or {}
+    for field in ("allowedArea", "catalogMode"):
+        if limits.get(field) is not None:
+            signature[f"limits.{field}"] = limits[field]
+    return tuple(sorted(signature.items()))
+
+
+def bulk_sync_resources_with_guardian(resource=None, force=False, workers=4, batch_size=1000, progress=None):
+    """
+    Sync the GeoFence rules of many datasets at once and clear their dirty state.
+
+    The current GeoFence rules are fetched with a single request and compared, layer by layer, with the rules
+    matching the datasets permissions: the layers whose rules already match are left untouched, the others
+    have their rules replaced. The changes are grouped in batches of about `batch_size` operations, executed
+    by `workers` parallel workers.
+    `progress`, if given, is called as `progress(done, total)` after each executed batch.
+
+    Returns a report dict.
+    """
+    report = {"datasets": 0, "unchanged": 0, "changed": 0, "failed": 0, "operations": 0, "batches": 0}
+    datasets = _get_datasets_to_sync(resource, force)
+    if not datasets.exists():
+        return report
+
+    current_rules = {}
+    first_priority = 0
+    for rule in geofence.get_rules().get("rules", []):
+        current_rules.setdefault((rule.get("workspace"), rule.get("layer")), []).append(rule)
+        first_priority = max(first_priority, int(rule.get("priority") or 0) + 1)
+    priorities = itertools.count(first_priority)
+
+    # compute the delta
+    batches = []
+    batch = None
+    for dataset in datasets.iterator():
+        report["datasets"] += 1
+        if is_remote_resource(dataset):
+            dataset.clear_dirty_state()
+            continue
+        try:
+            workspace_name = get_dataset_workspace(dataset)
+            desired = collect_dataset_rules(dataset, Batch()).operations
+            current = sorted(current_rules.get((workspace_name, dataset.name), []), key=lambda r: r.get("priority"))
+            if [_rule_signature(r) for r in current] == [_rule_signature(op["Rule"]) for op in desired]:
+                report["unchanged"] += 1
+                dataset.clear_dirty_state()
+                continue
+
+            layer_batch = Batch()
+            for rule in current:
+                layer_batch.add_delete_rule(rule["id"])
+            for operation in desired:
+                operation["Rule"]["priority"] = next(priorities)
+            layer_batch.operations.extend(desired)
+        except Exception as e:
+            logger.exception(e)
+            logger.warning(f"!WARNING! - Failure computing Security Rules for Resource [{dataset}]")
+            report["failed"] += 1
+            continue
+
+        if batch is None or batch.length() >= batch_size:
+            batch = Batch(f"Bulk sync #{len(batches) + 1}")
+            batches.append((batch, []))
+        batch.extend(layer_batch)
+        batches[-1][1].append(dataset)
+        report["operations"] += layer_batch.length()
+
+    report["batches"] = len(batches)
+    total = sum(len(_datasets) for _, _datasets in batches)
+    logger.info(
+        f"GeoFence bulk sync: {report['unchanged']} datasets unchanged, {total} to update "
+        f"with {report['operations']} operations in {len(batches)} batches"
+    )
+
+    # apply the delta
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(geofence.run_batch, _batch): (_batch, _datasets) for _batch, _datasets in batches}
+        for future in as_completed(futures):
+            _batch, _datasets = futures[future]
+            try:
+                future.result()
+                report["changed"] += len(_datasets)
+                for dataset in _datasets:
+                    dataset.clear_dirty_state()
+            except Exception as e:
+                logger.exception(e)
+                logger.warning(f"!WARNING! - Failure running GeoFence batch {_batch.log_name}")
+                report["failed"] += len(_datasets)
+            done += len(_datasets)
+            logger.info(f"GeoFence bulk sync: {done}/{total} datasets processed")
+            if progress:
+                progress(done, total)
+
+    if report["changed"]:
+        invalidate_geofence_cache()
+    return report
+
+
 def get_geolimits(layer, username, groupname):
     users_geolimits = None
     groups_geolimits = None
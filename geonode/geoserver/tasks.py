@@ -35,6 +35,7 @@ from .security import sync_resources_with_guardian
 from .helpers import (
     gs_slurp,
     gs_catalog,
+    gs_catalog_cache,
     set_styles,
     get_sld_for,
     set_dataset_style,
@@ -186,6 +187,7 @@ def geoserver_create_style(self, instance_id, name, sld_file, tempdir):
                             _default_style = gs_dataset.default_style
                             gs_dataset.default_style = style
                             gs_catalog.save(gs_dataset)
+                            gs_catalog_cache.invalidate_dataset(name, instance.name, instance.alternate)
                             set_styles(instance, gs_catalog)
                             try:
                                 gs_catalog.delete(_default_style)
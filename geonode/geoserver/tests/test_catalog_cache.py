@@ -0,0 +1,92 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+from unittest.mock import Mock, patch
+
+from django.test import SimpleTestCase
+
+from geonode.geoserver.catalog_cache import LAYER, RESOURCE, STORE, CatalogCache
+
+
+class CatalogCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.catalog = Mock(service_url="http://localhost:8080/geoserver/rest")
+        self.cache = CatalogCache({LAYER: 30, RESOURCE: 30, STORE: 30})
+
+    def test_objects_are_cached_until_their_timeout(self):
+        fetch = Mock(return_value="layer")
+        with patch("geonode.geoserver.catalog_cache.time.monotonic", return_value=100):
+            self.assertEqual(self.cache.get(self.catalog, LAYER, "geonode:roads", fetch), "layer")
+            self.assertEqual(self.cache.get(self.catalog, LAYER, "geonode:roads", fetch), "layer")
+        self.assertEqual(fetch.call_count, 1)
+
+        with patch("geonode.geoserver.catalog_cache.time.monotonic", return_value=131):
+            self.cache.get(self.catalog, LAYER, "geonode:roads", fetch)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_missing_objects_and_disabled_types_are_not_cached(self):
+        fetch = Mock(return_value=None)
+        self.cache.get(self.catalog, LAYER, "geonode:missing", fetch)
+        self.cache.get(self.catalog, LAYER, "geonode:missing", fetch)
+        self.assertEqual(fetch.call_count, 2)
+
+        fetch = Mock(return_value="workspace")
+        self.cache.get(self.catalog, "workspace", "geonode", fetch)
+        self.cache.get(self.catalog, "workspace", "geonode", fetch)
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_targeted_invalidation(self):
+        fetch = Mock(side_effect=lambda: object())
+        roads = self.cache.get(self.catalog, LAYER, "geonode:roads", fetch)
+        rivers = self.cache.get(self.catalog, LAYER, "geonode:rivers", fetch)
+        self.cache.get(self.catalog, RESOURCE, ("geonode", "roads_store", "roads"), fetch)
+        self.cache.get(self.catalog, STORE, ("geonode", "roads_store"), fetch)
+
+        self.cache.invalidate_dataset("roads")
+        self.assertIsNot(self.cache.get(self.catalog, LAYER, "geonode:roads", fetch), roads)
+        self.assertIs(self.cache.get(self.catalog, LAYER, "geonode:rivers", fetch), rivers)
+        self.assertEqual(fetch.call_count, 5)
+
+        self.cache.get(self.catalog, RESOURCE, ("geonode", "roads_store", "roads"), fetch)
+        self.assertEqual(fetch.call_count, 6)
+
+        self.cache.invalidate_store("roads_store", workspace="geonode")
+        self.cache.get(self.catalog, STORE, ("geonode", "roads_store"), fetch)
+        self.cache.get(self.catalog, RESOURCE, ("geonode", "roads_store", "roads"), fetch)
+        self.assertEqual(fetch.call_count, 8)
+
+    def test_invalidation_reaches_the_other_processes(self):
+        # the caches of two processes sharing the default cache
+        other_cache = CatalogCache({LAYER: 30, RESOURCE: 30, STORE: 30})
+        fetch = Mock(side_effect=lambda: object())
+        roads = self.cache.get(self.catalog, LAYER, "geonode:roads", fetch)
+        rivers = self.cache.get(self.catalog, LAYER, "geonode:rivers", fetch)
+        other_roads = other_cache.get(self.catalog, LAYER, "geonode:roads", fetch)
+        self.assertIs(other_cache.get(self.catalog, LAYER, "geonode:roads", fetch), other_roads)
+        self.assertEqual(fetch.call_count, 3)
+
+        other_cache.invalidate_dataset("roads")
+
+        # the process which invalidated the dataset only drops its entries
+        self.assertIsNot(other_cache.get(self.catalog, LAYER, "geonode:roads", fetch), other_roads)
+        self.assertEqual(fetch.call_count, 4)
+        # the other process does not know which objects changed and drops all its entries
+        self.assertIsNot(self.cache.get(self.catalog, LAYER, "geonode:roads", fetch), roads)
+        self.assertIsNot(self.cache.get(self.catalog, LAYER, "geonode:rivers", fetch), rivers)
+        self.assertEqual(fetch.call_count, 6)
@@ -43,6 +43,8 @@ from geonode.geoserver.helpers import (
     get_dataset_capabilities_url,
     get_layer_ows_url,
     get_time_info,
+    get_datastore_attribute_statistics,
+    set_attributes_from_geoserver,
     _sync_geoserver_keywords_to_instance,
 )
 from geonode.geoserver.ows import _wcs_link, _wfs_link, _wms_link
@@ -387,3 +389,117 @@ xlink:href="{settings.GEOSERVER_LOCATION}ows?service=WMS&amp;request=GetLegendGr
             {"keyword_from_geonode", "keyword_from_geoserver", "shared_keyword"},
             set(dataset.keyword_list()),
         )
+
+    @on_ogc_backend(geoserver.BACKEND_PACKAGE)
+    @patch("geonode.geoserver.helpers.get_attribute_statistics")
+    @patch("geonode.geoserver.helpers.get_datastore_attribute_statistics")
+    @patch("geonode.geoserver.helpers._get_from_catalog")
+    def test_set_attributes_from_geoserver_uses_datastore_statistics(
+        self, mock_get_from_catalog, mock_datastore_statistics, mock_attribute_statistics
+    ):
+        dataset = Dataset.objects.create(
+            uuid=str(uuid4()),
+            owner=get_user_model().objects.get(username=self.user),
+            name="attribute_statistics_test",
+            store="geonode_data",
+            subtype="vector",
+            alternate="geonode:attribute_statistics_test",
+        )
+        mock_get_from_catalog.return_value = """<?xml version="1.0" encoding="UTF-8"?>
+            <xsd:schema xmlns:xsd="http://www.w3.org/2001/XMLSchema">
+                <xsd:complexType name="attribute_statistics_testType">
+                    <xsd:complexContent>
+                        <xsd:extension base="gml:AbstractFeatureType">
+                            <xsd:sequence>
+                                <xsd:element name="the_geom" type="gml:MultiPolygonPropertyType"/>
+                                <xsd:element name="population" type="xsd:int"/>
+                                <xsd:element name="label" type="xsd:string"/>
+                            </xsd:sequence>
+                        </xsd:extension>
+                    </xsd:complexContent>
+                </xsd:complexType>
+            </xsd:schema>"""
+        mock_datastore_statistics.return_value = {
+            "population": {
+                "Count": 3,
+                "Min": "10",
+                "Max": "30",
+                "Average": "20.0",
+                "Median": "20.0",
+                "StandardDeviation": "8.16",
+                "Sum": "60",
+                "unique_values": "10,20,30",
+            }
+        }
+
+        set_attributes_from_geoserver(dataset)
+
+        # the numeric fields of a vector dataset get their statistics from the datastore, without the WPS
+        mock_datastore_statistics.assert_called_once_with(dataset, ["population"])
+        mock_attribute_statistics.assert_not_called()
+        population = dataset.attribute_set.get(attribute="population")
+        self.assertEqual(population.average, "20.0")
+        self.assertEqual(population.unique_values, "10,20,30")
+        self.assertEqual(dataset.attribute_set.get(attribute="label").average, "NA")
+
+    @on_ogc_backend(geoserver.BACKEND_PACKAGE)
+    @patch("geonode.geoserver.helpers.connections")
+    @patch("geonode.geoserver.helpers.ogc_server_settings")
+    def test_get_datastore_attribute_statistics(self, mock_ogc_server_settings, mock_connections):
+        mock_ogc_server_settings.WPS_ENABLED = True
+        mock_ogc_server_settings.DATASTORE = "default"
+        connection = mock_connections.__getitem__.return_value
+        connection.vendor = "postgresql"
+        connection.ops.quote_name.side_effect = lambda name: f'"{name}"'
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [("fid",), ("population",), ("area",), ("the_geom",)]
+        cursor.fetchone.side_effect = [
+            (3, 10, 30, 20.0, 20.0, 8.16, 60, 3, 2, 1.5, 4.5, 3.0, 3.0, 1.5, 6.0, 200),
+            ("10,20,30",),
+        ]
+        layer = Mock()
+        layer.name = "test_dataset"
+        layer.store = "geonode_data"
+
+        stats = get_datastore_attribute_statistics(layer, ["population", "area"])
+
+        # the statistics of all the fields are computed by a single query on the table
+        statistics_query = cursor.execute.call_args_list[1][0][0]
+        self.assertIn('stddev_pop("population")', statistics_query)
+        self.assertIn('count(DISTINCT "area")', statistics_query)
+        self.assertIn('FROM "test_dataset"', statistics_query)
+        self.assertEqual(cursor.execute.call_count, 3)
+        self.assertDictEqual(
+            stats["population"],
+            {
+                "Count": 3,
+                "Min": "10",
+                "Max": "30",
+                "Average": "20.0",
+                "Median": "20.0",
+                "StandardDeviation": "8.16",
+                "Sum": "60",
+                "unique_values": "10,20,30",
+            },
+        )
+        # the fields having too many distinct values do not list them
+        self.assertEqual(stats["area"]["Count"], 2)
+        self.assertEqual(stats["area"]["Average"], "3.0")
+        self.assertEqual(stats["area"]["unique_values"], "NA")
+
+        # datasets whose table is not in the datastore are left to the WPS statistics
+        cursor.fetchall.return_value = []
+        self.assertIsNone(get_datastore_attribute_statistics(layer, ["population"]))
+
+        # a dataset of another store is never matched with a table of the datastore
+        cursor.execute.reset_mock()
+        layer.store = "external_postgis"
+        self.assertIsNone(get_datastore_attribute_statistics(layer, ["population"]))
+        cursor.execute.assert_not_called()
+        layer.store = "geonode_data"
+
+        # no statistics are computed when the WPS is disabled, as with get_attribute_statistics()
+        mock_ogc_server_settings.WPS_ENABLED = False
+        cursor.execute.reset_mock()
+        self.assertIsNone(get_datastore_attribute_statistics(layer, ["population"]))
+        cursor.execute.assert_not_called()
@@ -294,6 +294,7 @@ class AsynchronousHarvestingSessionAdmin(admin.ModelAdmin):
         "total_records_to_process",
         "records_done",
         "get_progress_percentage",
+        "get_throughput",
     )
     readonly_fields = (
         "id",
@@ -306,6 +307,7 @@ class AsynchronousHarvestingSessionAdmin(admin.ModelAdmin):
         "total_records_to_process",
         "records_done",
         "get_progress_percentage",
+        "get_throughput",
         "details",
     )
 
@@ -228,6 +228,8 @@ class HarvesterSerializer(BriefHarvesterSerializer):
 
 
 class BriefAsynchronousHarvestingSessionSerializer(DynamicModelSerializer):
+    metrics = serializers.SerializerMethodField()
+
     class Meta:
         model = models.AsynchronousHarvestingSession
         fields = (
@@ -237,8 +239,12 @@ class BriefAsynchronousHarvestingSessionSerializer(DynamicModelSerializer):
             "ended",
             "total_records_to_process",
             "records_done",
+            "metrics",
         )
 
+    def get_metrics(self, obj):
+        return obj.get_metrics()
+
 
 class HarvestableResourceSerializer(DynamicModelSerializer):
     class Meta:
@@ -0,0 +1,192 @@
+#########################################################################
+#
+# Copyright (C) 2025 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+"""Adaptive concurrency and rate limiting for harvesting sessions
+
+Remote calls performed by the harvesting tasks are recorded here, per harvester and
+per harvesting session. The recorded latency and error rate are used to adjust the
+number of chunks that are queued in parallel (additive increase, multiplicative
+decrease), while a per-remote token bucket caps the rate of requests sent to the
+same remote host.
+
+State is kept in the default django cache so that it is shared by all the celery
+workers. Counters only rely on `cache.add()` and `cache.incr()`, which are atomic
+on the cache backends used in production (redis, memcached).
+
+"""
+
+import logging
+import math
+import time
+import typing
+from urllib.parse import urlparse
+
+from django.core.cache import cache
+
+from .config import get_setting
+
+logger = logging.getLogger(__name__)
+
+STATS_TIMEOUT: typing.Final = 60 * 60 * 24
+
+
+class RemoteCallStats:
+    """Counters of the remote calls performed under a cache key prefix."""
+
+    FIELDS: typing.Final = ("calls", "errors", "latency_ms")
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+
+    def _key(self, field: str) -> str:
+        return f"{self.prefix}:{field}"
+
+    def _incr(self, field: str, delta: int):
+        key = self._key(field)
+        if not cache.add(key, delta, timeout=STATS_TIMEOUT):
+            try:
+                cache.incr(key, delta)
+            except ValueError:
+                cache.set(key, delta, timeout=STATS_TIMEOUT)
+
+    def record(self, latency: float, success: bool):
+        self._incr("calls", 1)
+        self._incr("latency_ms", int(latency * 1000))
+        if not success:
+            self._incr("errors", 1)
+
+    def get(self) -> typing.Dict:
+        values = cache.get_many([self._key(field) for field in self.FIELDS])
+        calls, errors, latency_ms = (values.get(self._key(field), 0) for field in self.FIELDS)
+        return {
+            "calls": calls,
+            "errors": errors,
+            "error_rate": errors / calls if calls else 0.0,
+            "mean_latency": latency_ms / calls / 1000 if calls else 0.0,
+        }
+
+    def pop(self) -> typing.Dict:
+        result = self.get()
+        cache.delete_many([self._key(field) for field in self.FIELDS])
+        return result
+
+
+class AdaptiveConcurrency:
+    """AIMD controller of the number of chunks that are harvested in parallel.
+
+    The latency and error rate of the remote calls recorded since the previous batch
+    are evaluated each time a new batch of chunks is queued: a healthy remote gets one
+    more chunk in flight, while a slow or failing one has its concurrency halved.
+    """
+
+    def __init__(self, harvester_id: int):
+        self.harvester_id = harvester_id
+        self.key = f"harvesting:concurrency:{harvester_id}"
+        self.window = RemoteCallStats(f"harvesting:window:{harvester_id}")
+
+    @property
+    def minimum(self) -> int:
+        return max(1, int(get_setting("HARVESTING_MIN_PARALLEL_QUEUE_CHUNKS")))
+
+    @property
+    def maximum(self) -> int:
+        return max(self.minimum, int(get_setting("HARVESTING_MAX_PARALLEL_QUEUE_CHUNKS")))
+
+    @property
+    def current(self) -> int:
+        initial = min(max(int(get_setting("MAX_PARALLEL_QUEUE_CHUNKS")), self.minimum), self.maximum)
+        return cache.get_or_set(self.key, initial, timeout=STATS_TIMEOUT)
+
+    def record(self, latency: float, success: bool):
+        self.window.record(latency, success)
+
+    def adjust(self) -> int:
+        """Consume the stats recorded since the last adjustment and return the new concurrency"""
+        current = self.current
+        stats = self.window.pop()
+        if not stats["calls"]:
+            return current
+        congested = stats["error_rate"] > float(get_setting("HARVESTING_MAX_ERROR_RATE")) or stats[
+            "mean_latency"
+        ] > float(get_setting("HARVESTING_TARGET_LATENCY"))
+        if congested:
+            result = max(self.minimum, math.floor(current * float(get_setting("HARVESTING_CONCURRENCY_BACKOFF"))))
+        else:
+            result = min(self.maximum, current + 1)
+        if result != current:
+            logger.debug(
+                f"Harvester {self.harvester_id} - concurrency {current} -> {result} "
+                f"(mean latency: {stats['mean_latency']:.2f}s, error rate: {stats['error_rate']:.2%})"
+            )
+        cache.set(self.key, result, timeout=STATS_TIMEOUT)
+        return result
+
+
+class RemoteRateLimiter:
+    """Token bucket shared by all the harvesters that target the same remote host.
+
+    The bucket holds `HARVESTING_REMOTE_BURST` tokens and is refilled at a rate of
+    `HARVESTING_REMOTE_RATE_LIMIT` tokens per second. Refills are done at the end of each
+    `burst / rate` seconds long period, which allows to implement the bucket with an
+    atomic counter per period.
+    """
+
+    def __init__(self, remote_url: str):
+        self.remote_url = remote_url
+
+    @property
+    def rate(self) -> float:
+        return float(get_setting("HARVESTING_REMOTE_RATE_LIMIT") or 0)
+
+    @property
+    def burst(self) -> int:
+        return max(1, int(get_setting("HARVESTING_REMOTE_BURST") or math.ceil(self.rate)))
+
+    def acquire(self) -> float:
+        """Take a token from the bucket.
+
+        Returns zero when the token was granted, otherwise the number of seconds to
+        wait before the bucket is refilled.
+        """
+        if self.rate <= 0:
+            return 0
+        period = self.burst / self.rate
+        now = time.time()
+        slot = int(now // period)
+        host = urlparse(self.remote_url).netloc or self.remote_url
+        key = f"harvesting:rate:{host}:{slot}"
+        if cache.add(key, 1, timeout=math.ceil(period) + 1):
+            return 0
+        try:
+            taken = cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=math.ceil(period) + 1)
+            return 0
+        if taken <= self.burst:
+            return 0
+        return (slot + 1) * period - now
+
+
+def get_session_stats(session_id: int) -> RemoteCallStats:
+    return RemoteCallStats(f"harvesting:session:{session_id}")
+
+
+def record_remote_call(harvester_id: int, session_id: int, latency: float, success: bool):
+    AdaptiveConcurrency(harvester_id).record(latency, success)
+    get_session_stats(session_id).record(latency, success)
@@ -50,5 +50,17 @@ def get_setting(setting_key: str) -> typing.Any:
             settings, "HARVESTED_RESOURCE_MAX_MEMORY_SIZE", settings.FILE_UPLOAD_MAX_MEMORY_SIZE
         ),
         "HARVESTER_SCHEDULER_FREQUENCY_MINUTES": getattr(settings, "HARVESTER_SCHEDULER_FREQUENCY_MINUTES", 0.5),
+        "HARVESTING_BATCH_SIZE": getattr(settings, "HARVESTING_BATCH_SIZE", 1),
+        "HARVESTING_BATCH_FETCH_WORKERS": getattr(settings, "HARVESTING_BATCH_FETCH_WORKERS", 4),
+        "HARVESTING_CHANGE_DETECTION": getattr(settings, "HARVESTING_CHANGE_DETECTION", True),
+        "HARVESTING_MIN_PARALLEL_QUEUE_CHUNKS": getattr(settings, "HARVESTING_MIN_PARALLEL_QUEUE_CHUNKS", 1),
+        "HARVESTING_MAX_PARALLEL_QUEUE_CHUNKS": getattr(
+            settings, "HARVESTING_MAX_PARALLEL_QUEUE_CHUNKS", getattr(settings, "MAX_PARALLEL_QUEUE_CHUNKS", 2)
+        ),
+        "HARVESTING_TARGET_LATENCY": getattr(settings, "HARVESTING_TARGET_LATENCY", 5),
+        "HARVESTING_MAX_ERROR_RATE": getattr(settings, "HARVESTING_MAX_ERROR_RATE", 0.1),
+        "HARVESTING_CONCURRENCY_BACKOFF": getattr(settings, "HARVESTING_CONCURRENCY_BACKOFF", 0.5),
+        "HARVESTING_REMOTE_RATE_LIMIT": getattr(settings, "HARVESTING_REMOTE_RATE_LIMIT", 0),
+        "HARVESTING_REMOTE_BURST": getattr(settings, "HARVESTING_REMOTE_BURST", 0),
     }.get(setting_key, getattr(settings, setting_key, None))
     return result
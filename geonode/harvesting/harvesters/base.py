@@ -19,13 +19,19 @@
 
 import abc
 import dataclasses
+import datetime as dt
+import hashlib
 import io
+import json
 import logging
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import dateutil.parser
 import requests
 from django.core.files import uploadedfile
+from django.utils.http import http_date
 
 from geonode.base import enumerations
 from geonode.base.models import ResourceBase
@@ -44,6 +50,14 @@ class HarvestingException(Exception):
     pass
 
 
+class RemoteResourceNotModified(Exception):
+    """Raised by `get_resource()` when the remote reports that a resource has not changed.
+
+    This is typically the case when the remote answers a conditional request with a
+    `304 Not Modified` response.
+    """
+
+
 @dataclasses.dataclass()
 class BriefRemoteResource:
     unique_identifier: str
@@ -51,12 +65,14 @@ class BriefRemoteResource:
     resource_type: str
     abstract: typing.Optional[str] = ""
     should_be_harvested: bool = False
+    last_modified: typing.Optional[dt.datetime] = None
 
 
 @dataclasses.dataclass()
 class HarvestedResourceInfo:
     resource_descriptor: resourcedescriptor.RecordDescription
     additional_information: typing.Optional[typing.Any]
+    etag: typing.Optional[str] = None
 
 
 class BaseHarvesterWorker(abc.ABC):
@@ -72,6 +88,10 @@ class BaseHarvesterWorker(abc.ABC):
     remote_url: str
     harvester_id: int
 
+    # whether `get_resources()` is able to fetch many resources more efficiently than
+    # calling `get_resource()` for each one of them
+    supports_batch_fetching: bool = False
+
     def __init__(self, remote_url: str, harvester_id: int):
         self.remote_url = remote_url
         self.harvester_id = harvester_id
@@ -138,6 +158,48 @@ class BaseHarvesterWorker(abc.ABC):
             result[property_name] = getattr(self, property_name, None)
         return result
 
+    def get_resources(
+        self,
+        harvestable_resources: typing.List["HarvestableResource"],  # noqa
+    ) -> typing.Dict[int, typing.Optional[HarvestedResourceInfo]]:
+        """Harvest many resources from the remote service.
+
+        The return value maps the ids of the input harvestable resources to the result of
+        harvesting them, as `get_resource()` would return it. Resources that are missing from
+        the result are harvested again individually.
+        The default implementation calls `get_resource()` for each resource. Workers that set
+        `supports_batch_fetching` should override it with a more efficient implementation.
+
+        """
+
+        return {
+            harvestable_resource.pk: self.get_resource(harvestable_resource)
+            for harvestable_resource in harvestable_resources
+        }
+
+    def get_conditional_request_headers(
+        self,
+        harvestable_resource: "HarvestableResource",  # noqa
+    ) -> typing.Dict[str, str]:
+        """Return the HTTP headers used to make a conditional request for a single resource.
+
+        Workers that fetch resources over HTTP can send these headers from within `get_resource()`
+        and raise `RemoteResourceNotModified` when the remote answers with `304 Not Modified`.
+        No headers are returned for resources whose last harvesting did not succeed, as
+        they need to be fetched again anyway, nor when `HARVESTING_CHANGE_DETECTION` is off.
+
+        """
+
+        result = {}
+        if not config.get_setting("HARVESTING_CHANGE_DETECTION"):
+            return result
+        if harvestable_resource.geonode_resource_id is not None and harvestable_resource.last_harvesting_succeeded:
+            if harvestable_resource.remote_etag:
+                result["If-None-Match"] = harvestable_resource.remote_etag
+            if harvestable_resource.harvested_last_modified is not None:
+                result["If-Modified-Since"] = http_date(harvestable_resource.harvested_last_modified.timestamp())
+        return result
+
     def finalize_resource_update(
         self,
         geonode_resource: ResourceBase,
@@ -263,6 +325,61 @@ class BaseHarvesterWorker(abc.ABC):
         return result
 
 
+def fetch_concurrently(
+    fetcher: typing.Callable[[typing.Any], typing.Any],
+    items: typing.Iterable,
+    max_workers: typing.Optional[int] = None,
+) -> typing.List:
+    """Call `fetcher` on each item concurrently and return the results in the same order.
+
+    Remote requests are I/O bound, hence running them on a pool of threads allows a single
+    celery task to have many of them in flight.
+
+    """
+
+    items = list(items)
+    max_workers = max_workers or config.get_setting("HARVESTING_BATCH_FETCH_WORKERS")
+    if len(items) <= 1 or max_workers <= 1:
+        return [fetcher(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(fetcher, items))
+
+
+def parse_last_modified(value: typing.Optional[typing.Union[str, dt.datetime]]) -> typing.Optional[dt.datetime]:
+    """Parse a remote modification date, which may be given either as a datetime or as an ISO string"""
+    if isinstance(value, dt.datetime):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return dateutil.parser.isoparse(value)
+        except ValueError:
+            logger.warning(f"Could not parse remote modification date {value!r}")
+    return None
+
+
+def get_harvested_info_checksum(harvested_info: HarvestedResourceInfo) -> typing.Optional[str]:
+    """Return a checksum of the metadata of a harvested resource.
+
+    The checksum allows to detect whether a resource changed on the remote since it was last
+    harvested. `None` is returned for harvested info that does not carry a resource descriptor.
+
+    """
+
+    resource_descriptor = getattr(harvested_info, "resource_descriptor", None)
+    if not dataclasses.is_dataclass(resource_descriptor):
+        return None
+    try:
+        serialized = json.dumps(
+            [resource_descriptor, harvested_info.additional_information],
+            sort_keys=True,
+            default=lambda obj: vars(obj) if dataclasses.is_dataclass(obj) else str(obj),
+        )
+    except (TypeError, ValueError):
+        logger.warning("Could not compute the checksum of the harvested resource")
+        return None
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
 def download_resource_file(url: str, target_name: str) -> Path:
     """Download a resource file and store it using GeoNode's `storage_manager`.
 
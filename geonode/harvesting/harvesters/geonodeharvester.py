@@ -93,6 +93,9 @@ class GeonodeCurrentHarvester(base.BaseHarvesterWorker):
     categories_filter: typing.Optional[typing.List[str]]
     http_session: requests.Session
     page_size: int = 10
+    supports_batch_fetching = True
+    # maximum number of resources that are fetched with a single request
+    batch_page_size: int = 100
 
     def __init__(
         self,
@@ -162,6 +165,7 @@ class GeonodeCurrentHarvester(base.BaseHarvesterWorker):
                             title=raw_resource["title"],
                             abstract=raw_resource["abstract"],
                             resource_type=raw_resource["resource_type"],
+                            last_modified=base.parse_last_modified(raw_resource.get("last_updated")),
                         )
                         result.append(brief_resource)
                     except KeyError as exc:
@@ -188,9 +192,11 @@ class GeonodeCurrentHarvester(base.BaseHarvesterWorker):
             GeoNodeResourceTypeCurrent.DOCUMENT.value: "/documents/",
         }[harvestable_resource.remote_resource_type]
         url = f"{self.base_api_url}{url_fragment}{harvestable_resource.unique_identifier}/"
-        response = self.http_session.get(url)
+        response = self.http_session.get(url, headers=self.get_conditional_request_headers(harvestable_resource))
         result = None
-        if response.status_code == requests.codes.ok:
+        if response.status_code == requests.codes.not_modified:
+            raise base.RemoteResourceNotModified(url)
+        elif response.status_code == requests.codes.ok:
             try:
                 response_payload = response.json()
             except json.JSONDecodeError:
@@ -200,7 +206,9 @@ class GeonodeCurrentHarvester(base.BaseHarvesterWorker):
                     response_payload, harvestable_resource.remote_resource_type
                 )
                 result = base.HarvestedResourceInfo(
-                    resource_descriptor=resource_descriptor, additional_information=None
+                    resource_descriptor=resource_descriptor,
+                    additional_information=None,
+                    etag=response.headers.get("ETag"),
                 )
         else:
             logger.error(
@@ -209,6 +217,57 @@ class GeonodeCurrentHarvester(base.BaseHarvesterWorker):
             )
         return result
 
+    def get_resources(
+        self,
+        harvestable_resources: typing.List[models.HarvestableResource],
+    ) -> typing.Dict[int, typing.Optional[base.HarvestedResourceInfo]]:
+        """Fetch the details of many resources with a few concurrent list requests.
+
+        Resources are requested in pages of `batch_page_size` by filtering the list endpoints
+        of the remote GeoNode by primary key.
+
+        """
+
+        endpoints = {
+            GeoNodeResourceTypeCurrent.DATASET.value: "datasets",
+            GeoNodeResourceTypeCurrent.DOCUMENT.value: "documents",
+        }
+        resources_by_type = {}
+        for harvestable_resource in harvestable_resources:
+            if harvestable_resource.remote_resource_type in endpoints:
+                resources_by_type.setdefault(harvestable_resource.remote_resource_type, {})[
+                    str(harvestable_resource.unique_identifier)
+                ] = harvestable_resource
+        pages = []
+        for remote_resource_type, resources in resources_by_type.items():
+            identifiers = list(resources)
+            for index in range(0, len(identifiers), self.batch_page_size):
+                pages.append((remote_resource_type, identifiers[index : index + self.batch_page_size]))
+
+        def fetch_page(page: typing.Tuple[str, typing.List[str]]) -> typing.Tuple[str, typing.List[typing.Dict]]:
+            remote_resource_type, identifiers = page
+            endpoint = endpoints[remote_resource_type]
+            response = self.http_session.get(
+                f"{self.base_api_url}/{endpoint}/",
+                params={"filter{pk.in}": identifiers, "page_size": len(identifiers)},
+            )
+            response.raise_for_status()
+            return remote_resource_type, response.json().get(endpoint, [])
+
+        result = {}
+        for remote_resource_type, records in base.fetch_concurrently(fetch_page, pages):
+            resources = resources_by_type[remote_resource_type]
+            for record in records:
+                harvestable_resource = resources.get(str(record.get("pk")))
+                if harvestable_resource is not None:
+                    resource_descriptor = self._get_resource_descriptor(
+                        {remote_resource_type: record}, remote_resource_type
+                    )
+                    result[harvestable_resource.pk] = base.HarvestedResourceInfo(
+                        resource_descriptor=resource_descriptor, additional_information=None
+                    )
+        return result
+
     def get_geonode_resource_defaults(
         self,
         harvested_info: base.HarvestedResourceInfo,
@@ -446,6 +505,7 @@ class GeonodeLegacyHarvester(base.BaseHarvesterWorker):
     resource_title_filter: typing.Optional[str]
     http_session: requests.Session
     page_size: int = 10
+    supports_batch_fetching = True
 
     def __init__(
         self,
@@ -562,6 +622,21 @@ class GeonodeLegacyHarvester(base.BaseHarvesterWorker):
             )
         return result
 
+    def get_resources(
+        self,
+        harvestable_resources: typing.List[models.HarvestableResource],
+    ) -> typing.Dict[int, typing.Optional[base.HarvestedResourceInfo]]:
+        """Fetch the details of many resources concurrently.
+
+        The list endpoints of the legacy API do not provide all the details of a resource, which
+        also require a CSW `GetRecordById` request, so resources are still fetched one by one,
+        but with many requests in flight.
+
+        """
+
+        results = base.fetch_concurrently(self.get_resource, harvestable_resources)
+        return {harvestable_resource.pk: result for harvestable_resource, result in zip(harvestable_resources, results)}
+
     def get_geonode_resource_defaults(
         self,
         harvested_info: base.HarvestedResourceInfo,
@@ -941,6 +1016,7 @@ class GeonodeUnifiedHarvesterWorker(base.BaseHarvesterWorker):
     """
 
     _concrete_harvester_worker: typing.Optional[typing.Union[GeonodeCurrentHarvester, GeonodeLegacyHarvester]]
+    supports_batch_fetching = True
 
     def __init__(
         self,
@@ -999,6 +1075,12 @@ class GeonodeUnifiedHarvesterWorker(base.BaseHarvesterWorker):
     ) -> typing.Optional[base.HarvestedResourceInfo]:
         return self.concrete_worker.get_resource(harvestable_resource)
 
+    def get_resources(
+        self,
+        harvestable_resources: typing.List[models.HarvestableResource],
+    ) -> typing.Dict[int, typing.Optional[base.HarvestedResourceInfo]]:
+        return self.concrete_worker.get_resources(harvestable_resources)
+
     def get_geonode_resource_defaults(
         self,
         harvested_info: base.HarvestedResourceInfo,
@@ -0,0 +1,47 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("harvesting", "0051_flag_harvested_resources_as_remote"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="harvestableresource",
+            name="remote_last_modified",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Last modification date of the resource, as reported by the remote service when listing it",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="harvestableresource",
+            name="harvested_last_modified",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Remote last modification date of the resource when it was last successfully harvested",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="harvestableresource",
+            name="remote_etag",
+            field=models.CharField(
+                blank=True,
+                help_text="ETag returned by the remote service when the resource was last harvested",
+                max_length=255,
+            ),
+        ),
+        migrations.AddField(
+            model_name="harvestableresource",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                help_text="Checksum of the remote metadata that was used to last update the local GeoNode resource",
+                max_length=64,
+            ),
+        ),
+    ]
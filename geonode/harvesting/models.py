@@ -33,6 +33,10 @@ from django.utils.translation import gettext_lazy as _
 from django.core.cache import caches
 from geonode import celery_app
 
+from .concurrency import (
+    AdaptiveConcurrency,
+    get_session_stats,
+)
 from .config import get_setting
 
 logger = logging.getLogger(__name__)
@@ -342,6 +346,24 @@ class AsynchronousHarvestingSession(models.Model):
             result = 0
         return result
 
+    @admin.display(description="Throughput (records/s)")
+    def get_throughput(self) -> float:
+        ended = self.ended or timezone.now()
+        elapsed = (ended - self.started).total_seconds() if self.started else 0
+        return round(self.records_done / elapsed, 3) if elapsed > 0 else 0.0
+
+    def get_metrics(self) -> typing.Dict:
+        """Return the throughput of the session and the stats of the remote calls it performed"""
+        stats = get_session_stats(self.pk).get()
+        return {
+            "throughput": self.get_throughput(),
+            "remote_calls": stats["calls"],
+            "remote_errors": stats["errors"],
+            "error_rate": round(stats["error_rate"], 3),
+            "mean_latency": round(stats["mean_latency"], 3),
+            "concurrency": AdaptiveConcurrency(self.harvester_id).current,
+        }
+
     def initiate(self, harvestable_resource_ids: typing.Optional[typing.List[int]] = None):
         """Initiate the asynchronous process that performs the work related to this session."""
         # NOTE: below we are calling celery tasks using the method of creating a
@@ -432,6 +454,26 @@ class HarvestableResource(models.Model):
         ),
         blank=True,
     )
+    remote_last_modified = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_("Last modification date of the resource, as reported by the remote service when listing it"),
+    )
+    harvested_last_modified = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text=_("Remote last modification date of the resource when it was last successfully harvested"),
+    )
+    remote_etag = models.CharField(
+        max_length=255,
+        blank=True,
+        help_text=_("ETag returned by the remote service when the resource was last harvested"),
+    )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text=_("Checksum of the remote metadata that was used to last update the local GeoNode resource"),
+    )
 
     class Meta:
         constraints = [
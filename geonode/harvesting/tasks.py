@@ -19,10 +19,12 @@
 
 import math
 import logging
+import time
 import typing
 from datetime import timedelta
 
 from celery import chord
+from celery.exceptions import Retry
 from django.core.exceptions import ValidationError
 from django.db.models import (
     F,
@@ -30,6 +32,7 @@ from django.db.models import (
 )
 from django.db.models.functions import Concat
 from django.utils import timezone
+from django.utils.module_loading import import_string
 from django.conf import settings
 from django.db import transaction, IntegrityError
 
@@ -38,6 +41,12 @@ from geonode.resource.enumerator import ExecutionRequestAction
 from geonode.celery_app import app
 
 from . import models
+from .concurrency import (
+    AdaptiveConcurrency,
+    RemoteRateLimiter,
+    record_remote_call,
+)
+from .config import get_setting
 from .harvesters import base
 
 logger = logging.getLogger(__name__)
@@ -262,10 +271,13 @@ def harvest_resources(
 
     if len(harvestable_resource_ids) <= harvestable_resources_limit:
         # No chunking, just one chord for all resources
-        resource_tasks = [
-            _harvest_resource.signature((rid, harvesting_session_id, execution_id)).set(expires=task_dynamic_expiration)
-            for rid in harvestable_resource_ids
-        ]
+        resource_tasks = _get_harvesting_signatures(
+            harvester.harvester_type,
+            harvestable_resource_ids,
+            harvesting_session_id,
+            execution_id,
+            task_dynamic_expiration,
+        )
         finalizer = (
             _finish_harvesting.signature((harvesting_session_id, execution_id), immutable=True)
             .on_error(_handle_harvesting_error.signature(kwargs={"harvesting_session_id": harvesting_session_id}))
@@ -315,6 +327,75 @@ def _harvest_resource(self, harvestable_resource_id: int, harvesting_session_id:
     is created or chained, not via the decorator. This allows the expiration to be
     calculated based on the current workload or batch size.
     """
+    return _perform_resource_harvesting(self, harvestable_resource_id, harvesting_session_id, execution_id)
+
+
+@app.task(
+    bind=True,
+    queue="harvesting",
+    time_limit=1800,
+    acks_late=False,
+    ignore_result=False,
+)
+def _harvest_resources_batch(
+    self, harvestable_resource_ids: typing.List[int], harvesting_session_id: int, execution_id: str
+):
+    """
+    Harvest a batch of resources, fetching them from the remote with as few requests as possible
+
+    This is used instead of `_harvest_resource` when `HARVESTING_BATCH_SIZE` is greater than one
+    and the harvester worker supports batch fetching. Resources that cannot be fetched in batch
+    fall back to being fetched one by one.
+
+    NOTE:
+    The expiration time (`expires`) of this task is set dynamically when the task
+    is created or chained, not via the decorator.
+    """
+    harvestable_resources = list(
+        models.HarvestableResource.objects.filter(pk__in=harvestable_resource_ids).select_related("harvester")
+    )
+    prefetched_resources = {}
+    change_detection = get_setting("HARVESTING_CHANGE_DETECTION")
+    to_fetch = [
+        harvestable_resource
+        for harvestable_resource in harvestable_resources
+        if not (change_detection and _is_unchanged_since_last_harvesting(harvestable_resource))
+    ]
+    if to_fetch:
+        harvester = to_fetch[0].harvester
+        throttle = RemoteRateLimiter(harvester.remote_url).acquire()
+        if throttle:
+            logger.debug(f"Rate limit reached for {harvester.remote_url!r}, retrying in {throttle:.2f}s")
+            raise self.retry(countdown=throttle, max_retries=None)
+        remote_call_started = time.monotonic()
+        try:
+            prefetched_resources = harvester.get_harvester_worker().get_resources(to_fetch)
+        except Exception:
+            logger.exception(f"Could not fetch a batch of {len(to_fetch)} resources, fetching them one by one")
+            record_remote_call(harvester.pk, harvesting_session_id, time.monotonic() - remote_call_started, False)
+        else:
+            record_remote_call(harvester.pk, harvesting_session_id, time.monotonic() - remote_call_started, True)
+    return [
+        _perform_resource_harvesting(
+            self, harvestable_resource_id, harvesting_session_id, execution_id, prefetched_resources
+        )
+        for harvestable_resource_id in harvestable_resource_ids
+    ]
+
+
+def _perform_resource_harvesting(
+    task,
+    harvestable_resource_id: int,
+    harvesting_session_id: int,
+    execution_id: str,
+    prefetched_resources: typing.Optional[typing.Dict[int, typing.Optional[base.HarvestedResourceInfo]]] = None,
+):
+    """Harvest a single resource, unless it is known to be unchanged on the remote.
+
+    When `prefetched_resources` is given, the resources it contains are not fetched from the
+    remote again, and the task is not retried when the remote rate limit is hit - this is used
+    when harvesting batches, which would otherwise be harvested again as a whole.
+    """
     try:
         session = models.AsynchronousHarvestingSession.objects.get(pk=harvesting_session_id)
         harvestable_resource = models.HarvestableResource.objects.get(pk=harvestable_resource_id)
@@ -339,10 +420,53 @@ def _harvest_resource(self, harvestable_resource_id: int, harvesting_session_id:
 
             return
 
-        worker: base.BaseHarvesterWorker = harvestable_resource.harvester.get_harvester_worker()
-        harvested_resource_info = worker.get_resource(harvestable_resource)
+        checksum = None
+        harvested_resource_info = None
+        unchanged = get_setting("HARVESTING_CHANGE_DETECTION") and _is_unchanged_since_last_harvesting(
+            harvestable_resource
+        )
+        if not unchanged:
+            harvester = harvestable_resource.harvester
+            worker: base.BaseHarvesterWorker = harvester.get_harvester_worker()
+            if prefetched_resources is not None and harvestable_resource_id in prefetched_resources:
+                harvested_resource_info = prefetched_resources[harvestable_resource_id]
+            else:
+                throttle = RemoteRateLimiter(harvester.remote_url).acquire()
+                if throttle:
+                    logger.debug(f"Rate limit reached for {harvester.remote_url!r}, retrying in {throttle:.2f}s")
+                    if prefetched_resources is None:
+                        raise task.retry(countdown=throttle, max_retries=None)
+                    time.sleep(throttle)
+                remote_call_started = time.monotonic()
+                try:
+                    harvested_resource_info = worker.get_resource(harvestable_resource)
+                except base.RemoteResourceNotModified:
+                    unchanged = True
+                except Exception:
+                    record_remote_call(
+                        harvester.pk, harvesting_session_id, time.monotonic() - remote_call_started, False
+                    )
+                    raise
+                record_remote_call(
+                    harvester.pk,
+                    harvesting_session_id,
+                    time.monotonic() - remote_call_started,
+                    unchanged or harvested_resource_info is not None,
+                )
+            if harvested_resource_info is not None:
+                checksum = base.get_harvested_info_checksum(harvested_resource_info)
+                unchanged = (
+                    get_setting("HARVESTING_CHANGE_DETECTION")
+                    and checksum is not None
+                    and harvestable_resource.last_harvesting_succeeded is True
+                    and harvestable_resource.geonode_resource_id is not None
+                    and checksum == harvestable_resource.content_hash
+                )
 
-        if harvested_resource_info is not None:
+        if unchanged:
+            result = True
+            details = "Harvest skipped (remote resource unchanged since last harvesting)"
+        elif harvested_resource_info is not None:
 
             try:
                 worker.update_geonode_resource(
@@ -351,6 +475,11 @@ def _harvest_resource(self, harvestable_resource_id: int, harvesting_session_id:
                 )
                 result = True
                 details = "Harvest succeeded"
+                harvestable_resource.content_hash = checksum or ""
+                # batch fetches do not report the ETag of the resources, keep the one of the last harvesting
+                harvestable_resource.remote_etag = (
+                    getattr(harvested_resource_info, "etag", None) or harvestable_resource.remote_etag or ""
+                )
             except (RuntimeError, ValidationError) as exc:
                 logger.error(msg="Unable to update geonode resource")
                 result = False
@@ -358,6 +487,8 @@ def _harvest_resource(self, harvestable_resource_id: int, harvesting_session_id:
         else:
             result = False
             details = "Harvesting failed (no resource info returned)"
+        if result:
+            harvestable_resource.harvested_last_modified = harvestable_resource.remote_last_modified
 
         harvesting_message = f"{harvestable_resource.title}({harvestable_resource_id}) - {details}"
         update_asynchronous_session(
@@ -397,6 +528,9 @@ def _harvest_resource(self, harvestable_resource_id: int, harvesting_session_id:
             "details": harvesting_message,
         }
 
+    except Retry:
+        raise
+
     except Exception as exc:
         logger.error(f"Unexpected error harvesting resource {harvestable_resource_id}", exc_info=True)
 
@@ -488,6 +622,8 @@ def _finish_harvesting(self, harvesting_session_id: int, execution_id: str, forc
         log_entry = f"[{timestamp}] {message}"
         exec_req.log = (exec_req.log or "") + log_entry + "\n"
         exec_req.last_updated = now_
+        session.refresh_from_db()
+        output["metrics"] = session.get_metrics()
         exec_req.output_params = output
         exec_req.save(update_fields=["status", "log", "last_updated", "output_params"])
 
@@ -505,7 +641,9 @@ def _finish_harvesting_chunk(self, _results, harvesting_session_id: int):
     The expiration time is set dynamically when this task is scheduled,
     so the decorator does NOT specify an expires parameter.
     """
-    logger.debug(f"Chunk finished for session {harvesting_session_id} with {len(_results)} resources.")
+    # batch tasks return the list of the results of their resources
+    harvested = sum(len(result) if isinstance(result, list) else 1 for result in _results)
+    logger.debug(f"Chunk finished for session {harvesting_session_id} with {harvested} resources.")
 
 
 @app.task(
@@ -528,6 +666,10 @@ def queue_next_chunk_batch(
     Queue the next batch of chunk (group of harvestable resources)
     chords (default is 2 at a time).
 
+    The number of chunks of each batch adapts to the latency and error rate of the
+    remote calls performed while harvesting the previous one, so the remaining chunks
+    are regrouped before queueing a batch.
+
     NOTE:
     The dynamic_expiration parameter controls the dynamic expiration time for all subtasks and chords.
     """
@@ -535,6 +677,16 @@ def queue_next_chunk_batch(
     if dynamic_expiration is None:
         dynamic_expiration = 600  # fallback expiration (10 minutes)
 
+    harvester_id, harvester_type = (
+        models.AsynchronousHarvestingSession.objects.filter(pk=harvesting_session_id)
+        .values_list("harvester_id", "harvester__harvester_type")
+        .first()
+    ) or (None, None)
+    if harvester_id is not None:
+        concurrency = AdaptiveConcurrency(harvester_id).adjust()
+        remaining_chunks = [chunk for chunk_group in chunk_groups[batch_index:] for chunk in chunk_group]
+        chunk_groups = chunk_groups[:batch_index] + list(chunked(remaining_chunks, size=concurrency))
+
     if batch_index >= len(chunk_groups):
         logger.debug(f"All batches completed for session {harvesting_session_id}")
         return
@@ -547,10 +699,9 @@ def queue_next_chunk_batch(
     chords_in_batch = []
 
     for chunk in current_chunk_group:
-        resource_tasks = [
-            _harvest_resource.s(rid, harvesting_session_id, execution_id).set(expires=dynamic_expiration)
-            for rid in chunk
-        ]
+        resource_tasks = _get_harvesting_signatures(
+            harvester_type, chunk, harvesting_session_id, execution_id, dynamic_expiration
+        )
 
         chunk_finalizer = _finish_harvesting_chunk.s(harvesting_session_id).set(expires=dynamic_expiration)
         chords_in_batch.append(chord(resource_tasks, body=chunk_finalizer))
@@ -764,6 +915,9 @@ def _update_harvestable_resources_batch(self, refresh_session_id: int, page: int
                 if not created:
                     resource.title = remote_resource.title
                     resource.remote_resource_type = remote_resource.resource_type
+                remote_last_modified = base.parse_last_modified(getattr(remote_resource, "last_modified", None))
+                if remote_last_modified is not None:
+                    resource.remote_last_modified = remote_last_modified
 
                 processed += 1
                 # NOTE: make sure to save the resource because we need to have its
@@ -869,6 +1023,46 @@ def _delete_stale_harvestable_resources(harvester: models.Harvester):
         harvestable_resource.delete()
 
 
+def _get_harvesting_signatures(
+    harvester_type: typing.Optional[str],
+    harvestable_resource_ids: typing.List[int],
+    harvesting_session_id: int,
+    execution_id: str,
+    expires: int,
+) -> typing.List:
+    """Return the signatures of the tasks that harvest the input resources
+
+    Resources are harvested in batches of `HARVESTING_BATCH_SIZE` when the harvester
+    worker supports fetching them in batch, otherwise one task per resource is used.
+    """
+    batch_size = int(get_setting("HARVESTING_BATCH_SIZE") or 1)
+    if batch_size > 1 and harvester_type and getattr(import_string(harvester_type), "supports_batch_fetching", False):
+        return [
+            _harvest_resources_batch.signature((batch, harvesting_session_id, execution_id)).set(expires=expires)
+            for batch in chunked(harvestable_resource_ids, size=batch_size)
+        ]
+    return [
+        _harvest_resource.signature((rid, harvesting_session_id, execution_id)).set(expires=expires)
+        for rid in harvestable_resource_ids
+    ]
+
+
+def _is_unchanged_since_last_harvesting(harvestable_resource: models.HarvestableResource) -> bool:
+    """Check whether a resource is known to be unchanged on the remote since it was last harvested
+
+    This relies on the modification date reported by the remote when its resources were last
+    listed, so it only holds when the listing is more recent than the last harvesting.
+    """
+    return (
+        harvestable_resource.last_harvesting_succeeded is True
+        and harvestable_resource.geonode_resource_id is not None
+        and harvestable_resource.remote_last_modified is not None
+        and harvestable_resource.remote_last_modified == harvestable_resource.harvested_last_modified
+        and harvestable_resource.last_harvested is not None
+        and harvestable_resource.last_refreshed > harvestable_resource.last_harvested
+    )
+
+
 def finish_asynchronous_session(
     session_id: int,
     final_status: str,
@@ -18,18 +18,22 @@
 #########################################################################
 from unittest import mock
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import override_settings
 from django.utils.timezone import now
 from geonode.tests.base import GeoNodeBaseTestSupport
 from geonode.resource.models import ExecutionRequest
 
 from .. import (
+    concurrency,
     models,
+    resourcedescriptor,
     tasks,
 )
+from ..harvesters import base
 
 
 class TasksTestCase(GeoNodeBaseTestSupport):
@@ -738,3 +742,191 @@ class TasksTestCase(GeoNodeBaseTestSupport):
         self.assertTrue(
             any("Harvesting session monitor failed for session 1: boom" in message for message in log_cm.output)
         )
+
+    @override_settings(
+        MAX_PARALLEL_QUEUE_CHUNKS=2,
+        HARVESTING_MIN_PARALLEL_QUEUE_CHUNKS=1,
+        HARVESTING_MAX_PARALLEL_QUEUE_CHUNKS=3,
+        HARVESTING_TARGET_LATENCY=1,
+        HARVESTING_MAX_ERROR_RATE=0.1,
+        HARVESTING_CONCURRENCY_BACKOFF=0.5,
+    )
+    def test_adaptive_concurrency_increases_and_backs_off(self):
+        cache.clear()
+        controller = concurrency.AdaptiveConcurrency(self.harvester.pk)
+        self.assertEqual(controller.current, 2)
+        # nothing recorded since the last batch, concurrency is left untouched
+        self.assertEqual(controller.adjust(), 2)
+
+        concurrency.record_remote_call(self.harvester.pk, self.harvesting_session.pk, 0.2, True)
+        self.assertEqual(controller.adjust(), 3)
+        concurrency.record_remote_call(self.harvester.pk, self.harvesting_session.pk, 0.2, True)
+        self.assertEqual(controller.adjust(), 3)
+
+        concurrency.record_remote_call(self.harvester.pk, self.harvesting_session.pk, 0.2, False)
+        self.assertEqual(controller.adjust(), 1)
+        concurrency.record_remote_call(self.harvester.pk, self.harvesting_session.pk, 2, True)
+        self.assertEqual(controller.adjust(), 1)
+
+        metrics = self.harvesting_session.get_metrics()
+        self.assertEqual(metrics["remote_calls"], 4)
+        self.assertEqual(metrics["remote_errors"], 1)
+        self.assertEqual(metrics["concurrency"], 1)
+
+    @override_settings(HARVESTING_REMOTE_RATE_LIMIT=2, HARVESTING_REMOTE_BURST=2)
+    def test_remote_rate_limiter_is_shared_by_remote_host(self):
+        cache.clear()
+        with mock.patch("geonode.harvesting.concurrency.time.time", return_value=1000.5):
+            self.assertEqual(concurrency.RemoteRateLimiter("https://remote.org/catalogue").acquire(), 0)
+            self.assertEqual(concurrency.RemoteRateLimiter("https://remote.org/geoserver").acquire(), 0)
+            self.assertEqual(concurrency.RemoteRateLimiter("https://remote.org/catalogue").acquire(), 0.5)
+            self.assertEqual(concurrency.RemoteRateLimiter("https://other.org").acquire(), 0)
+
+    @mock.patch("geonode.harvesting.tasks.chord")
+    def test_queue_next_chunk_batch_regroups_chunks_by_adaptive_concurrency(self, mock_chord):
+        cache.clear()
+        cache.set(f"harvesting:concurrency:{self.harvester.pk}", 3)
+        chunk_groups = [[[1, 2], [3, 4]], [[5, 6], [7]]]
+
+        tasks.queue_next_chunk_batch(
+            chunk_groups=chunk_groups,
+            harvesting_session_id=self.harvesting_session.pk,
+            execution_id=str(uuid.uuid4()),
+            batch_index=0,
+        )
+
+        chords_in_batch = mock_chord.call_args[0][0]
+        next_batch = mock_chord.call_args[1]["body"]
+        self.assertEqual(len(chords_in_batch), 3)
+        self.assertEqual(next_batch.args[0], [[[1, 2], [3, 4], [5, 6]], [[7]]])
+
+    @mock.patch("geonode.harvesting.tasks.update_asynchronous_session")
+    @mock.patch("geonode.resource.models.ExecutionRequest.objects.get")
+    @mock.patch("geonode.harvesting.tasks.models.AsynchronousHarvestingSession.objects.get")
+    @mock.patch("geonode.harvesting.tasks.models.HarvestableResource.objects.get")
+    def test_harvest_resource_skips_update_when_remote_resource_not_modified(
+        self, mock_get_resource, mock_get_session, mock_get_exec_req, mock_update_asynchronous_session
+    ):
+        mock_session = mock.MagicMock()
+        mock_session.status = "running"
+        mock_session.STATUS_ABORTING = "aborting"
+        mock_get_session.return_value = mock_session
+        mock_get_exec_req.return_value = mock.MagicMock(output_params={})
+
+        mock_worker = mock.MagicMock()
+        mock_worker.get_resource.side_effect = base.RemoteResourceNotModified("fake url")
+        mock_resource = mock.MagicMock()
+        mock_resource.title = "Fake Title"
+        mock_resource.harvester.get_harvester_worker.return_value = mock_worker
+        mock_get_resource.return_value = mock_resource
+
+        result = tasks._harvest_resource(123, mock_session.pk, str(uuid.uuid4()))
+
+        mock_worker.get_resource.assert_called_once_with(mock_resource)
+        mock_worker.update_geonode_resource.assert_not_called()
+        self.assertEqual(result["status"], "success")
+        self.assertIn("unchanged", result["details"])
+        self.assertEqual(mock_resource.harvested_last_modified, mock_resource.remote_last_modified)
+
+    def test_is_unchanged_since_last_harvesting(self):
+        last_modified = now() - timedelta(days=2)
+        harvestable_resource = models.HarvestableResource(
+            unique_identifier="unchanged-identifier",
+            title="unchanged",
+            harvester=self.harvester,
+            geonode_resource_id=1,
+            last_harvesting_succeeded=True,
+            remote_last_modified=last_modified,
+            harvested_last_modified=last_modified,
+            last_harvested=now() - timedelta(days=1),
+            last_refreshed=now(),
+        )
+        self.assertTrue(tasks._is_unchanged_since_last_harvesting(harvestable_resource))
+
+        # the remote resource has been modified since it was harvested
+        harvestable_resource.remote_last_modified = now() - timedelta(hours=1)
+        self.assertFalse(tasks._is_unchanged_since_last_harvesting(harvestable_resource))
+
+        # the list of remote resources has not been refreshed since the last harvesting
+        harvestable_resource.remote_last_modified = last_modified
+        harvestable_resource.last_refreshed = now() - timedelta(days=3)
+        self.assertFalse(tasks._is_unchanged_since_last_harvesting(harvestable_resource))
+
+    def test_conditional_request_headers_follow_change_detection(self):
+        harvestable_resource = models.HarvestableResource(
+            unique_identifier="conditional-identifier",
+            title="conditional",
+            harvester=self.harvester,
+            geonode_resource_id=1,
+            last_harvesting_succeeded=True,
+            remote_etag='"abc"',
+            harvested_last_modified=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        )
+        worker = self.harvester.get_harvester_worker()
+        with override_settings(HARVESTING_CHANGE_DETECTION=True):
+            self.assertDictEqual(
+                worker.get_conditional_request_headers(harvestable_resource),
+                {"If-None-Match": '"abc"', "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT"},
+            )
+        # with the change detection off, the resources are always fetched and updated
+        with override_settings(HARVESTING_CHANGE_DETECTION=False):
+            self.assertDictEqual(worker.get_conditional_request_headers(harvestable_resource), {})
+
+    def test_harvested_info_checksum_detects_changes(self):
+        descriptor = resourcedescriptor.RecordDescription(
+            uuid=uuid.UUID("00000000-0000-0000-0000-000000000001"),
+            date_stamp=datetime(2025, 1, 1),
+            identification=resourcedescriptor.RecordIdentification(
+                name="name", title="title", date=datetime(2025, 1, 1), date_type="creation"
+            ),
+            distribution=resourcedescriptor.RecordDistribution(),
+        )
+        checksum = base.get_harvested_info_checksum(base.HarvestedResourceInfo(descriptor, None))
+        self.assertEqual(checksum, base.get_harvested_info_checksum(base.HarvestedResourceInfo(descriptor, None)))
+
+        descriptor.identification.title = "changed title"
+        self.assertNotEqual(checksum, base.get_harvested_info_checksum(base.HarvestedResourceInfo(descriptor, None)))
+        self.assertIsNone(base.get_harvested_info_checksum("fake_gotten_resource"))
+
+    @override_settings(HARVESTING_BATCH_SIZE=2)
+    def test_get_harvesting_signatures_batches_resources_when_worker_supports_it(self):
+        batch_signatures = tasks._get_harvesting_signatures(
+            "geonode.harvesting.harvesters.geonodeharvester.GeonodeUnifiedHarvesterWorker",
+            [1, 2, 3],
+            self.harvesting_session.pk,
+            "fake-execution-id",
+            600,
+        )
+        self.assertEqual([signature.args[0] for signature in batch_signatures], [[1, 2], [3]])
+        self.assertTrue(all(signature.task == tasks._harvest_resources_batch.name for signature in batch_signatures))
+
+        single_signatures = tasks._get_harvesting_signatures(
+            "geonode.harvesting.harvesters.wms.OgcWmsHarvester",
+            [1, 2, 3],
+            self.harvesting_session.pk,
+            "fake-execution-id",
+            600,
+        )
+        self.assertEqual([signature.args[0] for signature in single_signatures], [1, 2, 3])
+
+    @mock.patch("geonode.harvesting.tasks.update_asynchronous_session")
+    @mock.patch("geonode.harvesting.models.Harvester.get_harvester_worker")
+    def test_harvest_resources_batch_uses_prefetched_resources(self, mock_get_worker, mock_update_session):
+        exec_req = ExecutionRequest.objects.create(exec_id=uuid.uuid4(), status="running", log="", output_params={})
+        harvestable_resources = list(models.HarvestableResource.objects.filter(harvester=self.harvester))
+        mock_worker = mock.MagicMock()
+        mock_worker.get_resources.return_value = {
+            harvestable_resource.pk: "fake_gotten_resource" for harvestable_resource in harvestable_resources
+        }
+        mock_get_worker.return_value = mock_worker
+
+        results = tasks._harvest_resources_batch(
+            [harvestable_resource.pk for harvestable_resource in harvestable_resources],
+            self.harvesting_session.pk,
+            str(exec_req.exec_id),
+        )
+
+        mock_worker.get_resources.assert_called_once()
+        mock_worker.get_resource.assert_not_called()
+        self.assertEqual(mock_worker.update_geonode_resource.call_count, len(harvestable_resources))
+        self.assertEqual([result["status"] for result in results], ["success"] * len(harvestable_resources))
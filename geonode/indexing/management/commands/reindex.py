@@ -19,7 +19,9 @@
 #########################################################################
 
 import logging
+import time
 
+from celery import group
 from django.core.management.base import BaseCommand
 
 from geonode.base.management import command_utils
@@ -58,6 +60,23 @@ class Command(BaseCommand):
             dest="debug",
             action='store_true',
             help="Set log level to debug")
+        parser.add_argument(
+            '-b',
+            '--bulk',
+            dest="bulk",
+            action='store_true',
+            help="Rebuild the indexes in bulk, many resources per statement")
+        parser.add_argument(
+            '--batch-size',
+            dest="batch_size",
+            type=int,
+            default=500,
+            help="Number of resources processed per batch in bulk mode (default: 500)")
+        parser.add_argument(
+            '--parallel',
+            dest="parallel",
+            action='store_true',
+            help="In bulk mode, dispatch the batches as parallel celery tasks")
 
     def handle(self, **options):
         requested_uuids = options.get('uuid')
@@ -79,6 +98,12 @@ class Command(BaseCommand):
         qs_resources = ResourceBase.objects
         tot = qs_resources.count()
         logger.info(f"Total resources in GeoNode: {tot}")
+
+        if options.get("bulk"):
+            if requested_uuids:
+                qs_resources = qs_resources.filter(uuid__in=requested_uuids)
+            self.handle_bulk(qs_resources, options.get("batch_size"), options.get("parallel"), dry_run)
+            return
         i = 0
         cnt_ok = 0
         cnt_bad = 0
@@ -115,3 +140,43 @@ class Command(BaseCommand):
         logger.info(f"- Index regenerated : {cnt_ok}")
         logger.info(f"- Errors            : {cnt_bad}")
         logger.info(f"- Resources skipped : {cnt_skip}")
+
+    def handle_bulk(self, qs_resources, batch_size, parallel, dry_run):
+        from geonode.indexing.tasks import bulk_reindex_resources
+
+        resource_ids = list(qs_resources.order_by("id").values_list("id", flat=True))
+        tot = len(resource_ids)
+        batches = [resource_ids[i : i + batch_size] for i in range(0, tot, batch_size)]
+        logger.info(f"Bulk reindexing {tot} resources in {len(batches)} batches of {batch_size}")
+        if dry_run:
+            logger.info("Work completed [DRYRUN]")
+            return
+
+        start = time.monotonic()
+        cnt_ok = 0
+        failed = []
+        if parallel:
+            results = group(bulk_reindex_resources.s(batch) for batch in batches).apply_async().get(
+                disable_sync_subtasks=False
+            )
+            for result in results:
+                cnt_ok += result["ok"]
+                failed.extend(result["failed"])
+        else:
+            for i, batch in enumerate(batches, start=1):
+                ok, batch_failed = index_manager.bulk_reindex(ResourceBase.objects.filter(id__in=batch))
+                cnt_ok += ok
+                failed.extend(batch_failed)
+                elapsed = time.monotonic() - start
+                logger.info(
+                    f"- Batch {i}/{len(batches)}: {cnt_ok + len(failed)}/{tot} resources "
+                    f"({(cnt_ok + len(failed)) / elapsed:.1f} res/s)"
+                )
+
+        elapsed = time.monotonic() - start
+        logger.info("Work completed")
+        logger.info(f"- Index regenerated : {cnt_ok}")
+        logger.info(f"- Errors            : {len(failed)}")
+        logger.info(f"- Elapsed           : {elapsed:.1f}s ({(cnt_ok / elapsed) if elapsed else 0:.1f} res/s)")
+        if failed:
+            logger.warning(f"Index couldn't be regenerated for resources {failed}")
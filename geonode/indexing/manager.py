@@ -1,5 +1,7 @@
+import hashlib
 import logging
 
+from django.db import connection, transaction
 from django.db.models import Func, Value
 from django.conf import settings
 
@@ -8,6 +10,9 @@ import geonode.metadata.multilang.utils as multi
 
 logger = logging.getLogger(__name__)
 
+# max number of index entries written by a single statement in bulk mode
+BULK_PAGE_SIZE = 1000
+
 
 class TSVectorIndexManager:
 
@@ -44,58 +49,127 @@ class TSVectorIndexManager:
 
         return non_ml_fields, ml_fields
 
-    def update_index(self, resource_id, jsoninstance: dict):
-
+    def _build_index_entries(self, jsoninstance: dict):
+        """
+        Return the (index name, lang, text) entries to be indexed for the given instance.
+        lang is None for non localized indexes.
+        """
         non_ml_fields, ml_fields = self._gather_fields_values(jsoninstance)
+        entries = []
 
         # 3rd loop: create indexes
         for index_name, index_fields in settings.METADATA_INDEXES.items():
 
             if all(field in non_ml_fields for field in index_fields):
                 # this index is not localized
-                pg_lang = multi.get_pg_language(None)
-                logger.debug(
-                    f"Creating non localized index - resource:{resource_id} index name:{index_name} default lang:{pg_lang}"
-                )
                 index_text = " ".join(filter(None, (str(non_ml_fields[f]) for f in index_fields)))
-                vector = Func(
-                    Value(index_text), function="to_tsvector", template=f"%(function)s('{pg_lang}', %(expressions)s)"
-                )
-
-                ResourceIndex.objects.update_or_create(
-                    defaults={"vector": vector}, resource_id=resource_id, lang=None, name=index_name
-                )
-                # remove all localized indexes if any
-                ResourceIndex.objects.filter(
-                    resource_id=resource_id,
-                    lang__isnull=False,
-                    name=index_name,
-                ).delete()
+                entries.append((index_name, None, index_text))
 
             else:  # some indexed fields are multilang
                 # gather all non localized fields
                 non_ml_text = " ".join(filter(None, (non_ml_fields[f] for f in index_fields if f in non_ml_fields)))
 
                 for lang in self.LANGUAGES:
-                    logger.debug(f"Creating localized index {index_name} for resource {resource_id}")
-
                     ml_text = " ".join(filter(None, (ml_fields[f][lang] for f in index_fields if f in ml_fields)))
-                    vector = Func(
-                        Value(" ".join(filter(None, [ml_text, non_ml_text]))),
-                        function="to_tsvector",
-                        template=f"%(function)s('{multi.get_pg_language(lang)}', %(expressions)s)",
-                    )
+                    entries.append((index_name, lang, " ".join(filter(None, [ml_text, non_ml_text]))))
 
-                    ResourceIndex.objects.update_or_create(
-                        resource_id=resource_id, lang=lang, name=index_name, defaults={"vector": vector}
-                    )
+        return entries
+
+    @staticmethod
+    def _hash_entry(pg_lang, index_text):
+        """
+        Return the digest of the text of an index entry, used to detect unchanged entries.
+        The postgres language is part of the digest since it affects the resulting vector.
+        """
+        return hashlib.sha256(f"{pg_lang}|{index_text}".encode("utf-8")).hexdigest()
 
-                # remove all non-localized indexes entries
-                ResourceIndex.objects.filter(
-                    resource_id=resource_id,
-                    lang__isnull=True,
-                    name=index_name,
-                ).delete()
+    def update_index(self, resource_id, jsoninstance: dict):
+        entries = self._build_index_entries(jsoninstance)
+
+        # the hash of the stored entries, to skip writing the ones that did not change
+        existing = {
+            (name, lang): text_hash
+            for name, lang, text_hash in ResourceIndex.objects.filter(resource_id=resource_id).values_list(
+                "name", "lang", "text_hash"
+            )
+        }
+
+        for index_name, lang, index_text in entries:
+            pg_lang = multi.get_pg_language(lang)
+            text_hash = self._hash_entry(pg_lang, index_text)
+            if existing.get((index_name, lang)) == text_hash:
+                logger.debug(f"Skipping unchanged index - resource:{resource_id} index name:{index_name} lang:{lang}")
+                continue
+
+            logger.debug(f"Creating index - resource:{resource_id} index name:{index_name} lang:{lang} pg:{pg_lang}")
+            vector = Func(
+                Value(index_text), function="to_tsvector", template=f"%(function)s('{pg_lang}', %(expressions)s)"
+            )
+            ResourceIndex.objects.update_or_create(
+                resource_id=resource_id, lang=lang, name=index_name, defaults={"vector": vector, "text_hash": text_hash}
+            )
+
+        # remove the localized entries of non localized indexes and vice versa
+        non_localized = {index_name for index_name, lang, _ in entries if lang is None}
+        localized = {index_name for index_name, lang, _ in entries if lang is not None}
+        if any(lang is not None and name in non_localized for name, lang in existing):
+            ResourceIndex.objects.filter(resource_id=resource_id, lang__isnull=False, name__in=non_localized).delete()
+        if any(lang is None and name in localized for name, lang in existing):
+            ResourceIndex.objects.filter(resource_id=resource_id, lang__isnull=True, name__in=localized).delete()
+
+    def bulk_update_index(self, jsoninstances: dict, page_size=BULK_PAGE_SIZE):
+        """
+        Rebuild the indexes of many resources at once.
+
+        :param jsoninstances: a dict mapping resource ids to their metadata json instances
+        :param page_size: max number of index entries written by a single INSERT statement
+        :return: the number of index entries written
+
+        Vectors are computed server side by to_tsvector, so each page of entries costs a single statement.
+        Stale entries of the given resources are removed in the same transaction.
+        """
+        rows = []
+        for resource_id, jsoninstance in jsoninstances.items():
+            for index_name, lang, index_text in self._build_index_entries(jsoninstance):
+                pg_lang = multi.get_pg_language(lang)
+                rows.append((resource_id, lang, index_name, self._hash_entry(pg_lang, index_text), pg_lang, index_text))
+
+        table = connection.ops.quote_name(ResourceIndex._meta.db_table)
+        with transaction.atomic():
+            ResourceIndex.objects.filter(resource_id__in=list(jsoninstances.keys())).delete()
+            with connection.cursor() as cursor:
+                for start in range(0, len(rows), page_size):
+                    page = rows[start : start + page_size]
+                    placeholders = ", ".join(["(%s, %s, %s, %s, to_tsvector(%s::regconfig, %s))"] * len(page))
+                    cursor.execute(
+                        f"INSERT INTO {table} (resource_id, lang, name, text_hash, vector) VALUES {placeholders} "
+                        "ON CONFLICT (resource_id, lang, name) "
+                        "DO UPDATE SET vector = EXCLUDED.vector, text_hash = EXCLUDED.text_hash",
+                        [param for row in page for param in row],
+                    )
+        return len(rows)
+
+    def bulk_reindex(self, resources):
+        """
+        Build the metadata instances of the given resources and rebuild their indexes in bulk.
+        Resources whose metadata instance cannot be built are skipped.
+
+        :return: a tuple (number of reindexed resources, list of failed resource ids)
+        """
+        from geonode.metadata.manager import metadata_manager
+
+        jsoninstances = {}
+        failed = []
+        for resource in resources:
+            try:
+                jsoninstances[resource.id] = metadata_manager.build_schema_instance(resource)
+            except Exception as e:
+                logger.error(f"Error building metadata instance for resource {resource.id}: {e}", exc_info=e)
+                failed.append(resource.id)
+
+        if jsoninstances:
+            self.bulk_update_index(jsoninstances)
+        return len(jsoninstances), failed
 
 
 index_manager = TSVectorIndexManager()
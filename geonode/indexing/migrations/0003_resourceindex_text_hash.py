@@ -0,0 +1,37 @@
+import logging
+
+from django.db import migrations, models
+from django.core.management import call_command
+
+logger = logging.getLogger(__name__)
+
+
+def run_reindex_if_missing(apps, schema_editor):
+    # 0002_reindex runs the command against the current models, which needs the text_hash column:
+    # make sure the indexes are populated when upgrading from a database without any index entry
+    ResourceBase = apps.get_model("base", "ResourceBase")
+    ResourceIndex = apps.get_model("indexing", "ResourceIndex")
+    if ResourceIndex.objects.exists() or not ResourceBase.objects.exists():
+        return
+    try:
+        logger.info("Running reindex migration to populate search indexes...")
+        call_command("reindex")
+        logger.info("Reindex migration completed successfully.")
+    except Exception as e:
+        logger.error(f"Reindex migration failed: {e}", exc_info=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("indexing", "0002_reindex"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="resourceindex",
+            name="text_hash",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.RunPython(run_reindex_if_missing, migrations.RunPython.noop),
+    ]
@@ -14,6 +14,8 @@ class ResourceIndex(models.Model):
     lang = models.CharField(max_length=16, null=True, blank=False)
     name = models.CharField(max_length=64, null=False, blank=False)
     vector = SearchVectorField(null=False, blank=False)
+    # digest of the indexed text, used to skip rewriting unchanged entries
+    text_hash = models.CharField(max_length=64, null=True, blank=True)
 
     def __str__(self):
         return f"{self.lang}|{self.name}"
@@ -0,0 +1,46 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+"""celery tasks for geonode.indexing."""
+from celery.utils.log import get_task_logger
+
+from geonode.base.models import ResourceBase
+from geonode.celery_app import app
+from geonode.indexing.manager import index_manager
+
+logger = get_task_logger(__name__)
+
+
+@app.task(
+    bind=True,
+    name="geonode.indexing.tasks.bulk_reindex_resources",
+    queue="update",
+    time_limit=3600,
+    acks_late=False,
+    ignore_result=False,
+)
+def bulk_reindex_resources(self, resource_ids):
+    """
+    Rebuilds the search indexes of a chunk of resources in bulk.
+    Returns a dict with the number of reindexed resources and the ids of the failed ones.
+    """
+    resources = ResourceBase.objects.filter(id__in=resource_ids)
+    cnt_ok, failed = index_manager.bulk_reindex(resources)
+    logger.debug(f"Reindexed {cnt_ok} resources, {len(failed)} failures")
+    return {"ok": cnt_ok, "failed": failed}
@@ -24,7 +24,9 @@ from unittest.mock import patch, ANY
 from django.test import override_settings
 
 from geonode.base.i18n import i18nCache
+from geonode.base.populate_test_data import create_single_doc
 from geonode.indexing.manager import TSVectorIndexManager
+from geonode.indexing.models import ResourceIndex
 from geonode.tests.base import GeoNodeBaseTestSupport
 
 
@@ -200,6 +202,66 @@ class IndexingTests(GeoNodeBaseTestSupport):
 
             self._run_index_test(instance, mock_uoc, expected_calls)
 
+    def test_bulk_update_index(self):
+        """
+        Bulk indexing should write the same entries as the single resource indexing
+        """
+        with override_settings(
+            LANGUAGE_CODE="en",
+            LANGUAGES=[("en", "English"), ("it", "Italiano")],
+            MULTILANG_FIELDS=["title"],
+            METADATA_INDEXES={
+                "idx1": ["title"],
+                "idx2": ["f2"],
+            },
+        ):
+            doc1 = create_single_doc("bulk_index_doc1")
+            doc2 = create_single_doc("bulk_index_doc2")
+            im = TSVectorIndexManager()
+            # stale entry to be replaced
+            im.update_index(doc1.id, {"title": "Stale"})
+
+            written = im.bulk_update_index(
+                {
+                    doc1.id: {"title": "Base", "title_multilang_en": "TheTitle", "title_multilang_it": "IlTitolo"},
+                    doc2.id: {"title": "Base2", "f2": "data2"},
+                },
+                page_size=3,
+            )
+
+            self.assertEqual(6, written)
+            self.assertSetEqual(
+                {("en", "idx1"), ("it", "idx1"), (None, "idx2")},
+                set(ResourceIndex.objects.filter(resource_id=doc1.id).values_list("lang", "name")),
+            )
+            self.assertEqual(3, ResourceIndex.objects.filter(resource_id=doc2.id).count())
+
+    def test_unchanged_entries_are_skipped(self):
+        """
+        Entries whose text did not change should not be rewritten
+        """
+        with override_settings(
+            LANGUAGE_CODE="en",
+            LANGUAGES=[("en", "English"), ("it", "Italiano")],
+            MULTILANG_FIELDS=["title"],
+            METADATA_INDEXES={
+                "idx1": ["title"],
+                "idx2": ["f2"],
+            },
+        ):
+            doc = create_single_doc("hash_index_doc")
+            im = TSVectorIndexManager()
+            instance = {"title": "Base", "title_multilang_en": "TheTitle", "title_multilang_it": "IlTitolo", "f2": "v2"}
+            im.update_index(doc.id, instance)
+            self.assertEqual(3, ResourceIndex.objects.filter(resource_id=doc.id, text_hash__isnull=False).count())
+
+            with patch("geonode.indexing.models.ResourceIndex.objects.update_or_create") as mock_uoc:
+                im.update_index(doc.id, instance)
+                mock_uoc.assert_not_called()
+
+                im.update_index(doc.id, {**instance, "title_multilang_it": "NuovoTitolo"})
+                mock_uoc.assert_called_once_with(resource_id=doc.id, lang="it", name="idx1", defaults=ANY)
+
     def _run_index_test(self, instance, mock_uoc, expected_calls):
         """
         Test the calls to update_or_create
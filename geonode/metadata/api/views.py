@@ -16,6 +16,7 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 #########################################################################
+import json
 import logging
 
 from dal import autocomplete
@@ -26,7 +27,8 @@ from rest_framework.response import Response
 
 from django.contrib.auth import get_user_model
 from django.core.handlers.wsgi import WSGIRequest
-from django.http import JsonResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
 from django.utils.translation.trans_real import get_language_from_request
 from django.utils.translation import get_language, gettext as _
 from django.db.models import Q
@@ -63,6 +65,7 @@ class MetadataViewSet(ViewSet):
             {
                 "schema": f"{base}/schema/",
                 "instance": f"{base}/instance/<pk>/",
+                "export": f"{base}/export/",
             }
         )
 
@@ -80,6 +83,20 @@ class MetadataViewSet(ViewSet):
             response = {"Message": "Schema not found"}
             return Response(response)
 
+    # Export the JSON schema instances of the resources visible to the user, as newline delimited JSON
+    @action(detail=False, methods=["get"], url_path="export", url_name="export")
+    def export(self, request):
+        lang = request.query_params.get("lang", get_language_from_request(request)[:2])
+        resources = permissions_registry.get_resources_with_perms(request.user).order_by("pk")
+        if ids := request.query_params.getlist("id"):
+            resources = resources.filter(pk__in=ids)
+
+        def _stream():
+            for resource, instance in metadata_manager.build_schema_instances(resources.iterator(), lang):
+                yield json.dumps({"id": str(resource.pk), "instance": instance}, cls=DjangoJSONEncoder) + "\n"
+
+        return StreamingHttpResponse(_stream(), content_type="application/x-ndjson")
+
     # Handle the JSON schema instance
     @action(
         detail=False,
@@ -1,6 +1,10 @@
 import logging
 
 from django.apps import AppConfig
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import transaction
+from django.db.models.signals import post_save
 from django.utils.module_loading import import_string
 
 logger = logging.getLogger(__name__)
@@ -18,6 +22,7 @@ class MetadataConfig(AppConfig):
 
 def run_setup_hooks(*args, **kwargs):
     setup_metadata_handlers()
+    setup_schema_warmup()
 
 
 def setup_metadata_handlers():
@@ -33,3 +38,34 @@ def setup_metadata_handlers():
     metadata_manager.post_init()
 
     logger.info(f"Metadata handlers from config: {', '.join(METADATA_HANDLERS)}")
+
+
+def setup_schema_warmup():
+    """
+    Precompile the metadata schemas in the background, so that the first editor request
+    for each language does not have to build them.
+    The warmup runs when the first request is served and after each update of the i18n thesaurus.
+    """
+    if not getattr(settings, "METADATA_SCHEMA_WARMUP", False):
+        return
+
+    from geonode.base.models import Thesaurus
+
+    request_started.connect(warmup_on_first_request, dispatch_uid="metadata_schema_warmup_start")
+    post_save.connect(warmup_on_thesaurus_update, sender=Thesaurus, dispatch_uid="metadata_schema_warmup_thesaurus")
+
+
+def warmup_on_first_request(sender, **kwargs):
+    from geonode.metadata.manager import metadata_manager
+
+    request_started.disconnect(dispatch_uid="metadata_schema_warmup_start")
+    metadata_manager.warmup_in_background()
+
+
+def warmup_on_thesaurus_update(sender, instance, **kwargs):
+    from geonode.base.i18n import I18N_THESAURUS_IDENTIFIER
+    from geonode.metadata.manager import metadata_manager
+
+    # the i18n thesaurus date is updated by the base signals, the schemas are recompiled only after it
+    if instance.identifier == I18N_THESAURUS_IDENTIFIER and getattr(instance, "_signal_handled", False):
+        transaction.on_commit(metadata_manager.warmup_in_background)
@@ -93,6 +93,13 @@ class MetadataHandler(metaclass=ABCMeta):
         """
         pass
 
+    def load_bulk_serialization_context(self, resources: list, jsonschema: dict, context: dict):
+        """
+        Called once before serializing a batch of resources, in order to preload the info needed by the handler
+        for the whole batch. The context is then shared by the serialization of each resource in the batch.
+        """
+        pass
+
     def post_serialization(self, resource: ResourceBase, jsonschema: dict, instance: dict, context: dict):
         """
         Called after calls to get_jsonschema_instance in order to fixup instance values
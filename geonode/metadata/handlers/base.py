@@ -22,6 +22,7 @@ import logging
 from datetime import datetime
 
 from rest_framework.reverse import reverse
+from django.db.models import prefetch_related_objects
 from django.utils.translation import gettext as _
 
 from geonode.base.models import TopicCategory, License, RestrictionCodeType, SpatialRepresentationType
@@ -206,6 +207,11 @@ class BaseHandler(MetadataHandler):
 
         return jsonschema
 
+    def load_bulk_serialization_context(self, resources, jsonschema: dict, context: dict):
+        prefetch_related_objects(
+            resources, "category", "license", "restriction_code_type", "spatial_representation_type"
+        )
+
     def get_jsonschema_instance(self, resource, field_name, context, errors, lang=None):
         field_value = getattr(resource, field_name)
 
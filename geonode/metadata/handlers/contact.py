@@ -22,9 +22,11 @@ from rest_framework.reverse import reverse
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db.models import prefetch_related_objects
 from django.utils.translation import gettext as _
 
 from geonode.base.i18n import labelResolver
+from geonode.base.models import ContactRole
 from geonode.metadata.handlers.abstract import MetadataHandler
 from geonode.people import Roles
 from geonode.resource.registry import resource_manager_registry
@@ -48,6 +50,8 @@ ROLE_NAMES_MAP = {
 
 NAMES_ROLE_MAP = {v: k for k, v in ROLE_NAMES_MAP.items()}
 
+CONTEXT_ID = "contacts"
+
 
 class ContactHandler(MetadataHandler):
     """
@@ -119,19 +123,31 @@ class ContactHandler(MetadataHandler):
 
         return jsonschema
 
+    def load_bulk_serialization_context(self, resources, jsonschema: dict, context: dict):
+        prefetch_related_objects(resources, "owner")
+        contacts = {}
+        for contact_role in ContactRole.objects.filter(resource__in=resources).select_related("contact"):
+            contacts.setdefault((contact_role.resource_id, contact_role.role), []).append(contact_role.contact)
+        context[CONTEXT_ID] = contacts
+
     def get_jsonschema_instance(self, resource, field_name, context, errors, lang=None):
         def __create_user_entry(user):
             names = [n for n in (user.first_name, user.last_name) if n]
             postfix = f" ({' '.join(names)})" if names else ""
             return {"id": str(user.id), "label": f"{user.username}{postfix}"}
 
+        def _get_role_contacts(rolename):
+            if CONTEXT_ID in context:
+                return context[CONTEXT_ID].get((resource.id, rolename), [])
+            return resource.__get_contact_role_elements__(rolename)
+
         contacts = {}
         for role in Roles:
             rolename = ROLE_NAMES_MAP[role]
             if role.is_multivalue:
-                content = [__create_user_entry(user) for user in resource.__get_contact_role_elements__(rolename) or []]
+                content = [__create_user_entry(user) for user in _get_role_contacts(rolename) or []]
             else:
-                users = resource.__get_contact_role_elements__(rolename)
+                users = _get_role_contacts(rolename)
                 if not users and role == Roles.OWNER:
                     users = [resource.owner]
                 content = __create_user_entry(users[0]) if users else None
@@ -20,6 +20,7 @@
 import logging
 from rest_framework.reverse import reverse
 
+from django.db.models import prefetch_related_objects
 from django.utils.translation import gettext as _
 
 from geonode.metadata.handlers.abstract import MetadataHandler
@@ -51,6 +52,9 @@ class HKeywordHandler(MetadataHandler):
         self._add_subschema(jsonschema, "hkeywords", subschema, after_what="tkeywords")
         return jsonschema
 
+    def load_bulk_serialization_context(self, resources, jsonschema: dict, context: dict):
+        prefetch_related_objects(resources, "keywords")
+
     def get_jsonschema_instance(self, resource, field_name, context, errors, lang=None):
         return [keyword.name for keyword in resource.keywords.all()]
 
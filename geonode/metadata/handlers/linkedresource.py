@@ -27,6 +27,8 @@ from geonode.metadata.handlers.abstract import MetadataHandler
 
 logger = logging.getLogger(__name__)
 
+CONTEXT_ID = "linkedresources"
+
 
 class LinkedResourceHandler(MetadataHandler):
 
@@ -51,8 +53,19 @@ class LinkedResourceHandler(MetadataHandler):
         jsonschema["properties"]["linkedresources"] = linked
         return jsonschema
 
+    def load_bulk_serialization_context(self, resources, jsonschema: dict, context: dict):
+        linked = {}
+        for lr in LinkedResource.objects.filter(source__in=resources).select_related("target"):
+            linked.setdefault(lr.source_id, []).append(lr)
+        context[CONTEXT_ID] = linked
+
     def get_jsonschema_instance(self, resource, field_name, context, errors, lang=None):
-        return [{"id": str(lr.target.id), "label": lr.target.title} for lr in resource.get_linked_resources()]
+        # subclasses may add further linked resources, the preloaded ones are only the stored ones
+        if CONTEXT_ID in context and type(resource).get_linked_resources is ResourceBase.get_linked_resources:
+            linked_resources = context[CONTEXT_ID].get(resource.id, [])
+        else:
+            linked_resources = resource.get_linked_resources()
+        return [{"id": str(lr.target.id), "label": lr.target.title} for lr in linked_resources]
 
     def update_resource(self, resource, field_name, json_instance, context, errors, **kwargs):
         data = json_instance[field_name]
@@ -20,6 +20,7 @@
 import logging
 from rest_framework.reverse import reverse
 
+from django.db.models import prefetch_related_objects
 from django.utils.translation import gettext as _
 
 from geonode.base.models import Region
@@ -57,6 +58,9 @@ class RegionHandler(MetadataHandler):
 
         return jsonschema
 
+    def load_bulk_serialization_context(self, resources, jsonschema: dict, context: dict):
+        prefetch_related_objects(resources, "regions")
+
     def get_jsonschema_instance(self, resource, field_name, context, errors, lang=None):
         return [{"id": str(r.id), "label": r.name} for r in resource.regions.all()]
 
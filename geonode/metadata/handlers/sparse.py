@@ -31,6 +31,7 @@ from geonode.base.i18n import get_localized_tkeywords, labelResolver
 logger = logging.getLogger(__name__)
 
 CONTEXT_ID = "sparse"
+BULK_CONTEXT_ID = "sparse_bulk"
 
 
 class SparseFieldRegistry:
@@ -123,10 +124,21 @@ class SparseHandler(MetadataHandler):
 
         return jsonschema
 
+    def load_bulk_serialization_context(self, resources, jsonschema: dict, context: dict):
+        logger.debug(f"Preloading sparse fields {self.registry.fields().keys()} for {len(resources)} resources")
+        fields = {}
+        for f in SparseField.objects.filter(resource__in=resources, name__in=self.registry.fields().keys()):
+            fields.setdefault(f.resource_id, {})[f.name] = f.value
+        context[BULK_CONTEXT_ID] = fields
+
     def load_serialization_context(self, resource, jsonschema: dict, context: dict):
-        logger.debug(f"Preloading sparse fields {self.registry.fields().keys()}")
+        if BULK_CONTEXT_ID in context:
+            fields = dict(context[BULK_CONTEXT_ID].get(resource.id, {}))
+        else:
+            logger.debug(f"Preloading sparse fields {self.registry.fields().keys()}")
+            fields = {f.name: f.value for f in SparseField.get_fields(resource, names=self.registry.fields().keys())}
         context[CONTEXT_ID] = {
-            "fields": {f.name: f.value for f in SparseField.get_fields(resource, names=self.registry.fields().keys())},
+            "fields": fields,
             "schema": jsonschema,
         }
 
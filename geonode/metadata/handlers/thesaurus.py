@@ -21,7 +21,7 @@ import logging
 
 from rest_framework.reverse import reverse
 
-from django.db.models import Q
+from django.db.models import Prefetch, Q, prefetch_related_objects
 from django.utils.translation import gettext as _
 
 from geonode.base.models import Thesaurus, ThesaurusKeyword, ThesaurusKeywordLabel
@@ -32,6 +32,7 @@ logger = logging.getLogger(__name__)
 
 
 TKEYWORDS = "tkeywords"
+CONTEXT_ID = "tkeywords_labels"
 
 
 class TKeywordsHandler(MetadataHandler):
@@ -137,13 +138,29 @@ class TKeywordsHandler(MetadataHandler):
 
         return jsonschema
 
+    def load_bulk_serialization_context(self, resources, jsonschema: dict, context: dict):
+        prefetch_related_objects(
+            resources, Prefetch("tkeywords", queryset=ThesaurusKeyword.objects.select_related("thesaurus"))
+        )
+        keyword_ids = {tk.id for resource in resources for tk in resource.tkeywords.all()}
+        # read the labels of all the keywords in the batch in a single query
+        context[CONTEXT_ID] = {
+            tkl.keyword_id: tkl
+            for tkl in ThesaurusKeywordLabel.objects.filter(
+                keyword__id__in=keyword_ids, lang=context.get("lang", None)
+            ).select_related("keyword__thesaurus")
+        }
+
     def get_jsonschema_instance(self, resource, field_name, context, errors, lang=None):
         tks = {}
         for tk in resource.tkeywords.all():
             tks[tk.id] = tk
-        tkls = ThesaurusKeywordLabel.objects.filter(
-            keyword__id__in=tks.keys(), lang=lang
-        )  # read all entries in a single query
+        if CONTEXT_ID in context:
+            tkls = [context[CONTEXT_ID][tk_id] for tk_id in tks.keys() if tk_id in context[CONTEXT_ID]]
+        else:
+            tkls = ThesaurusKeywordLabel.objects.filter(
+                keyword__id__in=tks.keys(), lang=lang
+            )  # read all entries in a single query
 
         ret = {}
         for tkl in tkls:
@@ -19,8 +19,15 @@
 
 import logging
 import copy
+import threading
+from itertools import islice
 from types import SimpleNamespace
 
+from jsonschema.validators import validator_for
+
+from django.conf import settings
+from django.db import connections
+from django.utils import translation
 from django.utils.translation import gettext as _
 
 from geonode.base.models import ResourceBase
@@ -29,10 +36,14 @@ from geonode.metadata.handlers.abstract import MetadataHandler
 from geonode.metadata.exceptions import UnsetFieldException
 from geonode.base.i18n import i18nCache
 from geonode.metadata.settings import MODEL_SCHEMA
+from geonode.metadata.multilang.utils import get_2letters_languages
 
 logger = logging.getLogger(__name__)
 
 CACHE_KEY_SCHEMA = "schema"
+CACHE_KEY_SCHEMA_VALIDATOR = "schema_validator"
+
+BULK_SERIALIZATION_BATCH_SIZE = 500
 
 
 class MetadataManager:
@@ -47,6 +58,7 @@ class MetadataManager:
     def __init__(self):
         self.root_schema = MODEL_SCHEMA
         self.handlers = {}
+        self._warmup_lock = threading.Lock()
 
     def add_handler(self, handler_id, handler):
         self.handlers[handler_id] = handler()
@@ -92,11 +104,80 @@ class MetadataManager:
             i18nCache.set(lang, CACHE_KEY_SCHEMA, schema, thesaurus_date)
         return schema
 
+    def get_schema_validator(self, lang=None):
+        """
+        Returns the compiled validator for the schema in the given language.
+        It is cached alongside the schema, so it is invalidated together with it.
+        """
+        lang = str(lang)
+        thesaurus_date, validator = i18nCache.get_entry(lang, CACHE_KEY_SCHEMA_VALIDATOR)
+        if validator is None:
+            schema = self.get_schema(lang)
+            validator_class = validator_for(schema)
+            validator = validator_class(schema, format_checker=validator_class.FORMAT_CHECKER)
+            i18nCache.set(lang, CACHE_KEY_SCHEMA_VALIDATOR, validator, thesaurus_date)
+        return validator
+
+    def warmup(self, langs=None):
+        """
+        Precompiles the schemas and their validators for the given languages,
+        by default all the configured ones.
+        Returns False if a warmup is already running.
+        """
+        if not self._warmup_lock.acquire(blocking=False):
+            logger.debug("Metadata schema warmup already running")
+            return False
+        try:
+            # make sure a thesaurus update is noticed right away
+            i18nCache.force_check()
+            for lang in langs or get_2letters_languages():
+                try:
+                    # the schema labels are translated through gettext, which follows the active language
+                    with translation.override(lang):
+                        self.get_schema_validator(lang)
+                    logger.debug(f"Metadata schema precompiled for {lang}")
+                except Exception as e:
+                    logger.warning(f"Could not precompile the metadata schema for {lang}: {e}")
+            return True
+        finally:
+            self._warmup_lock.release()
+
+    def warmup_in_background(self, langs=None):
+        def _warmup():
+            try:
+                self.warmup(langs)
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=_warmup, name="metadata-schema-warmup", daemon=True)
+        thread.start()
+        return thread
+
     def build_schema_instance(self, resource, lang=None):
         schema = self.get_schema(lang)
 
         context = self._init_schema_context(lang)
 
+        return self._build_schema_instance(resource, schema, context, lang)
+
+    def build_schema_instances(self, resources, lang=None, batch_size=BULK_SERIALIZATION_BATCH_SIZE):
+        """
+        Build the schema instances for many resources, yielding (resource, instance) tuples.
+        Resources are processed in batches, so that the handlers can preload the related data
+        for the whole batch instead of querying them for each resource.
+        """
+        schema = self.get_schema(lang)
+
+        resources = iter(resources)
+        while batch := list(islice(resources, batch_size)):
+            bulk_context = self._init_schema_context(lang)
+            for handler in self.handlers.values():
+                handler.load_bulk_serialization_context(batch, schema, bulk_context)
+
+            for resource in batch:
+                yield resource, self._build_schema_instance(resource, schema, dict(bulk_context), lang)
+
+    def _build_schema_instance(self, resource, schema, context, lang=None):
         for handler in self.handlers.values():
             handler.load_serialization_context(resource, schema, context)
 
@@ -134,7 +215,7 @@ class MetadataManager:
 
         logger.debug(f"RECEIVED INSTANCE {json_instance}")
         resource = resource.get_real_instance()
-        schema = self.get_schema()
+        schema = self.get_schema(lang)
         context = self._init_schema_context(lang)
 
         # We pass the request.user to the context, since it is used by the GroupHandler
@@ -149,6 +230,13 @@ class MetadataManager:
         for handler in self.handlers.values():
             handler.pre_deserialization(resource, schema, json_instance, partial, context)
 
+        if getattr(settings, "METADATA_VALIDATE_INSTANCE", False):
+            for error in self.get_schema_validator(lang).iter_errors(json_instance):
+                path = [str(step) for step in error.absolute_path]
+                if partial and path and path[0] not in partial:
+                    continue
+                MetadataHandler._set_error(errors, path[0:1], error.message)
+
         for fieldname, subschema in schema["properties"].items():
             if partial:
                 if fieldname not in partial:
@@ -878,6 +878,44 @@ class MetadataApiTests(APITestCase):
         mock_set.assert_called_once_with(str(lang), CACHE_KEY_SCHEMA, expected_schema, thesaurus_date)
         self.assertEqual(result, expected_schema)
 
+    @patch("geonode.metadata.manager.metadata_manager.build_schema")
+    def test_warmup_precompiles_schema_and_validator(self, mock_build_schema):
+        from django.utils.translation import get_language
+
+        active_languages = []
+
+        def build_schema(lang):
+            active_languages.append(get_language())
+            return self.fake_schema
+
+        mock_build_schema.side_effect = build_schema
+
+        self.assertTrue(metadata_manager.warmup(["en", "it"]))
+        self.assertEqual(mock_build_schema.call_count, 2)
+        # each schema is built with its own language active, so that its labels are translated
+        self.assertListEqual(active_languages, ["en", "it"])
+
+        # both schema and validator are served from the cache
+        validator = metadata_manager.get_schema_validator("en")
+        self.assertIs(validator, metadata_manager.get_schema_validator("en"))
+        self.assertEqual(mock_build_schema.call_count, 2)
+        self.assertTrue(validator.is_valid({"field1": "value"}))
+        self.assertFalse(validator.is_valid({"field1": 1}))
+
+    @override_settings(METADATA_VALIDATE_INSTANCE=True)
+    @patch("geonode.metadata.manager.metadata_manager.get_schema")
+    def test_update_schema_instance_validation(self, mock_get_schema):
+        mock_get_schema.return_value = self.fake_schema
+        mock_request = MagicMock()
+        mock_request.data = {"field1": 1, "field2": "value"}
+        mock_request.user = self.test_user_1
+
+        with patch.dict(metadata_manager.handlers, self.fake_handlers, clear=True):
+            errors = metadata_manager.update_schema_instance(self.resource, mock_request, "en")
+
+        self.assertIn("field1", errors)
+        self.assertNotIn("field2", errors)
+
     @patch("geonode.metadata.manager.metadata_manager.get_schema")
     @patch("geonode.metadata.manager.metadata_manager._init_schema_context")
     def test_build_schema_instance_no_errors(self, mock_init_schema_context, mock_get_schema):
@@ -914,6 +952,59 @@ class MetadataApiTests(APITestCase):
             self.assertEqual(instance["field3"], {"data from fake handler 3"})
             self.assertNotIn("extraErrors", instance)
 
+    @patch("geonode.metadata.manager.metadata_manager.get_schema")
+    def test_build_schema_instances_in_batches(self, mock_get_schema):
+        mock_get_schema.return_value = self.fake_schema
+        resources = [self.resource, self.other_resource]
+
+        with patch.dict(metadata_manager.handlers, self.fake_handlers, clear=True):
+            for handler in self.fake_handlers.values():
+                handler.get_jsonschema_instance.side_effect = lambda resource, *args: resource.title
+
+            instances = list(metadata_manager.build_schema_instances(iter(resources), "en", batch_size=1))
+
+            self.assertEqual([resource for resource, instance in instances], resources)
+            self.assertEqual(instances[0][1]["field1"], "Test Resource")
+            self.assertEqual(instances[1][1]["field1"], "Test other Resource")
+            # the related data are preloaded once per batch
+            self.assertEqual(self.handler1.load_bulk_serialization_context.call_count, 2)
+            self.handler1.load_bulk_serialization_context.assert_any_call([self.resource], self.fake_schema, ANY)
+            self.assertEqual(self.handler1.load_serialization_context.call_count, 2)
+
+    def test_build_schema_instances_same_as_single(self):
+        """
+        The batched serialization must return the same instance returned for a single resource
+        """
+        self.resource.regions.add(Region.objects.get(code="fake_code_1"))
+        self.resource.tkeywords.add(self.keyword1, self.keyword3)
+
+        resources = [self.resource, self.other_resource]
+        instances = dict(metadata_manager.build_schema_instances(resources, "en"))
+        for resource in resources:
+            self.assertEqual(instances[resource], metadata_manager.build_schema_instance(resource, "en"))
+
+    @patch("geonode.metadata.manager.metadata_manager.build_schema_instances")
+    def test_export_schema_instances(self, mock_build_schema_instances):
+        mock_build_schema_instances.side_effect = lambda resources, lang: (
+            (resource, {"title": resource.title}) for resource in resources
+        )
+        admin = get_user_model().objects.create_superuser("metadata_admin", "admin@fakemail.com", "admin_password")
+        self.client.force_login(admin)
+
+        url = reverse("metadata-export")
+        response = self.client.get(url, {"id": [self.resource.pk, self.other_resource.pk]})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        lines = [json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()]
+        self.assertEqual(
+            lines,
+            [
+                {"id": str(self.resource.pk), "instance": {"title": "Test Resource"}},
+                {"id": str(self.other_resource.pk), "instance": {"title": "Test other Resource"}},
+            ],
+        )
+
     @patch("geonode.metadata.manager.metadata_manager.get_schema")
     def test_update_schema_instance_no_errors(self, mock_get_schema):
 
@@ -19,7 +19,7 @@
 from django.apps import AppConfig
 from django.db.models import signals
 
-from .utils import link_post_delete, link_post_save
+from .utils import link_post_delete, link_post_save, invalidate_ows_response_cache
 
 
 class GeoNodeProxyAppConfig(AppConfig):
@@ -40,3 +40,25 @@ class GeoNodeProxyAppConfig(AppConfig):
             sender=Link,
             dispatch_uid="geonode.proxy.link_post_delete",
         )
+
+        # Invalidate the cached OWS documents when datasets, object permissions or group memberships change
+        from django.contrib.auth import get_user_model
+        from guardian.models import UserObjectPermission, GroupObjectPermission
+        from geonode.layers.models import Dataset
+
+        for sender in (Dataset, UserObjectPermission, GroupObjectPermission):
+            signals.post_save.connect(
+                invalidate_ows_response_cache,
+                sender=sender,
+                dispatch_uid=f"geonode.proxy.invalidate_ows_response_cache.{sender.__name__}",
+            )
+            signals.post_delete.connect(
+                invalidate_ows_response_cache,
+                sender=sender,
+                dispatch_uid=f"geonode.proxy.invalidate_ows_response_cache.{sender.__name__}.delete",
+            )
+        signals.m2m_changed.connect(
+            invalidate_ows_response_cache,
+            sender=get_user_model().groups.through,
+            dispatch_uid="geonode.proxy.invalidate_ows_response_cache.groups",
+        )
@@ -1,9 +1,15 @@
+import hashlib
+
 from threading import RLock
-from urllib.parse import urlsplit
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
 from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse, HttpResponseNotModified
 from django.utils.timezone import now
 
+from geonode.cache_utils import GenerationCache
+
 site_url = urlsplit(settings.SITEURL)
 
 PROXIED_LINK_TYPES = ["OGC:WMS", "OGC:WFS", "data"]
@@ -87,6 +93,87 @@ class ProxyUrlsRegistry:
 proxy_urls_registry = ProxyUrlsRegistry()
 
 
+class OWSResponseCache(GenerationCache):
+    """
+    Cache of the responses to idempotent OWS requests (GetCapabilities, DescribeFeatureType, ...) sent through
+    the proxy.
+
+    Entries are keyed by the normalized upstream URL, which includes the requested layers, by the requesting
+    user and by the credentials forwarded upstream, since the backend filters the documents according to the
+    permissions of whoever it authenticates.
+    They are invalidated whenever datasets, permissions or group memberships change.
+    """
+
+    KEY_PREFIX = "proxy_ows"
+    TIMEOUT_SETTING = "PROXY_OWS_CACHE_TIMEOUT"
+
+    def is_cacheable(self, method, url):
+        if not self.timeout or method != "GET":
+            return False
+        params = {key.lower(): value for key, value in parse_qsl(urlsplit(url).query)}
+        cached_requests = [req.lower() for req in getattr(settings, "PROXY_OWS_CACHED_REQUESTS", ())]
+        return params.get("request", "").lower() in cached_requests
+
+    def normalize_url(self, url):
+        parts = urlsplit(url)
+        params = sorted(
+            (key.lower(), value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() != "access_token"
+        )
+        return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, urlencode(params), ""))
+
+    def get_key(self, url, user=None, headers=None):
+        principal = f"user:{user.pk}" if user and not user.is_anonymous else "anonymous"
+        # the upstream may authenticate the request through the forwarded headers, whatever the local user is
+        _headers = {key.lower(): value for key, value in (headers or {}).items()}
+        cookies = sorted(
+            cookie.strip()
+            for cookie in _headers.get("cookie", "").split(";")
+            if cookie.strip() and not cookie.strip().startswith("csrftoken=")
+        )
+        credentials = f"{_headers.get('authorization', '')}|{'; '.join(cookies)}"
+        digest = hashlib.sha256(f"{self.normalize_url(url)}|{principal}|{credentials}".encode("utf-8")).hexdigest()
+        return self.make_key(digest)
+
+    def get_response(self, key, request):
+        """
+        Return the cached response for the given key, or None.
+        A "304 Not Modified" is returned when the request "If-None-Match" header matches the cached ETag.
+        """
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        if entry["etag"] in request.headers.get("If-None-Match", ""):
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(content=entry["content"], status=200, content_type=entry["content_type"])
+        response["ETag"] = entry["etag"]
+        return response
+
+    def set_response(self, key, response):
+        """
+        Store a successful response and tag it with its ETag.
+        """
+        if response.status_code != 200 or getattr(response, "streaming", False):
+            return response
+        etag = f'"{hashlib.md5(response.content).hexdigest()}"'
+        cache.set(
+            key,
+            {"content": response.content, "content_type": response.get("Content-Type"), "etag": etag},
+            self.timeout,
+        )
+        response["ETag"] = etag
+        return response
+
+
+ows_response_cache = OWSResponseCache()
+
+
+def invalidate_ows_response_cache(*args, **kwargs):
+    ows_response_cache.invalidate()
+
+
 def link_post_save(instance, sender, **kwargs):
     if (
         instance.resource
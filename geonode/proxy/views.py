@@ -56,7 +56,7 @@ from geonode.base.auth import get_auth_user, get_token_from_auth_header
 from geonode.geoserver.helpers import ogc_server_settings
 from geonode.assets.utils import get_default_asset
 from zipstream import ZipStream
-from .utils import proxy_urls_registry
+from .utils import proxy_urls_registry, ows_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -163,13 +163,39 @@ def proxy(
         _url = _url.replace(f"{settings.SITEURL}geoserver", ogc_server_settings.LOCATION.rstrip("/"))
         _data = _data.replace(f"{settings.SITEURL}geoserver", ogc_server_settings.LOCATION.rstrip("/"))
 
+    # Serve idempotent OWS requests (e.g. GetCapabilities) from the cache when possible
+    ows_cache_key = None
+    if ows_response_cache.is_cacheable(request.method, _url):
+        ows_cache_key = ows_response_cache.get_key(_url, user or getattr(request, "user", None), headers=headers)
+        cached_response = ows_response_cache.get_response(ows_cache_key, request)
+        if cached_response is not None:
+            return cached_response
+
+    # Stream the upstream body to the client instead of buffering it, unless a callback needs the whole content
+    stream = kwargs.pop("stream", getattr(settings, "PROXY_STREAM_RESPONSES", False)) and not response_callback
+    stream = stream and not ows_cache_key
+
     response, content = http_client.request(
-        _url, method=request.method, data=_data.encode("utf-8"), headers=headers, timeout=timeout, user=user
+        _url,
+        method=request.method,
+        data=_data.encode("utf-8"),
+        headers=headers,
+        timeout=timeout,
+        user=user,
+        stream=stream,
     )
     if response is None:
         logger.error(f"Proxy request failed: {content}")
         return HttpResponse(content="Proxy request failed.", status=500, content_type="text/plain")
 
+    if stream and response.status_code < 300:
+        _response = StreamingHttpResponse(
+            _iter_upstream_content(response, gzipped=response.headers.get("Content-Type") == "gzip"),
+            status=response.status_code,
+            content_type=response.headers.get("Content-Type"),
+        )
+        return fetch_response_headers(_response, response.headers)
+
     content = response.content or response.reason
     status = response.status_code
     response_headers = response.headers
@@ -207,7 +233,10 @@ def proxy(
                 "content_type": content_type,
             }
         )
-        return response_callback(**kwargs)
+        _response = response_callback(**kwargs)
+        if ows_cache_key:
+            ows_response_cache.set_response(ows_cache_key, _response)
+        return _response
     else:
         # If we get a redirect, let's add a useful message.
         if status and status in (301, 302, 303, 307):
@@ -239,9 +268,25 @@ def proxy(
                 status=status,
                 content_type=content_type,
             )
+            if ows_cache_key:
+                ows_response_cache.set_response(ows_cache_key, _response)
             return fetch_response_headers(_response, response_headers)
 
 
+def _iter_upstream_content(response, gzipped=False, chunk_size=BUFFER_CHUNK_SIZE):
+    """
+    Yields the upstream body in chunks of at most 'chunk_size' bytes, closing the upstream connection when done.
+    """
+    try:
+        if gzipped:
+            with gzip.GzipFile(fileobj=response.raw) as f:
+                yield from iter(lambda: f.read(chunk_size), b"")
+        else:
+            yield from response.iter_content(chunk_size=chunk_size)
+    finally:
+        response.close()
+
+
 def download(request, resourceid, sender=Dataset):
     _not_authorized = _("You are not authorized to download this resource.")
     _not_permitted = _("You are not permitted to save or edit this resource.")
@@ -636,6 +636,8 @@ class BaseResourceManager(ResourceManagerInterface):
                         )
                         if not success:
                             raise Exception(f"Could not remove permissions for local resource {_resource}")
+                    if getattr(settings, "RESOURCE_VISIBILITY_INDEX_ENABLED", False):
+                        permissions_registry.update_visibility_index([_resource.id])
                 _resource.set_processing_state(enumerations.STATE_PROCESSED)
                 return True
             except Exception as e:
@@ -926,6 +928,9 @@ class BaseResourceManager(ResourceManagerInterface):
                         )
                         if not success:
                             logger.warning("Could not sync permissions to GeoServer for resource %s", _resource)
+
+                    if getattr(settings, "RESOURCE_VISIBILITY_INDEX_ENABLED", False):
+                        permissions_registry.update_visibility_index([_resource.id])
                 _resource.set_processing_state(enumerations.STATE_PROCESSED)
                 return True
             except Exception as e:
@@ -60,6 +60,16 @@ class BasePermissionsHandler(ABC):
         """
         return perms_payload
 
+    def get_perms_bulk(self, perms_payloads, user, include_virtual, *args, **kwargs):
+        """
+        Batched version of "get_perms", receiving the payloads of many resources keyed by instance.
+        By default every payload is processed through "get_perms"
+        """
+        return {
+            instance: self.get_perms(instance, perms_payload, user, include_virtual=include_virtual, *args, **kwargs)
+            for instance, perms_payload in perms_payloads.items()
+        }
+
 
 class SpecialGroupsPermissionsHandler(BasePermissionsHandler):
     """
@@ -287,3 +297,25 @@ class GroupManagersPermissionsHandler(BasePermissionsHandler):
             return perms_copy
 
         return perms_payload
+
+    def get_perms_bulk(self, perms_payloads, user=None, include_virtual=True, *args, **kwargs):
+        from geonode.groups.models import GroupMember
+
+        if not include_virtual:
+            return perms_payloads
+
+        users = {u.pk for perms_payload in perms_payloads.values() for u in perms_payload.get("users", {})}
+        # (user, group) pairs where the user is a manager, fetched once for all the resources
+        managed_groups = set(
+            GroupMember.objects.filter(user_id__in=users, role=GroupMember.MANAGER).values_list(
+                "user_id", "group__group_id"
+            )
+        )
+
+        for instance, perms_payload in perms_payloads.items():
+            users = perms_payload.get("users", {})
+            for u, perms in users.items():
+                if perms and instance.group_id and (u.pk, instance.group_id) in managed_groups:
+                    users[u] = list(set(perms + GroupManagersPermissionsHandler.EXTRA_MANAGER_PERMS))
+
+        return perms_payloads
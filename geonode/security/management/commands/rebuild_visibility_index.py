@@ -0,0 +1,52 @@
+#########################################################################
+#
+# Copyright (C) 2026 OSGeo
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+#
+#########################################################################
+
+from django.core.management.base import BaseCommand
+
+from geonode.base.models import ResourceBase
+from geonode.security.registry import permissions_registry
+
+
+class Command(BaseCommand):
+    help = "Rebuild the ResourceVisibility index from the guardian object permissions"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-u", "--uuid", dest="uuid", action="append", help="Only process resources with given UUIDs"
+        )
+        parser.add_argument(
+            "-b",
+            "--batch-size",
+            dest="batch_size",
+            type=int,
+            default=1000,
+            help="Number of resources processed per batch (default: 1000)",
+        )
+
+    def handle(self, **options):
+        queryset = ResourceBase.objects.all()
+        if options.get("uuid"):
+            queryset = queryset.filter(uuid__in=options["uuid"])
+
+        total = queryset.count()
+        self.stdout.write(f"Rebuilding the visibility index of {total} resources")
+        processed = 0
+        for processed in permissions_registry.rebuild_visibility_index(queryset, batch_size=options["batch_size"]):
+            self.stdout.write(f"- {processed}/{total}")
+        self.stdout.write(self.style.SUCCESS(f"Visibility index rebuilt for {processed} resources"))
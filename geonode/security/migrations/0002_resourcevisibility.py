@@ -0,0 +1,44 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("base", "0101_remove_source_type_copyremote"),
+        ("security", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResourceVisibility",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "principal_type",
+                    models.CharField(choices=[("user", "User"), ("group", "Group")], max_length=8),
+                ),
+                ("principal_id", models.IntegerField()),
+                ("can_view", models.BooleanField(default=False)),
+                ("can_change", models.BooleanField(default=False)),
+                (
+                    "resource",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="visibility_index",
+                        to="base.resourcebase",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Resource Visibility",
+                "verbose_name_plural": "Resource Visibility",
+                "unique_together": {("resource", "principal_type", "principal_id")},
+                "indexes": [
+                    models.Index(
+                        fields=["principal_type", "principal_id", "resource"], name="security_rv_principal_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -506,3 +506,36 @@ class URLPatternAuthConfig(models.Model):
 
     def __str__(self):
         return self.pattern
+
+
+class ResourceVisibility(models.Model):
+    """
+    Denormalized view/change grants of a resource, one row per (resource, principal).
+
+    The rows are derived from the guardian object permissions tables and let the
+    permissions registry filter visible resources through a single indexed join.
+    """
+
+    PRINCIPAL_USER = "user"
+    PRINCIPAL_GROUP = "group"
+    PRINCIPAL_TYPES = (
+        (PRINCIPAL_USER, "User"),
+        (PRINCIPAL_GROUP, "Group"),
+    )
+
+    resource = models.ForeignKey("base.ResourceBase", on_delete=models.CASCADE, related_name="visibility_index")
+    principal_type = models.CharField(max_length=8, choices=PRINCIPAL_TYPES)
+    principal_id = models.IntegerField()
+    can_view = models.BooleanField(default=False)
+    can_change = models.BooleanField(default=False)
+
+    class Meta:
+        verbose_name = "Resource Visibility"
+        verbose_name_plural = "Resource Visibility"
+        unique_together = (("resource", "principal_type", "principal_id"),)
+        indexes = [
+            models.Index(fields=["principal_type", "principal_id", "resource"], name="security_rv_principal_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.resource_id}:{self.principal_type}:{self.principal_id}"
@@ -16,19 +16,25 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 #
 #########################################################################
+import time
+import threading
+from contextlib import contextmanager
+
 from django.conf import settings
 from django.utils.module_loading import import_string
 from geonode.security.handlers import BasePermissionsHandler
 from django.core.cache import cache
 from django.db.models import Q
 from django.contrib.auth.models import Group
-from guardian.shortcuts import get_objects_for_user, get_objects_for_group, get_anonymous_user, get_group_perms
+from guardian.shortcuts import get_objects_for_user, get_anonymous_user, get_group_perms
 from django.contrib.auth.models import AnonymousUser as DjangoAnonymousUser
 from geonode.security.permissions import PERMISSIONS, READ_ONLY_AFFECTED_PERMISSIONS
 from django.contrib.auth.models import Permission
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from guardian.shortcuts import get_groups_with_perms, get_user_obj_perms_model
+from guardian.utils import get_group_obj_perms_model
 
 from geonode.security.permissions import (
     VIEW_PERMISSIONS,
@@ -40,10 +46,18 @@ from geonode.security.permissions import (
     DATASET_EDIT_STYLE_PERMISSIONS,
 )
 
+# Object permissions granting visibility on a resource
+VISIBILITY_INDEX_PERMISSIONS = ["view_resourcebase", "change_resourcebase"]
+
+# Generation counters namespacing the "resource_perms:*" and "global_perms:*" cache keys
+PERMISSIONS_CACHE_GENERATION_KEY = "perms_gen:{scope}"
+PERMISSIONS_CACHE_GLOBAL_SCOPE = "__all__"
+
 
 class PermissionsHandlerRegistry:
 
     REGISTRY = []
+    _batch = threading.local()
 
     def init_registry(self):
         self._register()
@@ -198,6 +212,48 @@ class PermissionsHandlerRegistry:
             **kwargs,
         )
 
+    def get_perms_bulk(self, instances, user, include_virtual=True, use_cache=False, *args, **kwargs):
+        """
+        Return the permissions of the user on many resources at once, as a dict keyed by resource pk.
+        The result for each resource is the same list returned by "get_perms(instance=..., user=...)".
+
+        Cached entries are read with a single round trip, the object permissions of the remaining
+        resources are fetched with a constant number of queries and the handlers receive the payloads
+        of all of them through "get_perms_bulk".
+        """
+        if isinstance(user, DjangoAnonymousUser):
+            user = get_anonymous_user()
+
+        instances = [instance for instance in instances if instance is not None]
+        if not instances:
+            return {}
+
+        result = {}
+        cache_keys = {}
+        if use_cache:
+            keys = self._get_cache_key([instance.pk for instance in instances], users=[user])
+            keys = keys if isinstance(keys, list) else [keys]
+            cache_keys = {instance.pk: key for instance, key in zip(instances, keys)}
+            cached = cache.get_many(cache_keys.values())
+            result.update({pk: cached[key] for pk, key in cache_keys.items() if key in cached})
+
+        missing = [instance for instance in instances if instance.pk not in result]
+        if missing:
+            payloads = {
+                instance: {"users": {user: perms}, "groups": {}}
+                for instance, perms in self._get_user_perms_bulk(missing, user).items()
+            }
+            for handler in self.REGISTRY:
+                payloads = handler.get_perms_bulk(payloads, user, include_virtual=include_virtual, *args, **kwargs)
+            computed = {instance.pk: payload["users"][user] for instance, payload in payloads.items()}
+            if use_cache:
+                cache.set_many(
+                    {cache_keys[pk]: perms for pk, perms in computed.items()}, settings.PERMISSION_CACHE_EXPIRATION_TIME
+                )
+            result.update(computed)
+
+        return result
+
     def get_visible_resources(
         self,
         queryset,
@@ -239,10 +295,15 @@ class PermissionsHandlerRegistry:
 
         if not is_admin:
             if user:
-                _allowed_resources = get_objects_for_user(
-                    user, ["base.view_resourcebase", "base.change_resourcebase"], any_perm=True
-                )
-                queryset = queryset.filter(id__in=_allowed_resources.values("id"))
+                if getattr(settings, "RESOURCE_VISIBILITY_INDEX_ENABLED", False):
+                    _allowed_resource_ids = self.get_visible_resource_ids(user)
+                    if _allowed_resource_ids is not None:
+                        queryset = queryset.filter(id__in=_allowed_resource_ids)
+                else:
+                    _allowed_resources = get_objects_for_user(
+                        user, ["base.view_resourcebase", "base.change_resourcebase"], any_perm=True
+                    )
+                    queryset = queryset.filter(id__in=_allowed_resources.values("id"))
 
             if admin_approval_required and not AdvancedSecurityWorkflowManager.is_simplified_workflow():
                 if not user or not user.is_authenticated or user.is_anonymous:
@@ -268,6 +329,85 @@ class PermissionsHandlerRegistry:
 
         return queryset
 
+    def get_visible_resource_ids(self, user):
+        """
+        Returns a subquery of the ids of the resources the user can view or change,
+        resolved through the "ResourceVisibility" index.
+        Mirrors guardian's "get_objects_for_user": grants of the user and of its groups are
+        considered, and None is returned when the user holds a global view/change permission.
+        """
+        from geonode.security.models import ResourceVisibility
+
+        if isinstance(user, DjangoAnonymousUser):
+            user = get_anonymous_user()
+
+        if any(user.has_perm(f"base.{codename}") for codename in VISIBILITY_INDEX_PERMISSIONS):
+            return None
+
+        return (
+            ResourceVisibility.objects.filter(
+                Q(principal_type=ResourceVisibility.PRINCIPAL_USER, principal_id=user.pk)
+                | Q(principal_type=ResourceVisibility.PRINCIPAL_GROUP, principal_id__in=user.groups.values("id"))
+            )
+            .filter(Q(can_view=True) | Q(can_change=True))
+            .values("resource_id")
+        )
+
+    def update_visibility_index(self, resource_pks):
+        """
+        Recomputes the "ResourceVisibility" rows of the given resources from the guardian tables.
+        Each call costs a constant number of queries, regardless of the number of resources.
+        """
+        from geonode.base.models import ResourceBase
+        from geonode.security.models import ResourceVisibility
+
+        resource_pks = [int(pk) for pk in resource_pks]
+        if not resource_pks:
+            return 0
+
+        ctype = ContentType.objects.get_for_model(ResourceBase)
+        object_pks = [str(pk) for pk in resource_pks]
+        rows = {}
+        for perms_model, principal_type, principal_field in (
+            (get_user_obj_perms_model(ResourceBase), ResourceVisibility.PRINCIPAL_USER, "user_id"),
+            (get_group_obj_perms_model(ResourceBase), ResourceVisibility.PRINCIPAL_GROUP, "group_id"),
+        ):
+            grants = perms_model.objects.filter(
+                content_type=ctype,
+                object_pk__in=object_pks,
+                permission__codename__in=VISIBILITY_INDEX_PERMISSIONS,
+            ).values_list("object_pk", principal_field, "permission__codename")
+            for object_pk, principal_id, codename in grants:
+                key = (int(object_pk), principal_type, principal_id)
+                if key not in rows:
+                    rows[key] = ResourceVisibility(
+                        resource_id=key[0], principal_type=principal_type, principal_id=principal_id
+                    )
+                if codename == "view_resourcebase":
+                    rows[key].can_view = True
+                else:
+                    rows[key].can_change = True
+
+        with transaction.atomic():
+            ResourceVisibility.objects.filter(resource_id__in=resource_pks).delete()
+            ResourceVisibility.objects.bulk_create(rows.values(), batch_size=1000)
+        return len(rows)
+
+    def rebuild_visibility_index(self, queryset=None, batch_size=1000):
+        """
+        Rebuilds the "ResourceVisibility" index in batches of resources.
+        Yields the number of resources processed so far after each batch.
+        """
+        from geonode.base.models import ResourceBase
+
+        if queryset is None:
+            queryset = ResourceBase.objects.all()
+        resource_pks = list(queryset.order_by("pk").values_list("pk", flat=True))
+        for start in range(0, len(resource_pks), batch_size):
+            batch = resource_pks[start : start + batch_size]
+            self.update_visibility_index(batch)
+            yield start + len(batch)
+
     def get_users_with_perms(self, obj):
         """
         Override of the Guardian get_users_with_perms
@@ -321,7 +461,10 @@ class PermissionsHandlerRegistry:
         from geonode.security.utils import get_geoapp_subtypes
         from geonode.base.models import ResourceBase
 
-        if settings.SKIP_PERMS_FILTER:
+        if settings.SKIP_PERMS_FILTER or (
+            getattr(settings, "RESOURCE_VISIBILITY_INDEX_ENABLED", False) and not shortcut_kwargs
+        ):
+            # get_visible_resources applies the permissions filter below
             resources = ResourceBase.objects.all()
         else:
             resources = get_objects_for_user(
@@ -361,60 +504,62 @@ class PermissionsHandlerRegistry:
         """
         Clear the cache for resource permissions when activity related to resource is performed.
         This ensures that permissions are recalculated on the next request.
+
+        The cached entries are not deleted: the generation of the resource, user or group is bumped
+        instead, so that all the keys built on the previous generation are never read again and expire
+        on their own. Inside a "batch_invalidations" block the bumps are deferred and coalesced.
         """
 
         from geonode.base.models import ResourceBase
         from geonode.people.models import Profile
 
+        scopes = set()
         if isinstance(instance, ResourceBase):
-            permissions = self.get_perms(instance=instance)
-            users = Profile.objects.filter(
-                Q(groups__in=permissions["groups"].keys()) | Q(id__in=[x.id for x in permissions["users"].keys()])
-            ).distinct()
-
-            cache_keys = self._get_cache_key(
-                resource_pks=[instance.pk],
-                users=users if user_clear_cache else None,
-                groups=permissions["groups"].keys() if group_clear_cache else None,
-                remove_all_cache=True,  # This will ensure that the __ALL__ cache key is included
-            )
-            self._clear_cache_keys(cache_keys if cache_keys else [])
+            scopes.add(self._resource_scope(instance.pk))
 
         elif isinstance(instance, Group):
-            group_users = instance.user_set.all()
-            resource_pks_with_perms = [
-                resource.pk for resource in get_objects_for_group(instance, ["base.view_resourcebase"], any_perm=True)
-            ]
-
-            cache_keys = self._get_cache_key(
-                resource_pks=resource_pks_with_perms,
-                users=group_users if user_clear_cache else None,
-                groups=[instance] if group_clear_cache else None,
-            )
-            cache_keys = self._add_global_keys(cache_keys, group_users if user_clear_cache else [])
-            self._clear_cache_keys(cache_keys)
+            if group_clear_cache:
+                scopes.add(self._group_scope(instance))
+            if user_clear_cache:
+                scopes.update(self._user_scope(user) for user in instance.user_set.all())
 
         elif isinstance(instance, Profile):
-            resources = get_objects_for_user(instance, "base.view_resourcebase")
-            resource_pks = [resource.pk for resource in resources]
-
-            cache_keys = self._get_cache_key(
-                resource_pks=resource_pks,
-                users=[instance] if user_clear_cache else None,
-                groups=instance.groups.all() if group_clear_cache else None,
-            )
-            cache_keys = self._add_global_keys(cache_keys, [instance] if user_clear_cache else [])
-            self._clear_cache_keys(cache_keys)
+            if user_clear_cache:
+                scopes.add(self._user_scope(instance))
+            if group_clear_cache:
+                scopes.update(self._group_scope(group) for group in instance.groups.all())
 
         else:
             pass
 
+        self._invalidate_scopes(scopes)
+
     def clear_permissions_cache(self):
         """
         Clear all permission cache entries.
         """
-        # This wipes everything in the default cache
-        cache.clear()
+        # Bump the global generation instead of wiping everything in the default cache
+        self._invalidate_scopes({PERMISSIONS_CACHE_GLOBAL_SCOPE})
+
+    @contextmanager
+    def batch_invalidations(self):
+        """
+        Coalesce the permissions cache invalidations issued in the block, e.g. by a bulk
+        permissions update: each resource, user or group generation is bumped only once on exit.
+        Blocks can be nested; the outermost one flushes the pending invalidations.
+        Cached permissions read inside the block may not reflect the changes made in it yet.
+        """
+        pending = getattr(self._batch, "pending", None)
+        if pending is not None:
+            yield
+            return
+
+        self._batch.pending = set()
+        try:
+            yield
+        finally:
+            scopes, self._batch.pending = self._batch.pending, None
+            self._bump_generations(scopes)
 
     def _get_global_perms(self, user, use_cache=False):
         """
@@ -528,6 +673,121 @@ class PermissionsHandlerRegistry:
 
         return result
 
+    def _get_user_perms_bulk(self, instances, user):
+        """
+        Batched equivalent of "PermissionLevelMixin.get_user_perms", returning a dict keyed by instance.
+        The "feature", "approve" and "publish" checks only depend on the owner and the group of a resource,
+        so they are evaluated once per distinct owner/group.
+        """
+        from geonode.base.models import Configuration, ResourceBase
+        from geonode.layers.models import Dataset
+
+        config = Configuration.load()
+        ctype_resource_base = ContentType.objects.get_for_model(ResourceBase)
+        ctypes = {
+            instance: ContentType.objects.get_for_id(instance.polymorphic_ctype_id or ctype_resource_base.id)
+            for instance in instances
+        }
+        ctype_ids = {ctype_resource_base.id} | {ctype.id for ctype in ctypes.values()}
+        object_pks = [str(instance.pk) for instance in instances]
+
+        fetchable_perms = (
+            VIEW_PERMISSIONS
+            + DOWNLOAD_PERMISSIONS
+            + ADMIN_PERMISSIONS
+            + SERVICE_PERMISSIONS
+            + DATASET_EDIT_STYLE_PERMISSIONS
+            + DATASET_ADMIN_PERMISSIONS
+        )
+        available_perms = {}
+        for ctype_id, codename in Permission.objects.filter(
+            content_type_id__in=ctype_ids, codename__in=fetchable_perms
+        ).values_list("content_type_id", "codename"):
+            available_perms.setdefault(ctype_id, set()).add(codename)
+
+        user_grants = {}
+        group_grants = {}
+        if not user.is_superuser:
+            for object_pk, ctype_id, codename in (
+                get_user_obj_perms_model(ResourceBase)
+                .objects.filter(user=user, content_type_id__in=ctype_ids, object_pk__in=object_pks)
+                .values_list("object_pk", "content_type_id", "permission__codename")
+            ):
+                user_grants.setdefault((object_pk, ctype_id), set()).add(codename)
+            if user.is_active:
+                for object_pk, ctype_id, codename in (
+                    get_group_obj_perms_model(ResourceBase)
+                    .objects.filter(
+                        group__in=user.groups.all(), content_type_id__in=ctype_ids, object_pk__in=object_pks
+                    )
+                    .values_list("object_pk", "content_type_id", "permission__codename")
+                ):
+                    group_grants.setdefault((object_pk, ctype_id), set()).add(codename)
+
+        # filter out permissions for edit, change or publish if readonly mode is active
+        read_only_prefixes = ["change", "delete", "publish"]
+        can_feature = {}
+        can_approve = {}
+        can_publish = {}
+        result = {}
+        for instance in instances:
+            instance_ctype_ids = {ctype_resource_base.id, ctypes[instance].id}
+            perms_to_fetch = VIEW_PERMISSIONS + DOWNLOAD_PERMISSIONS + ADMIN_PERMISSIONS + SERVICE_PERMISSIONS
+            if instance.subtype == "raster":
+                perms_to_fetch += DATASET_EDIT_STYLE_PERMISSIONS
+            elif issubclass(ctypes[instance].model_class(), Dataset):
+                perms_to_fetch += DATASET_ADMIN_PERMISSIONS
+            resource_perms = {
+                codename
+                for ctype_id in instance_ctype_ids
+                for codename in available_perms.get(ctype_id, ())
+                if codename in perms_to_fetch
+            }
+
+            if user.is_superuser:
+                perms = resource_perms
+            else:
+                explicit_perms = set()
+                implicit_perms = set()
+                for ctype_id in instance_ctype_ids:
+                    key = (str(instance.pk), ctype_id)
+                    explicit_perms.update(user_grants.get(key, set()) & resource_perms)
+                    if user.is_active:
+                        implicit_perms.update(user_grants.get(key, ()), group_grants.get(key, ()))
+                if instance.subtype == "raster":
+                    implicit_perms -= set(DATASET_EDIT_DATA_PERMISSIONS)
+                elif instance.subtype != "vector":
+                    implicit_perms -= set(DATASET_ADMIN_PERMISSIONS)
+                perms = explicit_perms | implicit_perms
+
+            if config.read_only:
+                perms = {perm for perm in perms if not any(prefix in perm for prefix in read_only_prefixes)}
+
+            perms = list(perms)
+            if perms and not user.is_anonymous:
+                rb_grants = group_grants.get((str(instance.pk), ctype_resource_base.id), set()) | user_grants.get(
+                    (str(instance.pk), ctype_resource_base.id), set()
+                )
+                feature_key = instance.group_id
+                approve_key = (instance.owner_id, instance.group_id, "change_resourcebase_metadata" in rb_grants)
+                publish_key = (instance.owner_id, instance.group_id)
+                if feature_key not in can_feature:
+                    can_feature[feature_key] = self.user_can_feature(user, instance)
+                if approve_key not in can_approve:
+                    can_approve[approve_key] = self.user_can_approve(user, instance)
+                if publish_key not in can_publish:
+                    can_publish[publish_key] = self.user_can_publish(user, instance)
+
+                if can_feature[feature_key]:
+                    perms.append("feature_resourcebase")
+                if can_approve[approve_key]:
+                    perms.append("approve_resourcebase")
+                if can_publish[publish_key]:
+                    perms.append("publish_resourcebase")
+
+            result[instance] = perms
+        return result
+
     def __check_item(self, item):
         """
         Ensure that the handler is a subclass of BasePermissionsHandler
@@ -539,31 +799,61 @@ class PermissionsHandlerRegistry:
         for module_path in settings.PERMISSIONS_HANDLERS:
             self.add(module_path)
 
-    def _add_global_keys(self, cache_keys, users):
-        cache_keys = [cache_keys] if isinstance(cache_keys, str) else (cache_keys or [])
-        return cache_keys + [self._get_global_cache_key(u) for u in users]
-
-    def _clear_cache_keys(self, cache_keys):
-        """Clear cache keys."""
-        if cache_keys:
-            if isinstance(cache_keys, str):
-                cache.delete(cache_keys)
-            elif isinstance(cache_keys, list):
-                cache.delete_many(cache_keys)
-            else:
-                raise TypeError(f"Expected str or list, got {type(cache_keys)}")
-
     def _user_identifier(self, user):
         if user.is_anonymous or user.username == "AnonymousUser" or user == get_anonymous_user():
             return "anonymous"
         return f"user:{user.pk}"
 
+    def _user_scope(self, user):
+        return self._user_identifier(user)
+
+    def _group_scope(self, group):
+        return f"group:{group.pk}"
+
+    def _resource_scope(self, pk):
+        return f"resource:{pk}"
+
+    def _get_generations(self, scopes):
+        """
+        Return the current generation of each scope, initializing the missing ones.
+        Missing generations are seeded with the current time, so that a generation evicted from
+        the cache never goes back to a value already used by stale entries.
+        """
+        keys = {scope: PERMISSIONS_CACHE_GENERATION_KEY.format(scope=scope) for scope in scopes}
+        found = cache.get_many(keys.values())
+        generations = {}
+        for scope, key in keys.items():
+            if key not in found:
+                cache.add(key, time.time_ns(), None)
+                found[key] = cache.get(key)
+            generations[scope] = found[key]
+        return generations
+
+    def _bump_generations(self, scopes):
+        for scope in scopes:
+            key = PERMISSIONS_CACHE_GENERATION_KEY.format(scope=scope)
+            try:
+                cache.incr(key)
+            except ValueError:
+                cache.set(key, time.time_ns(), None)
+
+    def _invalidate_scopes(self, scopes):
+        pending = getattr(self._batch, "pending", None)
+        if pending is not None:
+            pending.update(scopes)
+        else:
+            self._bump_generations(scopes)
+
     def _get_global_cache_key(self, user):
-        return f"global_perms:{self._user_identifier(user)}"
+        scope = self._user_scope(user)
+        generations = self._get_generations([PERMISSIONS_CACHE_GLOBAL_SCOPE, scope])
+        global_gen, user_gen = generations[PERMISSIONS_CACHE_GLOBAL_SCOPE], generations[scope]
+        return f"global_perms:{self._user_identifier(user)}:v{global_gen}.{user_gen}"
 
     def _get_cache_key(self, resource_pks, users=None, groups=None, remove_all_cache=False):
         """
         Generate cache keys for resource permissions.
+        Each key embeds the current generations of the global, resource and user/group scopes.
 
         Args:
             resource_pks: List of resource primary keys
@@ -571,18 +861,29 @@ class PermissionsHandlerRegistry:
             groups: Optional list of groups to generate keys for
             remove_all_cache: If True, includes the __ALL__ cache key
         """
+        users = list(users or [])
+        groups = list(groups or [])
+        generations = self._get_generations(
+            [PERMISSIONS_CACHE_GLOBAL_SCOPE]
+            + [self._resource_scope(pk) for pk in resource_pks]
+            + [self._user_scope(user) for user in users]
+            + [self._group_scope(group) for group in groups]
+        )
+        global_gen = generations[PERMISSIONS_CACHE_GLOBAL_SCOPE]
+
         cache_keys = []
         for pk in resource_pks:
-            if users:
-                for user in users:
-                    cache_keys.append(f"resource_perms:{pk}:{self._user_identifier(user)}")
+            resource_gen = f"v{global_gen}.{generations[self._resource_scope(pk)]}"
+            for user in users:
+                user_gen = generations[self._user_scope(user)]
+                cache_keys.append(f"resource_perms:{pk}:{self._user_identifier(user)}:{resource_gen}.{user_gen}")
 
-            if groups:
-                for group in groups:
-                    cache_keys.append(f"resource_perms:{pk}:group:{group.pk}")
+            for group in groups:
+                group_gen = generations[self._group_scope(group)]
+                cache_keys.append(f"resource_perms:{pk}:group:{group.pk}:{resource_gen}.{group_gen}")
 
             if not users and not groups or remove_all_cache:
-                cache_keys.append(f"resource_perms:{pk}:__ALL__")
+                cache_keys.append(f"resource_perms:{pk}:__ALL__:{resource_gen}")
 
         return cache_keys if len(cache_keys) > 1 else cache_keys[0] if cache_keys else None
 
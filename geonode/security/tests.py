@@ -20,6 +20,7 @@
 import json
 import base64
 import logging
+from functools import partial
 from unittest.mock import patch
 import uuid
 import os
@@ -79,11 +80,14 @@ from geonode.base.populate_test_data import (
     remove_models,
     create_single_dataset,
 )
+from geonode.geoserver.geofence import Batch
 from geonode.geoserver.security import (
     _get_gf_services,
     allow_layer_to_all,
     delete_all_geofence_rules,
     sync_resources_with_guardian,
+    bulk_sync_resources_with_guardian,
+    collect_dataset_rules,
     _get_gwc_filters_and_formats,
     has_geolimits,
     create_geofence_rules,
@@ -103,7 +107,7 @@ from geonode.base.models import ResourceBase
 from geonode.people.models import Profile
 from geonode.security.auth_handlers import AuthHandler, BasicAuthHandler, HashableAuthBase
 from geonode.security.auth_registry import AuthHandlerRegistry, auth_handler_registry
-from geonode.security.models import AuthConfig, URLPatternAuthConfig
+from geonode.security.models import AuthConfig, URLPatternAuthConfig, ResourceVisibility
 
 logger = logging.getLogger(__name__)
 
@@ -2280,6 +2284,38 @@ class SecurityRulesTests(TestCase):
         mock_create_geofence_rules.assert_not_called()
         self.assertFalse(Dataset.objects.get(pk=remote_dataset.id).dirty_state)
 
+    @patch("geonode.geoserver.security.geofence")
+    def test_bulk_sync_resources_with_guardian_applies_only_the_delta(self, mock_geofence):
+        dataset = Dataset.objects.get(pk=self._l.id)
+        desired = [op["Rule"] for op in collect_dataset_rules(dataset, Batch()).operations]
+        self.assertTrue(desired)
+
+        # no rules in GeoFence: everything is inserted
+        mock_geofence.get_rules.return_value = {"rules": []}
+        report = bulk_sync_resources_with_guardian(resource=dataset, batch_size=1)
+        self.assertEqual(report["changed"], 1)
+        self.assertEqual(mock_geofence.run_batch.call_count, 1)
+        operations = mock_geofence.run_batch.call_args[0][0].operations
+        self.assertEqual(len(operations), len(desired))
+        self.assertTrue(all(op["@type"] == "insert" for op in operations))
+
+        # GeoFence already has the expected rules: nothing to do
+        mock_geofence.reset_mock()
+        mock_geofence.get_rules.return_value = {
+            "rules": [dict(rule, id=_id, priority=_id) for _id, rule in enumerate(desired)]
+        }
+        report = bulk_sync_resources_with_guardian(resource=dataset)
+        self.assertEqual(report["unchanged"], 1)
+        mock_geofence.run_batch.assert_not_called()
+
+        # a stale rule is replaced along with the layer rules
+        mock_geofence.get_rules.return_value["rules"][0]["access"] = "DENY"
+        report = bulk_sync_resources_with_guardian(resource=dataset)
+        self.assertEqual(report["changed"], 1)
+        operations = mock_geofence.run_batch.call_args[0][0].operations
+        self.assertEqual(len([op for op in operations if op["@type"] == "delete"]), len(desired))
+        self.assertEqual(len([op for op in operations if op["@type"] == "insert"]), len(desired))
+
     # TODO: DELAYED SECURITY MUST BE REVISED
     def test_sync_resources_with_guardian_delay_true(self):
         with self.settings(DELAYED_SECURITY_SIGNALS=True, GEOFENCE_SECURITY_ENABLED=True):
@@ -3207,6 +3243,62 @@ class TestUserHasPerms(GeoNodeBaseTestSupport):
         self.assertEqual(anonymous_user_perm, None, "Anynmous user wasn't removed")
 
 
+@override_settings(RESOURCE_VISIBILITY_INDEX_ENABLED=True)
+class TestResourceVisibilityIndex(GeoNodeBaseTestSupport):
+    """
+    Ensure that the visibility index is kept in sync with the guardian permissions
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.dataset = create_single_dataset(name="test_visibility_dataset")
+
+    @classmethod
+    def tearDownClass(self) -> None:
+        Dataset.objects.filter(name="test_visibility_dataset").delete()
+
+    def setUp(self):
+        self.marty, _ = get_user_model().objects.get_or_create(username="marty")
+
+    def _visible_ids(self, user):
+        return list(
+            permissions_registry.get_visible_resources(ResourceBase.objects.all(), user).values_list("id", flat=True)
+        )
+
+    def test_set_permissions_updates_the_index(self):
+        self.dataset.set_permissions({"users": {self.marty.username: ["base.view_resourcebase"]}, "groups": {}})
+        self.assertTrue(
+            ResourceVisibility.objects.filter(
+                resource_id=self.dataset.id,
+                principal_type=ResourceVisibility.PRINCIPAL_USER,
+                principal_id=self.marty.id,
+                can_view=True,
+            ).exists()
+        )
+        self.assertIn(self.dataset.id, self._visible_ids(self.marty))
+
+        self.dataset.set_permissions({"users": {self.marty.username: []}, "groups": {}})
+        self.assertNotIn(self.dataset.id, self._visible_ids(self.marty))
+
+    def test_group_grants_are_resolved_through_membership(self):
+        group = Group.objects.create(name="visibility_group")
+        self.dataset.set_permissions({"users": {}, "groups": {group.name: ["base.view_resourcebase"]}})
+        self.assertNotIn(self.dataset.id, self._visible_ids(self.marty))
+
+        self.marty.groups.add(group)
+        self.assertIn(self.dataset.id, self._visible_ids(self.marty))
+        group.delete()
+
+    def test_rebuild_matches_guardian(self):
+        ResourceVisibility.objects.all().delete()
+        list(permissions_registry.rebuild_visibility_index(batch_size=2))
+
+        with override_settings(RESOURCE_VISIBILITY_INDEX_ENABLED=False):
+            expected = set(self._visible_ids(self.marty))
+        self.assertSetEqual(expected, set(self._visible_ids(self.marty)))
+
+
 class TestUserCanDo(GeoNodeBaseTestSupport):
     @classmethod
     def setUpClass(cls) -> None:
@@ -3535,6 +3627,13 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
     def setUp(self):
         cache.clear()
 
+    def _cached_perms(self, resource_pk, user=None, group=None):
+        """Return the permissions cached under the current generation of the resource and user/group"""
+        cache_key = permissions_registry._get_cache_key(
+            [resource_pk], users=[user] if user else None, groups=[group] if group else None
+        )
+        return cache.get(cache_key)
+
     def test_admin_user_permissions_caching(self):
         test_resource = self.resources[0]
 
@@ -3624,22 +3723,22 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         permissions_registry.get_perms(instance=test_resource, group=self.test_group, use_cache=True)
 
         # Updated cache key formats
-        anonymous_key = f"resource_perms:{test_resource.pk}:anonymous"
-        admin_key = f"resource_perms:{test_resource.pk}:user:{self.admin_user.pk}"
-        test_user_key = f"resource_perms:{test_resource.pk}:user:{self.test_user.pk}"
-        group_key = f"resource_perms:{test_resource.pk}:group:{self.test_group.pk}"
+        anonymous_key = partial(self._cached_perms, test_resource.pk, user=anonymous_user)
+        admin_key = partial(self._cached_perms, test_resource.pk, user=self.admin_user)
+        test_user_key = partial(self._cached_perms, test_resource.pk, user=self.test_user)
+        group_key = partial(self._cached_perms, test_resource.pk, group=self.test_group)
 
         # Verify all cache keys exist
-        self.assertIsNotNone(cache.get(anonymous_key))
-        self.assertIsNotNone(cache.get(admin_key))
-        self.assertIsNotNone(cache.get(test_user_key))
-        self.assertIsNotNone(cache.get(group_key))
+        self.assertIsNotNone(anonymous_key())
+        self.assertIsNotNone(admin_key())
+        self.assertIsNotNone(test_user_key())
+        self.assertIsNotNone(group_key())
 
         # Verify cached values are different
-        anon_cached = cache.get(anonymous_key)
-        admin_cached = cache.get(admin_key)
-        user_cached = cache.get(test_user_key)
-        group_cached = cache.get(group_key)
+        anon_cached = anonymous_key()
+        admin_cached = admin_key()
+        user_cached = test_user_key()
+        group_cached = group_key()
 
         self.assertNotEqual(anon_cached, admin_cached)
         self.assertNotEqual(anon_cached, user_cached)
@@ -3657,11 +3756,11 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         self.assertEqual(perms_r1, perms_r2)
 
         # Updated cache key format
-        cache_key_r1 = f"resource_perms:{resource_1.pk}:user:{self.test_user.pk}"
-        cache_key_r2 = f"resource_perms:{resource_2.pk}:user:{self.test_user.pk}"
+        cache_key_r1 = partial(self._cached_perms, resource_1.pk, user=self.test_user)
+        cache_key_r2 = partial(self._cached_perms, resource_2.pk, user=self.test_user)
 
-        self.assertIsNotNone(cache.get(cache_key_r1))
-        self.assertIsNotNone(cache.get(cache_key_r2))
+        self.assertIsNotNone(cache_key_r1())
+        self.assertIsNotNone(cache_key_r2())
 
     def test_cache_key_generation_consistency(self):
         """
@@ -3672,29 +3771,29 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         anonymous_user = AnonymousUser()
 
         # Test authenticated user cache key
-        expected_admin_key = f"resource_perms:{test_resource.pk}:user:{self.admin_user.pk}"
+        expected_admin_key = f"resource_perms:{test_resource.pk}:user:{self.admin_user.pk}:v"
         actual_admin_key = permissions_registry._get_cache_key([test_resource.pk], users=[self.admin_user])
-        self.assertEqual(actual_admin_key, expected_admin_key)
+        self.assertTrue(actual_admin_key.startswith(expected_admin_key))
 
         # Test test user cache key
-        expected_test_user_key = f"resource_perms:{test_resource.pk}:user:{self.test_user.pk}"
+        expected_test_user_key = f"resource_perms:{test_resource.pk}:user:{self.test_user.pk}:v"
         actual_test_user_key = permissions_registry._get_cache_key([test_resource.pk], users=[self.test_user])
-        self.assertEqual(actual_test_user_key, expected_test_user_key)
+        self.assertTrue(actual_test_user_key.startswith(expected_test_user_key))
 
         # Test anonymous user cache key
-        expected_anon_key = f"resource_perms:{test_resource.pk}:anonymous"
+        expected_anon_key = f"resource_perms:{test_resource.pk}:anonymous:v"
         actual_anon_key = permissions_registry._get_cache_key([test_resource.pk], users=[anonymous_user])
-        self.assertEqual(actual_anon_key, expected_anon_key)
+        self.assertTrue(actual_anon_key.startswith(expected_anon_key))
 
         # Test group cache key
-        expected_group_key = f"resource_perms:{test_resource.pk}:group:{self.test_group.pk}"
+        expected_group_key = f"resource_perms:{test_resource.pk}:group:{self.test_group.pk}:v"
         actual_group_key = permissions_registry._get_cache_key([test_resource.pk], groups=[self.test_group])
-        self.assertEqual(actual_group_key, expected_group_key)
+        self.assertTrue(actual_group_key.startswith(expected_group_key))
 
         # Test __ALL__ cache key (when both user and group are None)
-        expected_all_key = f"resource_perms:{test_resource.pk}:__ALL__"
+        expected_all_key = f"resource_perms:{test_resource.pk}:__ALL__:v"
         actual_all_key = permissions_registry._get_cache_key([test_resource.pk], users=None, groups=None)
-        self.assertEqual(actual_all_key, expected_all_key)
+        self.assertTrue(actual_all_key.startswith(expected_all_key))
 
         # Test that keys are unique for different users and groups
         cache_keys = [actual_admin_key, actual_test_user_key, actual_anon_key, actual_group_key, actual_all_key]
@@ -3718,11 +3817,11 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
     def test_cache_invalidation_on_permission_change(self):
         """Test that cache is properly invalidated when permissions are actually changed"""
         test_resource = self.resources[0]
-        cache_key = f"resource_perms:{test_resource.pk}:user:{self.test_user.pk}"
+        cache_key = partial(self._cached_perms, test_resource.pk, user=self.test_user)
 
         initial_perms = permissions_registry.get_perms(instance=test_resource, user=self.test_user, use_cache=True)
 
-        self.assertIsNotNone(cache.get(cache_key))
+        self.assertIsNotNone(cache_key())
         self.assertIn("view_resourcebase", initial_perms)
         self.assertIn("change_resourcebase", initial_perms)
         self.assertIn("delete_resourcebase", initial_perms)
@@ -3747,11 +3846,11 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
 
         test_resource.set_permissions(new_perm_spec)
 
-        self.assertIsNone(cache.get(cache_key), "Cache should be cleared after permission change")
+        self.assertIsNone(cache_key(), "Cache should be cleared after permission change")
 
         updated_perms = permissions_registry.get_perms(instance=test_resource, user=self.test_user, use_cache=True)
 
-        self.assertIsNotNone(cache.get(cache_key), "Cache should be populated after fresh permission fetch")
+        self.assertIsNotNone(cache_key(), "Cache should be populated after fresh permission fetch")
 
         self.assertIn("view_resourcebase", updated_perms)
         self.assertNotIn("change_resourcebase", updated_perms)
@@ -3782,10 +3881,10 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
 
         test_resource.set_permissions(restored_perm_spec)
 
-        self.assertIsNone(cache.get(cache_key), "Cache should be cleared after second permission change")
+        self.assertIsNone(cache_key(), "Cache should be cleared after second permission change")
 
         final_perms = permissions_registry.get_perms(instance=test_resource, user=self.test_user, use_cache=True)
-        self.assertIsNotNone(cache.get(cache_key), "Cache should be populated after final permission fetch")
+        self.assertIsNotNone(cache_key(), "Cache should be populated after final permission fetch")
 
         self.assertIn("view_resourcebase", final_perms)
         self.assertIn("change_resourcebase", final_perms)
@@ -3826,27 +3925,30 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         for resource in self.resources[:2]:
             perms = permissions_registry.get_perms(instance=resource, user=temp_user, use_cache=True)
             cached_perms.append(perms)
-            cache_key = f"resource_perms:{resource.pk}:user:{temp_user.pk}"
+            cache_key = partial(self._cached_perms, resource.pk, user=temp_user)
             cache_keys.append(cache_key)
 
             # Verify permissions are cached
-            self.assertIsNotNone(cache.get(cache_key))
+            self.assertIsNotNone(cache_key())
             self.assertIn("view_resourcebase", perms)
 
         other_user_cache_keys = []
         for resource in self.resources[:2]:
             permissions_registry.get_perms(instance=resource, user=self.test_user, use_cache=True)
-            other_key = f"resource_perms:{resource.pk}:user:{self.test_user.pk}"
+            other_key = partial(self._cached_perms, resource.pk, user=self.test_user)
             other_user_cache_keys.append(other_key)
-            self.assertIsNotNone(cache.get(other_key))
+            self.assertIsNotNone(other_key())
 
+        temp_user_pk = temp_user.pk
         temp_user.delete()
+        # deletion resets the primary key the generations are looked up by
+        temp_user.pk = temp_user_pk
 
         for cache_key in cache_keys:
-            self.assertIsNone(cache.get(cache_key), f"Cache key {cache_key} should be cleared after user deletion")
+            self.assertIsNone(cache_key(), f"Cache key {cache_key.args} should be cleared after user deletion")
 
         for other_key in other_user_cache_keys:
-            self.assertIsNotNone(cache.get(other_key), f"Cache key {other_key} should not be affected by user deletion")
+            self.assertIsNotNone(other_key(), f"Cache key {other_key.args} should not be affected by user deletion")
 
     def test_group_deletion_cache_invalidation(self):
         """Test that cache is properly cleared when a group is deleted"""
@@ -3878,19 +3980,19 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         group_cache_keys = []
         for resource in self.resources[:2]:
             perms = permissions_registry.get_perms(instance=resource, group=temp_group, use_cache=True)
-            cache_key = f"resource_perms:{resource.pk}:group:{temp_group.pk}"
+            cache_key = partial(self._cached_perms, resource.pk, group=temp_group)
             group_cache_keys.append(cache_key)
 
-            self.assertIsNotNone(cache.get(cache_key))
+            self.assertIsNotNone(cache_key())
             self.assertIn("view_resourcebase", perms)
 
         user_cache_keys = []
         for resource in self.resources[:2]:
             for user in [self.test_user, self.admin_user]:
                 permissions_registry.get_perms(instance=resource, user=user, use_cache=True)
-                cache_key = f"resource_perms:{resource.pk}:user:{user.pk}"
+                cache_key = partial(self._cached_perms, resource.pk, user=user)
                 user_cache_keys.append(cache_key)
-                self.assertIsNotNone(cache.get(cache_key))
+                self.assertIsNotNone(cache_key())
 
         unrelated_user = get_user_model().objects.create_user(
             username=f"unrelated_user_{uuid4()}", email="unrelated@example.com", password="unrelated123"
@@ -3899,16 +4001,17 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         unrelated_cache_keys = []
         for resource in self.resources[:2]:
             permissions_registry.get_perms(instance=resource, user=unrelated_user, use_cache=True)
-            cache_key = f"resource_perms:{resource.pk}:user:{unrelated_user.pk}"
+            cache_key = partial(self._cached_perms, resource.pk, user=unrelated_user)
             unrelated_cache_keys.append(cache_key)
-            self.assertIsNotNone(cache.get(cache_key))
+            self.assertIsNotNone(cache_key())
 
+        temp_group_pk = temp_group.pk
         temp_group.delete()
+        # deletion resets the primary key the generations are looked up by
+        temp_group.pk = temp_group_pk
 
         for cache_key in group_cache_keys:
-            self.assertIsNone(
-                cache.get(cache_key), f"Group cache key {cache_key} should be cleared after group deletion"
-            )
+            self.assertIsNone(cache_key(), f"Group cache key {cache_key.args} should be cleared after group deletion")
 
     def test_resource_deletion_cache_invalidation(self):
         """Test that cache is properly cleared when a resource is deleted"""
@@ -3947,28 +4050,28 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         cache_keys_to_check = []
 
         user_perms = permissions_registry.get_perms(instance=temp_resource, user=self.test_user, use_cache=True)
-        test_user_key = f"resource_perms:{temp_resource.pk}:user:{self.test_user.pk}"
+        test_user_key = partial(self._cached_perms, temp_resource.pk, user=self.test_user)
         cache_keys_to_check.append(test_user_key)
 
         admin_perms = permissions_registry.get_perms(instance=temp_resource, user=self.admin_user, use_cache=True)
-        admin_user_key = f"resource_perms:{temp_resource.pk}:user:{self.admin_user.pk}"
+        admin_user_key = partial(self._cached_perms, temp_resource.pk, user=self.admin_user)
         cache_keys_to_check.append(admin_user_key)
 
         anonymous_user = AnonymousUser()
         anon_perms = permissions_registry.get_perms(instance=temp_resource, user=anonymous_user, use_cache=True)
-        anon_key = f"resource_perms:{temp_resource.pk}:anonymous"
+        anon_key = partial(self._cached_perms, temp_resource.pk, user=anonymous_user)
         cache_keys_to_check.append(anon_key)
 
         group_perms = permissions_registry.get_perms(instance=temp_resource, group=self.test_group, use_cache=True)
-        group_key = f"resource_perms:{temp_resource.pk}:group:{self.test_group.pk}"
+        group_key = partial(self._cached_perms, temp_resource.pk, group=self.test_group)
         cache_keys_to_check.append(group_key)
 
         permissions_registry.get_perms(instance=temp_resource, use_cache=True)
-        all_key = f"resource_perms:{temp_resource.pk}:__ALL__"
+        all_key = partial(self._cached_perms, temp_resource.pk)
         cache_keys_to_check.append(all_key)
 
         for cache_key in cache_keys_to_check:
-            self.assertIsNotNone(cache.get(cache_key), f"Cache key {cache_key} should exist before deletion")
+            self.assertIsNotNone(cache_key(), f"Cache key {cache_key.args} should exist before deletion")
 
         self.assertIn("view_resourcebase", user_perms)
         self.assertIn("change_resourcebase", user_perms)
@@ -3981,17 +4084,17 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         self.assertIn("view_resourcebase", group_perms)
 
         other_resource = self.resources[0]
-        other_resource_key = f"resource_perms:{other_resource.pk}:user:{self.test_user.pk}"
+        other_resource_key = partial(self._cached_perms, other_resource.pk, user=self.test_user)
         permissions_registry.get_perms(instance=other_resource, user=self.test_user, use_cache=True)
-        self.assertIsNotNone(cache.get(other_resource_key))
+        self.assertIsNotNone(other_resource_key())
 
         temp_resource.delete()
 
         for cache_key in cache_keys_to_check:
-            self.assertIsNone(cache.get(cache_key), f"Cache key {cache_key} should be cleared after resource deletion")
+            self.assertIsNone(cache_key(), f"Cache key {cache_key.args} should be cleared after resource deletion")
 
         self.assertIsNotNone(
-            cache.get(other_resource_key), "Cache keys for other resources should not be affected by resource deletion"
+            other_resource_key(), "Cache keys for other resources should not be affected by resource deletion"
         )
 
     def test_delete_resource_permissions_cache_function(self):
@@ -4033,88 +4136,88 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
             instance=test_resource, user=self.test_user, group=self.test_group, use_cache=True
         )
 
-        temp_user_key = f"resource_perms:{test_resource.pk}:user:{temp_user.pk}"
-        test_user_key = f"resource_perms:{test_resource.pk}:user:{self.test_user.pk}"
-        anonymous_key = f"resource_perms:{test_resource.pk}:anonymous"
-        temp_group_key = f"resource_perms:{test_resource.pk}:group:{temp_group.pk}"
-        test_group_key = f"resource_perms:{test_resource.pk}:group:{self.test_group.pk}"
-        all_key = f"resource_perms:{test_resource.pk}:__ALL__"
+        temp_user_key = partial(self._cached_perms, test_resource.pk, user=temp_user)
+        test_user_key = partial(self._cached_perms, test_resource.pk, user=self.test_user)
+        anonymous_key = partial(self._cached_perms, test_resource.pk, user=anonymous_user)
+        temp_group_key = partial(self._cached_perms, test_resource.pk, group=temp_group)
+        test_group_key = partial(self._cached_perms, test_resource.pk, group=self.test_group)
+        all_key = partial(self._cached_perms, test_resource.pk)
 
-        self.assertIsNotNone(cache.get(temp_user_key))
-        self.assertIsNotNone(cache.get(test_user_key))
-        self.assertIsNotNone(cache.get(anonymous_key))
-        self.assertIsNotNone(cache.get(temp_group_key))
-        self.assertIsNotNone(cache.get(test_group_key))
-        self.assertIsNotNone(cache.get(all_key))
+        self.assertIsNotNone(temp_user_key())
+        self.assertIsNotNone(test_user_key())
+        self.assertIsNotNone(anonymous_key())
+        self.assertIsNotNone(temp_group_key())
+        self.assertIsNotNone(test_group_key())
+        self.assertIsNotNone(all_key())
 
         permissions_registry.delete_resource_permissions_cache(temp_user, group_clear_cache=False)
 
-        self.assertIsNone(cache.get(temp_user_key))
-        self.assertIsNotNone(cache.get(test_user_key))
-        self.assertIsNotNone(cache.get(anonymous_key))
-        self.assertIsNotNone(cache.get(temp_group_key))
-        self.assertIsNotNone(cache.get(test_group_key))
-        self.assertIsNotNone(cache.get(all_key))
+        self.assertIsNone(temp_user_key())
+        self.assertIsNotNone(test_user_key())
+        self.assertIsNotNone(anonymous_key())
+        self.assertIsNotNone(temp_group_key())
+        self.assertIsNotNone(test_group_key())
+        self.assertIsNotNone(all_key())
 
         permissions_registry.get_perms(instance=test_resource, user=temp_user, use_cache=True)
-        self.assertIsNotNone(cache.get(temp_user_key))
+        self.assertIsNotNone(temp_user_key())
 
         permissions_registry.delete_resource_permissions_cache(anonymous_user, group_clear_cache=False)
 
-        self.assertIsNotNone(cache.get(temp_user_key))
-        self.assertIsNotNone(cache.get(test_user_key))
-        self.assertIsNone(cache.get(anonymous_key))
-        self.assertIsNotNone(cache.get(temp_group_key))
-        self.assertIsNotNone(cache.get(test_group_key))
-        self.assertIsNotNone(cache.get(all_key))
+        self.assertIsNotNone(temp_user_key())
+        self.assertIsNotNone(test_user_key())
+        self.assertIsNone(anonymous_key())
+        self.assertIsNotNone(temp_group_key())
+        self.assertIsNotNone(test_group_key())
+        self.assertIsNotNone(all_key())
 
         permissions_registry.get_perms(instance=test_resource, user=anonymous_user, use_cache=True)
-        self.assertIsNotNone(cache.get(anonymous_key))
+        self.assertIsNotNone(anonymous_key())
 
         permissions_registry.delete_resource_permissions_cache(temp_group, user_clear_cache=False)
 
-        self.assertIsNotNone(cache.get(temp_user_key))
-        self.assertIsNotNone(cache.get(test_user_key))
-        self.assertIsNotNone(cache.get(anonymous_key))
-        self.assertIsNone(cache.get(temp_group_key))
-        self.assertIsNotNone(cache.get(test_group_key))
-        self.assertIsNotNone(cache.get(all_key))
+        self.assertIsNotNone(temp_user_key())
+        self.assertIsNotNone(test_user_key())
+        self.assertIsNotNone(anonymous_key())
+        self.assertIsNone(temp_group_key())
+        self.assertIsNotNone(test_group_key())
+        self.assertIsNotNone(all_key())
 
         permissions_registry.get_perms(instance=test_resource, group=temp_group, use_cache=True)
-        self.assertIsNotNone(cache.get(temp_group_key))
+        self.assertIsNotNone(temp_group_key())
 
         permissions_registry.delete_resource_permissions_cache(test_resource)
 
-        self.assertIsNone(cache.get(temp_user_key))
-        self.assertIsNone(cache.get(test_user_key))
-        self.assertIsNone(cache.get(anonymous_key))
-        self.assertIsNone(cache.get(temp_group_key))
-        self.assertIsNone(cache.get(test_group_key))
-        self.assertIsNone(cache.get(all_key))
+        self.assertIsNone(temp_user_key())
+        self.assertIsNone(test_user_key())
+        self.assertIsNone(anonymous_key())
+        self.assertIsNone(temp_group_key())
+        self.assertIsNone(test_group_key())
+        self.assertIsNone(all_key())
 
         other_resource = self.resources[1]
         permissions_registry.get_perms(instance=other_resource, user=self.test_user, use_cache=True)
-        other_resource_key = f"resource_perms:{other_resource.pk}:user:{self.test_user.pk}"
-        self.assertIsNotNone(cache.get(other_resource_key))
+        other_resource_key = partial(self._cached_perms, other_resource.pk, user=self.test_user)
+        self.assertIsNotNone(other_resource_key())
 
         permissions_registry.delete_resource_permissions_cache(test_resource)
-        self.assertIsNotNone(cache.get(other_resource_key))
+        self.assertIsNotNone(other_resource_key())
 
         permissions_registry.get_perms(instance=test_resource, user=temp_user, use_cache=True)
         permissions_registry.get_perms(instance=test_resource, group=temp_group, use_cache=True)
         permissions_registry.get_perms(instance=test_resource, user=temp_user, group=temp_group, use_cache=True)
 
-        self.assertIsNotNone(cache.get(temp_user_key))
-        self.assertIsNotNone(cache.get(temp_group_key))
+        self.assertIsNotNone(temp_user_key())
+        self.assertIsNotNone(temp_group_key())
 
         permissions_registry.delete_resource_permissions_cache(temp_user, group_clear_cache=False)
-        self.assertIsNone(cache.get(temp_user_key))
-        self.assertIsNotNone(cache.get(temp_group_key))
+        self.assertIsNone(temp_user_key())
+        self.assertIsNotNone(temp_group_key())
 
         permissions_registry.get_perms(instance=test_resource, user=temp_user, use_cache=True)
         permissions_registry.delete_resource_permissions_cache(temp_group, user_clear_cache=False)
-        self.assertIsNotNone(cache.get(temp_user_key))
-        self.assertIsNone(cache.get(temp_group_key))
+        self.assertIsNotNone(temp_user_key())
+        self.assertIsNone(temp_group_key())
 
         temp_user.delete()
         temp_group_profile.delete()
@@ -4125,11 +4228,11 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         test_resource = self.resources[0]
         anonymous_user = Profile.objects.get(username="AnonymousUser")
 
-        admin_key = f"resource_perms:{test_resource.pk}:user:{self.admin_user.pk}"
-        test_user_key = f"resource_perms:{test_resource.pk}:user:{self.test_user.pk}"
-        anonymous_key = f"resource_perms:{test_resource.pk}:anonymous"
-        group_key = f"resource_perms:{test_resource.pk}:group:{self.test_group.pk}"
-        all_key = f"resource_perms:{test_resource.pk}:__ALL__"
+        admin_key = partial(self._cached_perms, test_resource.pk, user=self.admin_user)
+        test_user_key = partial(self._cached_perms, test_resource.pk, user=self.test_user)
+        anonymous_key = partial(self._cached_perms, test_resource.pk, user=anonymous_user)
+        group_key = partial(self._cached_perms, test_resource.pk, group=self.test_group)
+        all_key = partial(self._cached_perms, test_resource.pk)
 
         permissions_registry.get_perms(instance=test_resource, user=self.admin_user, use_cache=True)
         permissions_registry.get_perms(instance=test_resource, user=self.test_user, use_cache=True)
@@ -4137,19 +4240,75 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         permissions_registry.get_perms(instance=test_resource, group=self.test_group, use_cache=True)
         permissions_registry.get_perms(instance=test_resource, use_cache=True)
 
-        self.assertIsNotNone(cache.get(admin_key))
-        self.assertIsNotNone(cache.get(test_user_key))
-        self.assertIsNotNone(cache.get(anonymous_key))
-        self.assertIsNotNone(cache.get(group_key))
-        self.assertIsNotNone(cache.get(all_key))
+        self.assertIsNotNone(admin_key())
+        self.assertIsNotNone(test_user_key())
+        self.assertIsNotNone(anonymous_key())
+        self.assertIsNotNone(group_key())
+        self.assertIsNotNone(all_key())
+
+        permissions_registry.clear_permissions_cache()
+
+        self.assertIsNone(admin_key())
+        self.assertIsNone(test_user_key())
+        self.assertIsNone(anonymous_key())
+        self.assertIsNone(group_key())
+        self.assertIsNone(all_key())
+
+    def test_clear_permissions_cache_keeps_unrelated_entries(self):
+        """clear_permissions_cache only invalidates the permissions namespace of the default cache."""
+        cache.set("unrelated_key", "value")
+        permissions_registry.get_perms(instance=self.resources[0], user=self.test_user, use_cache=True)
 
         permissions_registry.clear_permissions_cache()
 
-        self.assertIsNone(cache.get(admin_key))
-        self.assertIsNone(cache.get(test_user_key))
-        self.assertIsNone(cache.get(anonymous_key))
-        self.assertIsNone(cache.get(group_key))
-        self.assertIsNone(cache.get(all_key))
+        self.assertIsNone(self._cached_perms(self.resources[0].pk, user=self.test_user))
+        self.assertEqual(cache.get("unrelated_key"), "value")
+
+    def test_batch_invalidations(self):
+        """Invalidations issued inside batch_invalidations are applied once, when the block exits."""
+        resources = self.resources[:3]
+        for resource in resources:
+            permissions_registry.get_perms(instance=resource, user=self.test_user, use_cache=True)
+
+        with patch.object(
+            permissions_registry, "_bump_generations", wraps=permissions_registry._bump_generations
+        ) as bump:
+            with permissions_registry.batch_invalidations():
+                for resource in resources:
+                    permissions_registry.delete_resource_permissions_cache(resource)
+                permissions_registry.delete_resource_permissions_cache(resources[0])
+
+                bump.assert_not_called()
+                for resource in resources:
+                    self.assertIsNotNone(self._cached_perms(resource.pk, user=self.test_user))
+
+        bump.assert_called_once()
+        self.assertEqual(len(bump.call_args[0][0]), len(resources))
+        for resource in resources:
+            self.assertIsNone(self._cached_perms(resource.pk, user=self.test_user))
+
+    def test_get_perms_bulk(self):
+        """get_perms_bulk returns the same permissions as get_perms, resource by resource."""
+        for user in (self.test_user, self.admin_user, self.test_user_owner, AnonymousUser()):
+            bulk_perms = permissions_registry.get_perms_bulk(self.resources, user)
+            self.assertEqual(set(bulk_perms.keys()), {resource.pk for resource in self.resources})
+            for resource in self.resources:
+                self.assertSetEqual(
+                    set(bulk_perms[resource.pk]),
+                    set(permissions_registry.get_perms(instance=resource, user=user)),
+                    f"Mismatching permissions for {user} on {resource}",
+                )
+
+    def test_get_perms_bulk_uses_cache(self):
+        """get_perms_bulk reads and fills the same cache entries as get_perms."""
+        cached_perms = permissions_registry.get_perms(instance=self.resources[0], user=self.test_user, use_cache=True)
+
+        bulk_perms = permissions_registry.get_perms_bulk(self.resources[:2], self.test_user, use_cache=True)
+
+        self.assertEqual(bulk_perms[self.resources[0].pk], cached_perms)
+        self.assertEqual(
+            self._cached_perms(self.resources[1].pk, user=self.test_user), bulk_perms[self.resources[1].pk]
+        )
 
     def test_configuration_read_only_change_clears_permissions_cache(self):
         """Permissions cache is cleared when read_only flag changes."""
@@ -4172,6 +4331,7 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
             config.read_only = True
             config.save()
 
+            cache_key = permissions_registry._get_cache_key([test_resource.pk], users=[user])
             self.assertIsNone(cache.get(cache_key))
         finally:
             config.read_only = original_read_only
@@ -4203,6 +4363,7 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         self.assertIsNotNone(cache.get(cache_key))
 
         permissions_registry.delete_resource_permissions_cache(self.test_user)
+        cache_key = permissions_registry._get_global_cache_key(self.test_user)
         self.assertIsNone(cache.get(cache_key))
 
     def test_global_perms_cache_cleared_on_group_activity(self):
@@ -4213,6 +4374,7 @@ class TestPermissionsCaching(GeoNodeBaseTestSupport):
         self.assertIsNotNone(cache.get(cache_key))
 
         permissions_registry.delete_resource_permissions_cache(self.test_group)
+        cache_key = permissions_registry._get_global_cache_key(self.admin_user)
         self.assertIsNone(cache.get(cache_key))
 
     def test_global_perms_cache_cleared_on_superuser_flag_change(self):
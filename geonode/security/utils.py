@@ -136,6 +136,17 @@ def get_user_groups(owner, group=None):
     return list(set(user_groups))
 
 
+def get_user_visibility_fingerprint(user) -> str:
+    """
+    Returns a string identifying what the user is allowed to see: its identity, groups and admin flags.
+    Can be used to key cached results depending on the resources visible to the user.
+    """
+    if not user or user.is_anonymous:
+        return "anonymous"
+    groups = sorted(user.groups.values_list("id", flat=True))
+    return f"user:{user.pk}:{int(user.is_superuser)}{int(user.is_staff)}:{','.join(map(str, groups))}"
+
+
 def get_user_visible_groups(user, include_public_invite: bool = False):
     """
     Retrieves all the groups accordingly to the following conditions:
@@ -617,33 +628,34 @@ class AdvancedSecurityWorkflowManager:
                     user, ["base.view_resourcebase", "base.change_resourcebase"], any_perm=True
                 ).filter(owner=user)
                 _resources = queryset.iterator()
-            for _r in _resources:
-                perm_spec = permissions_registry.get_perms(instance=_r)
-                if "users" not in perm_spec:
-                    perm_spec["users"] = {}
-                if "groups" not in perm_spec:
-                    perm_spec["groups"] = {}
-
-                AdminViewPermissionsSet = AdvancedSecurityWorkflowManager.compute_admin_and_view_permissions_set(
-                    _r.uuid, instance=_r
-                )
-
-                prev_perms = AdminViewPermissionsSet.view_perms.copy()
-                if not role:
-                    prev_perms = []
-                    if user == _r.owner:
-                        _group = group if hasattr(group, "group") else GroupProfile.objects.get(group=group)
-                        _users = list(_group.get_managers()) + list(_group.get_members())
-                        for _m in _users:
-                            if perm_spec["users"].get(_m, None):
-                                perm_spec["users"].pop(_m)
-
-                        if perm_spec["groups"].get(_group.group, None):
-                            perm_spec["groups"].pop(_group.group)
-                elif role == "manager":
-                    prev_perms += AdminViewPermissionsSet.admin_perms.copy()
-                    prev_perms = list(set(prev_perms))
-                perm_spec["users"][user] = list(set(prev_perms))
+            with permissions_registry.batch_invalidations():
+                for _r in _resources:
+                    perm_spec = permissions_registry.get_perms(instance=_r)
+                    if "users" not in perm_spec:
+                        perm_spec["users"] = {}
+                    if "groups" not in perm_spec:
+                        perm_spec["groups"] = {}
+
+                    AdminViewPermissionsSet = AdvancedSecurityWorkflowManager.compute_admin_and_view_permissions_set(
+                        _r.uuid, instance=_r
+                    )
+
+                    prev_perms = AdminViewPermissionsSet.view_perms.copy()
+                    if not role:
+                        prev_perms = []
+                        if user == _r.owner:
+                            _group = group if hasattr(group, "group") else GroupProfile.objects.get(group=group)
+                            _users = list(_group.get_managers()) + list(_group.get_members())
+                            for _m in _users:
+                                if perm_spec["users"].get(_m, None):
+                                    perm_spec["users"].pop(_m)
+
+                            if perm_spec["groups"].get(_group.group, None):
+                                perm_spec["groups"].pop(_group.group)
+                    elif role == "manager":
+                        prev_perms += AdminViewPermissionsSet.admin_perms.copy()
+                        prev_perms = list(set(prev_perms))
+                    perm_spec["users"][user] = list(set(prev_perms))
 
-                # Let's the ResourceManager finally decide which are the correct security settings to apply
-                _r.set_permissions(perm_spec)
+                    # Let's the ResourceManager finally decide which are the correct security settings to apply
+                    _r.set_permissions(perm_spec)
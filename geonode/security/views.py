@@ -331,18 +331,19 @@ def set_bulk_permissions(request):
     resource_ids = request.POST.getlist("resources", [])
     if permission_spec is not None:
         not_permitted = []
-        for resource_id in resource_ids:
-            try:
-                resource = resolve_object(
-                    request, ResourceBase, {"id": resource_id}, "base.change_resourcebase_permissions"
-                )
-                resource.set_permissions(permission_spec)
-            except PermissionDenied:
+        with permissions_registry.batch_invalidations():
+            for resource_id in resource_ids:
                 try:
-                    resolve_object(request, ResourceBase, {"id": resource_id}, "base.change_resourcebase")
+                    resource = resolve_object(
+                        request, ResourceBase, {"id": resource_id}, "base.change_resourcebase_permissions"
+                    )
                     resource.set_permissions(permission_spec)
                 except PermissionDenied:
-                    not_permitted.append(ResourceBase.objects.get(id=resource_id).title)
+                    try:
+                        resolve_object(request, ResourceBase, {"id": resource_id}, "base.change_resourcebase")
+                        resource.set_permissions(permission_spec)
+                    except PermissionDenied:
+                        not_permitted.append(ResourceBase.objects.get(id=resource_id).title)
 
         return HttpResponse(
             json.dumps({"success": "ok", "not_changed": not_permitted}), status=200, content_type="text/plain"
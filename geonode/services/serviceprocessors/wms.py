@@ -116,10 +116,13 @@ class WmsServiceHandler(base.ServiceHandlerBase, base.CascadableServiceHandlerMi
                 if _op_method.get("type", None).upper() == "GET" and _op_method.get("url", None):
                     ogc_wms_url = _op_method.get("url")
 
+        from geonode.geoserver.helpers import gs_catalog_cache
+
         store = self._get_store(create=True)
         store.capabilitiesURL = ogc_wms_url
         cat = store.catalog
         cat.save(store)
+        gs_catalog_cache.invalidate_store(store.name, workspace=store.workspace.name)
         return store
 
     def create_geonode_service(self, owner, parent=None):
@@ -247,6 +250,8 @@ class WmsServiceHandler(base.ServiceHandlerBase, base.CascadableServiceHandlerMi
 
     def _import_cascaded_resource(self, service, dataset_meta):
         """Import a layer into geoserver in order to enable cascading."""
+        from geonode.geoserver.helpers import gs_catalog_cache
+
         store = self._get_store(create=False)
         if not store:
             store = self.create_cascaded_store(service)
@@ -263,6 +268,7 @@ class WmsServiceHandler(base.ServiceHandlerBase, base.CascadableServiceHandlerMi
             # has been fixed
             dataset_resource.projection_policy = "REPROJECT_TO_DECLARED"
             cat.save(dataset_resource)
+            gs_catalog_cache.invalidate_dataset(dataset_meta.id)
             if dataset_resource is None:
                 raise RuntimeError(f"Could not cascade resource {dataset_meta} through " "geoserver")
             dataset_resource = dataset_resource.resource
@@ -939,6 +939,16 @@ PROXY_ALLOWED_PARAMS_NEEDLES = ast.literal_eval(os.getenv("PROXY_ALLOWED_PARAMS_
 # Tuple with valid strings to be matched inside the request path to let it pass through the proxy
 PROXY_ALLOWED_PATH_NEEDLES = ast.literal_eval(os.getenv("PROXY_ALLOWED_PATH_NEEDLES", "()"))
 
+# Stream the proxied responses to the client in chunks instead of buffering the whole upstream body
+PROXY_STREAM_RESPONSES = ast.literal_eval(os.getenv("PROXY_STREAM_RESPONSES", "False"))
+
+# Seconds the responses to idempotent OWS requests sent through the proxy are cached, 0 disables the cache
+PROXY_OWS_CACHE_TIMEOUT = int(os.getenv("PROXY_OWS_CACHE_TIMEOUT", "0"))
+# OWS requests whose responses are cached by the proxy
+PROXY_OWS_CACHED_REQUESTS = ast.literal_eval(
+    os.getenv("PROXY_OWS_CACHED_REQUESTS", '("GetCapabilities", "DescribeFeatureType")')
+)
+
 # The proxy to use when making cross origin requests.
 PROXY_URL = os.environ.get("PROXY_URL", "/proxy/?url=")
 SAFE_URL_CHECK_ENABLED = ast.literal_eval(os.getenv("SAFE_URL_CHECK_ENABLED", "True"))
@@ -946,6 +956,11 @@ SAFE_URL_CHECK_ENABLED = ast.literal_eval(os.getenv("SAFE_URL_CHECK_ENABLED", "T
 # Avoid permissions prefiltering
 SKIP_PERMS_FILTER = ast.literal_eval(os.getenv("SKIP_PERMS_FILTER", "False"))
 
+# Filter visible resources through the denormalized "security.ResourceVisibility" table
+# instead of the guardian object permissions tables.
+# Run the "rebuild_visibility_index" management command before enabling it.
+RESOURCE_VISIBILITY_INDEX_ENABLED = ast.literal_eval(os.getenv("RESOURCE_VISIBILITY_INDEX_ENABLED", "False"))
+
 # Number of items returned by the apis 0 equals no limit
 API_LIMIT_PER_PAGE = int(os.getenv("API_LIMIT_PER_PAGE", "200"))
 API_INCLUDE_REGIONS_COUNT = ast.literal_eval(os.getenv("API_INCLUDE_REGIONS_COUNT", "False"))
@@ -1044,6 +1059,12 @@ OGC_SERVER = {
         "BACKOFF_FACTOR": float(os.getenv("OGC_REQUEST_BACKOFF_FACTOR", "0.3")),
         "POOL_MAXSIZE": int(os.getenv("OGC_REQUEST_POOL_MAXSIZE", "10")),
         "POOL_CONNECTIONS": int(os.getenv("OGC_REQUEST_POOL_CONNECTIONS", "10")),
+        # max concurrent in-flight requests per upstream host, 0 means no limit
+        "POOL_MAX_CONCURRENCY": int(os.getenv("OGC_REQUEST_POOL_MAX_CONCURRENCY", "0")),
+        # seconds the stores, resources and layers read from the REST API are cached (workspaces 10 times longer),
+        # 0 disables the cache. Each process keeps its own objects and learns about the invalidations made by the
+        # other processes through the default cache, which must be shared by the web and the Celery workers
+        "CATALOG_CACHE_TIMEOUT": int(os.getenv("OGC_CATALOG_CACHE_TIMEOUT", "0")),
     }
 }
 
@@ -1084,6 +1105,11 @@ CATALOGUE = {
 
 # pycsw settings
 PYCSW = {
+    # Cache the total of the GetRecords requests sans constraint for the given number of seconds (0 disables it)
+    "TOTAL_CACHE_TIMEOUT": int(os.getenv("PYCSW_TOTAL_CACHE_TIMEOUT", 0)),
+    # On PostgreSQL, use the planner estimate as total of the GetRecords requests sans constraint
+    # when it is larger than this number of records (0 disables it)
+    "TOTAL_ESTIMATE_THRESHOLD": int(os.getenv("PYCSW_TOTAL_ESTIMATE_THRESHOLD", 0)),
     # pycsw configuration
     "CONFIGURATION": {
         # uncomment / adjust to override server config system defaults
@@ -1155,7 +1181,7 @@ PYCSW = {
                 "role": "pointOfContact",
             },
         },
-    }
+    },
 }
 
 _DATETIME_INPUT_FORMATS = ["%Y-%m-%d %H:%M:%S.%f %Z", "%Y-%m-%dT%H:%M:%S.%f", "%Y-%m-%dT%H:%M:%S%Z"]
@@ -1504,6 +1530,15 @@ CELERY_TASK_ALWAYS_EAGER = ast.literal_eval(os.environ.get("CELERY_TASK_ALWAYS_E
 CELERY_TASK_EAGER_PROPAGATES = ast.literal_eval(os.environ.get("CELERY_TASK_EAGER_PROPAGATES", "True"))
 CELERY_TASK_IGNORE_RESULT = ast.literal_eval(os.environ.get("CELERY_TASK_IGNORE_RESULT", "True"))
 
+# Seconds without further saves after which the catalogue record of a dataset or document is
+# regenerated asynchronously. The saves performed within this window are coalesced into a single
+# update. 0 regenerates the record synchronously on every save.
+# The debounce requires a default cache shared with the Celery workers (e.g. Redis, as configured when
+# ASYNC_SIGNALS is set): with a per-process cache such as LocMemCache the records are regenerated synchronously.
+CATALOGUE_UPDATE_DEBOUNCE = int(
+    os.environ.get("CATALOGUE_UPDATE_DEBOUNCE", 10 if ASYNC_SIGNALS and not CELERY_TASK_ALWAYS_EAGER else 0)
+)
+
 register("geonode_json", serializer.dumps, serializer.loads, content_type="application/json", content_encoding="utf-8")
 
 # I use these to debug kombu crashes; we get a more informative message.
@@ -1517,6 +1552,23 @@ CELERY_ACCEPT_CONTENT = [
 # in the queue in case of harvesting hundreds of resources
 CHUNK_SIZE = os.environ.get("CHUNK_SIZE", 100)
 MAX_PARALLEL_QUEUE_CHUNKS = os.environ.get("MAX_PARALLEL_QUEUE_CHUNKS", 2)
+# The number of chunks queued in parallel adapts to the latency and error rate of each remote,
+# starting from MAX_PARALLEL_QUEUE_CHUNKS and staying between the following bounds
+HARVESTING_MIN_PARALLEL_QUEUE_CHUNKS = int(os.environ.get("HARVESTING_MIN_PARALLEL_QUEUE_CHUNKS", 1))
+HARVESTING_MAX_PARALLEL_QUEUE_CHUNKS = int(os.environ.get("HARVESTING_MAX_PARALLEL_QUEUE_CHUNKS", 8))
+# Mean latency (seconds) and error rate above which the concurrency is reduced
+HARVESTING_TARGET_LATENCY = float(os.environ.get("HARVESTING_TARGET_LATENCY", 5))
+HARVESTING_MAX_ERROR_RATE = float(os.environ.get("HARVESTING_MAX_ERROR_RATE", 0.1))
+HARVESTING_CONCURRENCY_BACKOFF = float(os.environ.get("HARVESTING_CONCURRENCY_BACKOFF", 0.5))
+# Max requests per second (0 means unlimited) and burst size allowed for each remote host
+HARVESTING_REMOTE_RATE_LIMIT = float(os.environ.get("HARVESTING_REMOTE_RATE_LIMIT", 0))
+HARVESTING_REMOTE_BURST = int(os.environ.get("HARVESTING_REMOTE_BURST", 0))
+# Number of resources harvested by each task, for harvesters that can fetch many resources per request
+# (1 means one task per resource), and number of concurrent requests made by each of these tasks
+HARVESTING_BATCH_SIZE = int(os.environ.get("HARVESTING_BATCH_SIZE", 1))
+HARVESTING_BATCH_FETCH_WORKERS = int(os.environ.get("HARVESTING_BATCH_FETCH_WORKERS", 4))
+# Skip the update of local resources that did not change on the remote since they were last harvested
+HARVESTING_CHANGE_DETECTION = ast.literal_eval(os.environ.get("HARVESTING_CHANGE_DETECTION", "True"))
 HARVESTING_MONITOR_ENABLED = ast.literal_eval(os.environ.get("HARVESTING_MONITOR_ENABLED", "True"))
 HARVESTING_MONITOR_DELAY = int(os.environ.get("HARVESTING_MONITOR_DELAY", 60))
 
@@ -2125,6 +2177,11 @@ MULTILANG_FIELDS = (
     # "abstract",
 )
 
+# Precompile the metadata schemas for all the languages in the background after start and thesaurus updates
+METADATA_SCHEMA_WARMUP = ast.literal_eval(os.getenv("METADATA_SCHEMA_WARMUP", str(not TESTING)))
+# Validate the metadata instances against the JSON schema when updating the resources
+METADATA_VALIDATE_INSTANCE = ast.literal_eval(os.getenv("METADATA_VALIDATE_INSTANCE", "False"))
+
 INSTALLED_APPS += ("geonode.indexing",)
 GEONODE_APPS += ("geonode.indexing",)
 
@@ -2251,6 +2308,12 @@ FACET_PROVIDERS = [
     {"class": "geonode.facets.providers.thesaurus.ThesaurusFacetProvider", "config": {"type": "select"}},
 ]
 
+# Seconds the facet topics and counts are cached per user and filters, 0 disables the cache
+FACETS_CACHE_TIMEOUT = int(os.getenv("FACETS_CACHE_TIMEOUT", "0"))
+
+# Seconds the resource types and counts are cached per user, 0 disables the cache
+RESOURCE_TYPES_CACHE_TIMEOUT = int(os.getenv("RESOURCE_TYPES_CACHE_TIMEOUT", "0"))
+
 DEFAULT_DATASET_DOWNLOAD_HANDLER = "geonode.layers.download_handler.DatasetDownloadHandler"
 
 DATASET_DOWNLOAD_HANDLERS = ast.literal_eval(os.getenv("DATASET_DOWNLOAD_HANDLERS", "[]"))
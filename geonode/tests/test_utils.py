@@ -18,6 +18,7 @@
 #########################################################################
 import copy
 import requests
+import urllib.request
 from requests.models import PreparedRequest, Response
 from unittest import TestCase
 
@@ -43,6 +44,7 @@ from geonode.utils import (
     assert_safe_xml,
     safe_request_url,
     UnsafeXMLError,
+    HttpClient,
 )
 from unittest.mock import MagicMock
 
@@ -503,3 +505,68 @@ class TestSafeRequestUrl(djangoTestCase):
         )
         with self.assertRaises(requests.exceptions.InvalidURL):
             safe_request_url("GET", "http://allowed.invalid/resource")
+
+
+class TestHttpClientPool(djangoTestCase):
+    def setUp(self):
+        self.client = HttpClient()
+        self.client.username = "admin"
+
+    def _ok_response(self):
+        response = Response()
+        response.status_code = 200
+        response._content = b"ok"
+        return response
+
+    @patch("requests.Session.get")
+    def test_sessions_are_pooled_per_host(self, mock_get):
+        mock_get.return_value = self._ok_response()
+
+        self.client.request("http://gs.example.org/geoserver/ows?service=WMS", headers={})
+        self.client.request("http://gs.example.org/geoserver/wfs", headers={})
+        self.client.request("http://other.example.org/wms", headers={})
+
+        self.assertEqual(2, len(self.client._sessions))
+        stats = self.client.get_pool_stats()
+        self.assertEqual(1, stats["http://gs.example.org"]["hits"])
+        self.assertEqual(1, stats["http://gs.example.org"]["misses"])
+        self.assertEqual(1, stats["http://other.example.org"]["misses"])
+
+    @patch("requests.Session.get")
+    def test_pooled_sessions_do_not_keep_cookies(self, mock_get):
+        mock_get.return_value = self._ok_response()
+        self.client.request("http://gs.example.org/geoserver/ows", headers={})
+
+        session = next(iter(self.client._sessions.values()))
+        cookie = requests.cookies.create_cookie("JSESSIONID", "secret", domain="gs.example.org")
+        session.cookies.set_cookie_if_ok(cookie, urllib.request.Request("http://gs.example.org/geoserver/ows"))
+        self.assertEqual(0, len(session.cookies))
+
+    @patch("requests.Session.get")
+    def test_concurrency_limit(self, mock_get):
+        mock_get.return_value = self._ok_response()
+        self.client.max_concurrency = 1
+        self.client.request("http://gs.example.org/geoserver/ows", headers={})
+
+        semaphore = self.client._semaphores["http://gs.example.org"]
+        semaphore.acquire()
+        try:
+            response, content = self.client.request("http://gs.example.org/geoserver/ows", headers={}, timeout=0.1)
+        finally:
+            semaphore.release()
+
+        self.assertIsNone(response)
+        self.assertEqual(1, self.client.get_pool_stats()["http://gs.example.org"]["throttled"])
+
+    @patch("requests.Session.get")
+    def test_streamed_response_holds_concurrency_slot_until_closed(self, mock_get):
+        mock_get.return_value = self._ok_response()
+        self.client.max_concurrency = 1
+
+        response, _content = self.client.request("http://gs.example.org/geoserver/ows", headers={}, stream=True)
+        semaphore = self.client._semaphores["http://gs.example.org"]
+        self.assertFalse(semaphore.acquire(blocking=False))
+
+        response.close()
+        self.assertTrue(semaphore.acquire(blocking=False))
+        semaphore.release()
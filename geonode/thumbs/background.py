@@ -23,7 +23,6 @@ import typing
 import logging
 import math
 import mercantile
-import requests
 
 from io import BytesIO
 from pyproj import Transformer
@@ -514,9 +513,9 @@ class GenericWMTSBackground(BaseThumbBackground):
             try:
                 im = None
                 imgurl = self.build_request([tile_coord[0], tile_coord[1], zoom])
-                resp = requests.get(imgurl)
-                if resp.status_code > 400:
-                    raise Exception(f"{strip_tags(resp.content)}")
+                resp, content = http_client.request(imgurl)
+                if resp is None or resp.status_code > 400:
+                    raise Exception(f"{strip_tags(content)}")
                 im = BytesIO(resp.content)
                 Image.open(im).verify()
                 if im:
@@ -310,6 +310,11 @@ def get_mock(*args):
             return Response(200, fin.read())
 
 
+def request_mock(*args, **kwargs):
+    response = get_mock(*args)
+    return response, response.content if response else None
+
+
 class GeoNodeThumbnailWMTSBackground(GeoNodeBaseTestSupport):
     @classmethod
     def setUpClass(cls):
@@ -353,7 +358,7 @@ layer=Hosted_basemap_inforac_3857&style=default&tilematrixset=default028mm&TileM
 
     @override_settings(THUMBNAIL_BACKGROUND=THUMBNAIL_BACKGROUND)
     @patch("geonode.thumbs.background.WMTS_TILEMATRIXSET_LEVELS", WMTS_TILEMATRIX_LEVELS)
-    @patch("geonode.thumbs.background.requests.get", get_mock)
+    @patch("geonode.thumbs.background.http_client.request", request_mock)
     def test_tile_request(self, *args):
         bbox = [-757689.8225283397, 3557041.3914652625, 4231175.960993547, 5957068.446590988, "EPSG:3857"]
         background = GenericWMTSBackground(thumbnail_width=500, thumbnail_height=200)
@@ -845,9 +845,43 @@ class TestUpsertBaseVectorHandler(TransactionImporterBaseTestSupport):
         )
         ModelSchema.objects.create(name="example_upsert_dataset", db_name="datastore", managed=True)
 
-        with self.assertRaises(Exception) as exp:
-            self.json_handler.upsert_data(self.original, exec_id)
+        with patch.object(
+            BaseVectorFileHandler, "_create_staging_table", wraps=self.json_handler._create_staging_table
+        ) as create_staging_table:
+            with self.assertRaises(Exception) as exp:
+                self.json_handler.upsert_data(self.original, exec_id)
         self.assertEqual(
             str(exp.exception),
             "Error found during the upsert process. Errors are reported inside a CSV file that can be found inside the assets panel.",
         )
+        # the staging table is created only once the features are validated
+        create_staging_table.assert_not_called()
+
+    def test_resolve_upsert_schema_and_feature_to_row(self):
+        """
+        The date fields and the SRID are resolved once per layer and used to build the staged row
+        """
+        from osgeo import osr
+
+        srs = osr.SpatialReference()
+        srs.ImportFromEPSG(4326)
+        datasource = ogr.GetDriverByName("Memory").CreateDataSource("upsert")
+        layer = datasource.CreateLayer("upsert", srs, ogr.wkbPolygon)
+        layer.CreateField(ogr.FieldDefn("fid", ogr.OFTInteger))
+        layer.CreateField(ogr.FieldDefn("Name", ogr.OFTString))
+        layer.CreateField(ogr.FieldDefn("created", ogr.OFTDate))
+        feature = ogr.Feature(layer.GetLayerDefn())
+        feature.SetField("fid", 1)
+        feature.SetField("Name", "foo")
+        feature.SetField("created", "2024/01/31")
+        feature.SetGeometry(ogr.CreateGeometryFromWkt("POLYGON ((0 0,0 1,1 1,0 0))"))
+        layer.CreateFeature(feature)
+
+        layer_schema = self.handler._resolve_upsert_schema(layer, "fid")
+        self.assertEqual(["fid", "name", "created", "geom"], layer_schema["columns"])
+        self.assertEqual("4326", layer_schema["srid"])
+        self.assertEqual([False, False, True], [f["is_date"] for f in layer_schema["fields"]])
+
+        feature_as_dict, row = self.handler._feature_to_row(layer.GetFeature(feature.GetFID()), layer_schema, "fid")
+        self.assertEqual([1, "foo", "2024-01-31", "SRID=4326;MULTIPOLYGON (((0 0,0 1,1 1,0 0)))"], row)
+        self.assertEqual("SRID=4326;MULTIPOLYGON (((0 0,0 1,1 1,0 0)))", feature_as_dict["geom"])
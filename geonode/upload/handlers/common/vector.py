@@ -18,7 +18,7 @@
 #########################################################################
 import ast
 import csv
-import re
+import io
 from datetime import datetime
 from itertools import islice
 from pathlib import Path
@@ -79,6 +79,9 @@ from django.core.exceptions import ValidationError
 
 logger = logging.getLogger("importer")
 
+# column used to keep the order of the features inside the upsert staging table
+UPSERT_STAGING_ROW_COLUMN = "__upsert_row"
+
 
 class BaseVectorFileHandler(BaseHandler):
     """
@@ -1343,6 +1346,8 @@ class BaseVectorFileHandler(BaseHandler):
             - loop on all the values in the new uploaded file
             - if the upsert key exists, is marked as 'to update'
             - if the upsert key does not exists, is maked as 'to insert'
+        The file is read only once: the features are validated and staged in a temporary
+        table (via COPY) and then merged into the dataset table with a single INSERT ... ON CONFLICT
         Before saving the resources, an update of the schema is mandatory
             - the new column are added as nullable to keep the retrocompatibility
             - The pre-existing columns are NOT deleted
@@ -1374,11 +1379,7 @@ class BaseVectorFileHandler(BaseHandler):
             # if for any reason the key is not present, better to raise an error
             raise UpsertException("Was not possible to find the upsert key, upsert is aborted")
 
-        self._validate_single_feature(exec_obj, OriginalResource, upsert_key, layers, iter(layers[0]))
-
-        valid_create, valid_update = self._commit_upsert(
-            model, OriginalResource, upsert_key, iter(layers[0]), exec_obj, layers
-        )
+        valid_create, valid_update = self._upsert_features(OriginalResource, upsert_key, layers[0], exec_obj, layers)
 
         self.create_resourcehandlerinfo(
             handler_module_path=str(self), resource=original_resource, execution_id=exec_obj
@@ -1400,58 +1401,6 @@ class BaseVectorFileHandler(BaseHandler):
         model = ModelSchema.objects.filter(name=original_resource.alternate.split(":")[-1]).first()
         return original_resource, model
 
-    def _commit_upsert(self, model_obj, OriginalResource, upsert_key, layer_iterator, exec_obj=None, layers=None):
-        valid_create = 0
-        valid_update = 0
-        chunk_index = 1
-        try:
-            with transaction.atomic():
-                while True:
-                    # Create an iterator for the next chunk
-                    data_chunk = list(islice(layer_iterator, settings.UPSERT_CHUNK_SIZE))
-
-                    # If the chunk is empty, we've reached the end of the layer
-                    if not data_chunk:
-                        break
-
-                    valid_update, valid_create = self._save_feature(
-                        data_chunk,
-                        model_obj=model_obj,
-                        model_instance=OriginalResource,
-                        upsert_key=upsert_key,
-                        valid_update=valid_update,
-                        valid_create=valid_create,
-                    )
-                    chunk_index += 1
-        except Exception as e:
-            logger.exception(f"Error occurred during feature save in Batch {chunk_index} ({str(e)})")
-            msg = f"Error occurred during feature save in Batch {chunk_index}"
-            if exec_obj and layers:
-                self._create_error_log(exec_obj, layers, [{"error": msg}])
-            raise UpsertException("An internal error occurred while processing the upsert operation.")
-
-        return valid_create, valid_update
-
-    def _validate_single_feature(self, exec_obj, OriginalResource, upsert_key, layers, layer_iterator):
-        errors = []
-        feature_validators_registry.init_handlers(self.real_instance)
-        while True:
-            # Create an iterator for the next chunk
-            data_chunk = list(islice(layer_iterator, settings.UPSERT_CHUNK_SIZE))
-
-            # If the chunk is empty, we've reached the end of the layer
-            if not data_chunk:
-                break
-
-            errors = self._validate_feature(
-                data_chunk, model_instance=OriginalResource, upsert_key=upsert_key, errors=errors
-            )
-
-        if errors:
-            # if some error is found, is useless to keep the VALID feature in memeory, we can just ignore it and proceed:
-            # cleaning up the feature from memory
-            self._create_error_log(exec_obj, layers, errors)
-
     def __get_csv_headers(self):
         constrained_attributes = []
         for handler in feature_validators_registry.HANDLERS:
@@ -1509,90 +1458,202 @@ class BaseVectorFileHandler(BaseHandler):
             "Error found during the upsert process. Errors are reported inside a CSV file that can be found inside the assets panel."
         )
 
-    def _validate_feature(self, data_chunk, model_instance, upsert_key, errors):
-        # looping over the chunk data
-        for feature in data_chunk:
-            feature_as_dict = feature.items()
+    def _resolve_upsert_schema(self, layer, upsert_key):
+        """
+        Resolve once per layer everything needed to translate a feature into a row
+        of the dynamic model table: the laundered column names, which fields are
+        dates (their string value must be normalized), the SRID of the geometries
+        and if the upsert key must be taken from the FID.
+        Some DB drivers with FID columns hide the FID field from the schema,
+        in that case the FID is used as upsert key value
+        """
+        layer_defn = layer.GetLayerDefn()
+        fields = []
+        for index in range(layer_defn.GetFieldCount()):
+            field_defn = layer_defn.GetFieldDefn(index)
+            fields.append(
+                {
+                    "name": field_defn.GetName(),
+                    "column": self.fixup_name(field_defn.GetName()),
+                    "index": index,
+                    "is_date": field_defn.GetType() in (ogr.OFTDate, ogr.OFTDateTime),
+                }
+            )
+
+        columns = [field["column"] for field in fields]
+        if upsert_key not in columns:
+            columns.append(upsert_key)
+
+        srid = None
+        has_geometry = layer.GetGeomType() != ogr.wkbNone
+        if has_geometry:
+            columns.append(self.default_geometry_column_name)
+            spatial_ref = layer.GetSpatialRef()
+            srid = spatial_ref.GetAuthorityCode(None) if spatial_ref else None
+
+        return {
+            "fields": fields,
+            "columns": columns,
+            "has_geometry": has_geometry,
+            "srid": srid,
+        }
+
+    def _feature_to_row(self, feature, layer_schema, upsert_key):
+        """
+        Convert an OGR feature into:
+            - the dictionary used by the feature validators
+            - the list of values to stage, following the order of layer_schema["columns"]
+        """
+        feature_as_dict = feature.items()
+        row = {}
+        for field in layer_schema["fields"]:
+            value = feature_as_dict.get(field["name"])
+            if field["is_date"] and value is not None:
+                # OGR represents the dates as YYYY/MM/DD, the DB expects YYYY-MM-DD
+                value = feature.GetFieldAsString(field["index"]).replace("/", "-")
+            row[field["column"]] = value
+
+        if not row.get(upsert_key) and feature.GetFID() != ogr.NullFID:
+            row[upsert_key] = feature.GetFID()
+
+        if layer_schema["has_geometry"]:
+            wkt = None
             # need to simulate the "promote to multi" used by the upload process.
             # here we cannot rely on ogr2ogr so we need to do it manually
-            geom = feature.GetGeometryRef()
-            if geom:
+            if geom := feature.GetGeometryRef():
                 wkt = self.promote_geom_to_multi(geom).ExportToWkt()
-                if code := geom.GetSpatialReference().GetAuthorityCode(None):
-                    wkt = f"SRID={code};{wkt}"
+                if layer_schema["srid"]:
+                    wkt = f"SRID={layer_schema['srid']};{wkt}"
                 feature_as_dict.update({self.default_geometry_column_name: wkt})
+            row[self.default_geometry_column_name] = wkt
 
-            feature_as_dict, is_valid = self.validate_feature(feature_as_dict)
-            if not is_valid:
-                errors.append(feature_as_dict)
-                continue
+        return feature_as_dict, [row.get(column) for column in layer_schema["columns"]]
 
-        return errors
-
-    def _save_feature(self, data_chunk, model_obj, model_instance, upsert_key, valid_update, valid_create):
-        # getting all the upsert_key value from the data chunk
-        # retrieving the data from the DB
-        use_get_fid = False  # flag to understand if we need to use the GetFID as upsert key, this is needed for DB drivers with FID columns that hide the FID field from the schema
-        filters = []
-        for feature in data_chunk:
-            # DB drivers with FID columns hide the FID field from the schema, so we need to check if the FID is present and use it as upsert key if the upsert key is the default one
-            if not getattr(feature, upsert_key, None) and feature.GetFID() != ogr.NullFID:
-                filters.append(feature.GetFID())
-                use_get_fid = True
-            else:
-                filters.append(getattr(feature, upsert_key))
-        value_in_db = model_instance.objects.filter(**{f"{upsert_key}__in": filters}).in_bulk(field_name=upsert_key)
-        # looping over the chunk data
-        to_process = []
-        feature_to_save = []
-        for feature in data_chunk:
-            feature_as_dict = {self.fixup_name(key): value for key, value in feature.items().items()}
-            # evaluate if there is any date in the schema of the feature
-            schema = feature.DumpReadableAsString().split("\n")
-            if any(date_fields := [f for f in schema if ("(Date)" in f or "(DateTime)" in f) and "(null)" not in f]):
-                # if any field schema as date is found, we can normalize the date
-                pattern = re.compile(r"^\s*(?P<label>.+?)\s*\(\s*(?P<type>.+?)\s*\)\s*=\s*(?P<date_value>.+)\s*$")
-                for fields in date_fields:
-                    match = pattern.search(fields)
-                    label = match.group("label")
-                    date_value = match.group("date_value")
-                    feature_as_dict[label] = date_value.replace("/", "-")
-            # need to simulate the "promote to multi" used by the upload process.
-            # here we cannot rely on ogr2ogr so we need to do it manually
-            geom = feature.GetGeometryRef()
-            if geom:
-                code = geom.GetSpatialReference().GetAuthorityCode(None)
-                feature_as_dict.update(
-                    {self.default_geometry_column_name: f"SRID={code};{self.promote_geom_to_multi(geom).ExportToWkt()}"}
-                )
-            if use_get_fid:
-                feature_as_dict[upsert_key] = feature.GetFID()
-            to_process.append(feature_as_dict)
-
-        for feature_as_dict in to_process:
-            if feature_as_dict.get(upsert_key) in value_in_db:
-                # if the key is present, we need to update the object
-                # the geometry must be treated manually
-                obj = value_in_db[feature_as_dict.get(upsert_key)]
-                for key, value in feature_as_dict.items():
-                    setattr(obj, key, value)
-                feature_to_save.append(obj)
-                valid_update += 1
-            else:
-                # if the key is not present, we can create a new instance
-                feature_to_save.append(model_instance(**feature_as_dict))
-                valid_create += 1
+    def _upsert_features(self, OriginalResource, upsert_key, layer, exec_obj=None, layers=None):
+        """
+        Single pass over the uploaded layer:
+            - each feature is validated and, as long as no error is found, staged
+              into a temporary table with COPY, one chunk at the time. The table is
+              created once the first chunk has been validated, so that an upload
+              failing the validation of its first chunk does not touch the database
+            - the staged rows are merged into the dataset table with a single
+              INSERT ... ON CONFLICT
+        If any feature is not valid, the transaction is rolled back and the error log is created
+        """
+        errors = []
+        valid_create = 0
+        valid_update = 0
+        chunk_index = 1
+        feature_validators_registry.init_handlers(self.real_instance)
+        layer_schema = self._resolve_upsert_schema(layer, upsert_key)
+        db_name = OriginalResource.objects.db
+        connection = connections[db_name]
+        layer_iterator = iter(layer)
         try:
-            schema_fields = [f.name for f in model_obj.fields.filter(kwargs__primary_key__isnull=True)]
-            model_instance.objects.bulk_create(
-                feature_to_save, update_conflicts=True, update_fields=schema_fields, unique_fields=[upsert_key]
-            )
-
+            with transaction.atomic(using=db_name):
+                with connection.cursor() as cursor:
+                    staging_table = None
+                    row_number = 0
+                    while True:
+                        # Create an iterator for the next chunk
+                        data_chunk = list(islice(layer_iterator, settings.UPSERT_CHUNK_SIZE))
+
+                        # If the chunk is empty, we've reached the end of the layer
+                        if not data_chunk:
+                            break
+
+                        rows = []
+                        for feature in data_chunk:
+                            feature_as_dict, row = self._feature_to_row(feature, layer_schema, upsert_key)
+                            feature_as_dict, is_valid = self.validate_feature(feature_as_dict)
+                            if not is_valid:
+                                errors.append(feature_as_dict)
+                                continue
+                            if not errors:
+                                row_number += 1
+                                rows.append(row + [row_number])
+                        # if some error is found, is useless to keep staging the valid features
+                        # we just keep validating to report all the errors
+                        if rows and not errors:
+                            if staging_table is None:
+                                staging_table = self._create_staging_table(
+                                    cursor, connection, OriginalResource, layer_schema
+                                )
+                            self._copy_rows(cursor, connection, staging_table, layer_schema["columns"], rows)
+                        chunk_index += 1
+
+                    if errors:
+                        transaction.set_rollback(True, using=db_name)
+                    elif staging_table is not None:
+                        valid_create, valid_update = self._merge_staged_rows(
+                            cursor, connection, staging_table, OriginalResource, layer_schema["columns"], upsert_key
+                        )
         except Exception as e:
-            logger.exception("Error occurred during bulk upsert in upsert_data.")
-            raise e
+            logger.exception(f"Error occurred during feature save in Batch {chunk_index} ({str(e)})")
+            msg = f"Error occurred during feature save in Batch {chunk_index}"
+            if exec_obj and layers:
+                self._create_error_log(exec_obj, layers, [{"error": msg}])
+            raise UpsertException("An internal error occurred while processing the upsert operation.")
+
+        if errors:
+            self._create_error_log(exec_obj, layers, errors)
+
+        return valid_create, valid_update
 
-        return valid_update, valid_create
+    def _create_staging_table(self, cursor, connection, OriginalResource, layer_schema):
+        """
+        Create a temporary table with the same column types of the dataset table,
+        restricted to the columns provided by the uploaded layer.
+        The table is dropped at the end of the transaction
+        """
+        qn = connection.ops.quote_name
+        staging_table = f"upsert_staging_{OriginalResource._meta.db_table}"[:63]
+        columns = ", ".join(qn(OriginalResource._meta.get_field(c).column) for c in layer_schema["columns"])
+        cursor.execute(
+            f"CREATE TEMPORARY TABLE {qn(staging_table)} ON COMMIT DROP AS "
+            f"SELECT {columns}, NULL::bigint AS {qn(UPSERT_STAGING_ROW_COLUMN)} "
+            f"FROM {qn(OriginalResource._meta.db_table)} WITH NO DATA"
+        )
+        return staging_table
+
+    def _copy_rows(self, cursor, connection, staging_table, columns, rows):
+        qn = connection.ops.quote_name
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows([[r"\N" if value is None else value for value in row] for row in rows])
+        buffer.seek(0)
+        column_names = ", ".join([qn(c) for c in columns] + [qn(UPSERT_STAGING_ROW_COLUMN)])
+        cursor.copy_expert(
+            f"COPY {qn(staging_table)} ({column_names}) FROM STDIN WITH (FORMAT csv, NULL '\\N')",
+            buffer,
+        )
+
+    def _merge_staged_rows(self, cursor, connection, staging_table, OriginalResource, columns, upsert_key):
+        """
+        Merge the staged rows into the dataset table.
+        If the same upsert key is provided more than once, the last feature wins
+        Returns the number of created and updated features
+        """
+        qn = connection.ops.quote_name
+        table = qn(OriginalResource._meta.db_table)
+        key = qn(OriginalResource._meta.get_field(upsert_key).column)
+        db_columns = [qn(OriginalResource._meta.get_field(c).column) for c in columns]
+
+        cursor.execute(
+            f"SELECT COUNT(*), COUNT(*) FILTER (WHERE EXISTS (SELECT 1 FROM {table} t WHERE t.{key} = s.{key})) "
+            f"FROM {qn(staging_table)} s"
+        )
+        total, valid_update = cursor.fetchone()
+
+        update_set = ", ".join(f"{c} = EXCLUDED.{c}" for c in db_columns if c != key)
+        on_conflict = f"DO UPDATE SET {update_set}" if update_set else "DO NOTHING"
+        cursor.execute(
+            f"INSERT INTO {table} ({', '.join(db_columns)}) "
+            f"SELECT DISTINCT ON ({key}) {', '.join(db_columns)} FROM {qn(staging_table)} "
+            f"ORDER BY {key}, {qn(UPSERT_STAGING_ROW_COLUMN)} DESC "
+            f"ON CONFLICT ({key}) {on_conflict}"
+        )
+        return total - valid_update, valid_update
 
     def validate_feature(self, feature):
         try:
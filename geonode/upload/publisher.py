@@ -21,7 +21,7 @@ import os
 from typing import List
 
 from geonode import settings
-from geonode.geoserver.helpers import create_geoserver_db_featurestore
+from geonode.geoserver.helpers import create_geoserver_db_featurestore, gs_catalog_cache
 from geoserver.catalog import Catalog
 from geonode.utils import OGC_Servers_Handler
 from django.utils.module_loading import import_string
@@ -105,6 +105,7 @@ class DataPublisher:
         layer = self.get_resource(resource_name, return_bool=False)
         if layer:
             self.cat.delete(layer, purge="all", recurse=True)
+            gs_catalog_cache.invalidate_dataset(resource_name)
         store = self.cat.get_store(
             resource_name.split(":")[-1],
             workspace=os.getenv("DEFAULT_WORKSPACE", os.getenv("CASCADE_WORKSPACE", "geonode")),
@@ -116,6 +117,7 @@ class DataPublisher:
             )
         if store:
             self.cat.delete(store, purge="all", recurse=True)
+            gs_catalog_cache.invalidate_store(store.name, workspace=store.workspace.name)
 
     def get_or_create_store(self, default=None):
         """
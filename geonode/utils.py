@@ -31,6 +31,8 @@ import tempfile
 import ipaddress
 import traceback
 import socket
+import tarfile
+import weakref
 
 from lxml import etree
 from osgeo import ogr
@@ -38,9 +40,10 @@ from PIL import Image
 from urllib3 import Retry
 from io import BytesIO
 from decimal import Decimal
-from threading import local
+from threading import local, Lock, BoundedSemaphore
 from slugify import slugify
 from contextlib import closing
+from http.cookiejar import DefaultCookiePolicy
 from requests.exceptions import RetryError
 from collections import namedtuple, defaultdict
 from rest_framework.exceptions import APIException
@@ -307,6 +310,8 @@ class OGC_Servers_Handler:
         for option in ["TIMEOUT", "GEOFENCE_TIMEOUT"]:
             server.setdefault(option, 60)
 
+        server.setdefault("CATALOG_CACHE_TIMEOUT", 0)
+
     def __getitem__(self, alias):
         if hasattr(self._servers, alias):
             return getattr(self._servers, alias)
@@ -1050,12 +1055,22 @@ def check_ogc_backend(backend_package):
 
 
 class HttpClient:
+    """
+    HTTP client shared by the proxy and the OGC helpers.
+
+    Keep-alive sessions are pooled per upstream host (scheme, host and port), so that connections to
+    GeoServer and remote services are reused across requests instead of being re-established each time.
+    Cookies are never persisted on the shared sessions. An optional per-host limit bounds the number of
+    concurrent in-flight requests; the slot of a successful streamed response is held until the response is closed.
+    """
+
     def __init__(self):
         self.timeout = 5
         self.retries = 1
         self.pool_maxsize = 10
         self.backoff_factor = 0.3
         self.pool_connections = 10
+        self.max_concurrency = 0
         self.status_forcelist = (500, 502, 503, 504)
         self.username = "admin"
         self.password = "admin"
@@ -1066,8 +1081,100 @@ class HttpClient:
             self.backoff_factor = ogc_server_settings.get("BACKOFF_FACTOR", 0.3)
             self.pool_maxsize = ogc_server_settings.get("POOL_MAXSIZE", 10)
             self.pool_connections = ogc_server_settings.get("POOL_CONNECTIONS", 10)
+            self.max_concurrency = ogc_server_settings.get("POOL_MAX_CONCURRENCY", 0)
             self.username = ogc_server_settings.get("USER", "admin")
             self.password = ogc_server_settings.get("PASSWORD", "geoserver")
+        self._sessions = {}
+        self._semaphores = {}
+        self._stats = defaultdict(lambda: {"hits": 0, "misses": 0, "throttled": 0})
+        self._lock = Lock()
+
+    def _get_session(self, url, retries):
+        """
+        Return the pooled session for the host of the given url, creating it on first use.
+        """
+        _url = urlsplit(url)
+        host = f"{_url.scheme}://{_url.netloc}"
+        key = (host, retries)
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._stats[host]["hits"] += 1
+                return host, session
+
+            self._stats[host]["misses"] += 1
+            session = requests.Session()
+            # never share cookies among the requests of different users
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            retry = Retry(
+                total=retries,
+                read=retries,
+                connect=retries,
+                backoff_factor=self.backoff_factor,
+                status_forcelist=self.status_forcelist,
+            )
+            adapter = requests.adapters.HTTPAdapter(
+                max_retries=retry, pool_maxsize=self.pool_maxsize, pool_connections=self.pool_connections
+            )
+            session.mount(f"{_url.scheme}://", adapter)
+            session.verify = False
+            self._sessions[key] = session
+            if self.max_concurrency and host not in self._semaphores:
+                self._semaphores[host] = BoundedSemaphore(self.max_concurrency)
+            return host, session
+
+    def get_pool_stats(self):
+        """
+        Return the pool metrics per upstream host:
+        - hits/misses: pooled session reused / created
+        - connections/requests: TCP connections opened / requests sent by the underlying urllib3 pools
+        - throttled: requests rejected by the per-host concurrency limit
+        """
+        with self._lock:
+            stats = {host: dict(values, connections=0, requests=0) for host, values in self._stats.items()}
+            for (host, _retries), session in self._sessions.items():
+                for adapter in session.adapters.values():
+                    pools = adapter.poolmanager.pools
+                    for pool_key in pools.keys():
+                        pool = pools.get(pool_key)
+                        if pool is not None:
+                            stats[host]["connections"] += pool.num_connections
+                            stats[host]["requests"] += pool.num_requests
+        return stats
+
+    def close(self):
+        """
+        Close all the pooled sessions.
+        """
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    @staticmethod
+    def _release_on_close(response, semaphore):
+        """
+        Release the concurrency slot once the response is closed, or garbage collected if never closed.
+        """
+        lock = Lock()
+        released = []
+
+        def release():
+            with lock:
+                if not released:
+                    released.append(True)
+                    semaphore.release()
+
+        _close = response.close
+
+        def close():
+            try:
+                _close()
+            finally:
+                release()
+
+        response.close = close
+        weakref.finalize(response, release)
 
     def request(
         self,
@@ -1104,37 +1211,41 @@ class HttpClient:
         headers["User-Agent"] = "GeoNode"
         response = None
         content = None
-        session = requests.Session()
-        retry = Retry(
-            total=retries or self.retries,
-            read=retries or self.retries,
-            connect=retries or self.retries,
-            backoff_factor=self.backoff_factor,
-            status_forcelist=self.status_forcelist,
-        )
-        adapter = requests.adapters.HTTPAdapter(
-            max_retries=retry, pool_maxsize=self.pool_maxsize, pool_connections=self.pool_connections
-        )
-        scheme = urlsplit(url).scheme
-        session.mount(f"{scheme}://", adapter)
-        session.verify = False
-        action = getattr(session, method.lower(), None)
-        if action:
-            _req_tout = timeout or self.timeout
-            try:
-                response = action(url=url, data=data, headers=headers, timeout=_req_tout, stream=stream, verify=verify)
-            except (
-                requests.exceptions.ConnectTimeout,
-                requests.exceptions.RequestException,
-                ValueError,
-                RetryError,
-            ) as e:
-                msg = f"Request exception [{e}] - TOUT [{_req_tout}] to URL: {url} - headers: {headers}"
-                logger.exception(Exception(msg))
-                response = None
-                content = str(e)
-        else:
-            response = session.get(url, headers=headers, timeout=self.timeout)
+        host, session = self._get_session(url, retries or self.retries)
+        _req_tout = timeout or self.timeout
+        semaphore = self._semaphores.get(host)
+        if semaphore and not semaphore.acquire(timeout=_req_tout if isinstance(_req_tout, (int, float)) else None):
+            with self._lock:
+                self._stats[host]["throttled"] += 1
+            content = f"Too many concurrent requests to {host}"
+            logger.error(f"{content} - URL: {url}")
+            return (response, content)
+        try:
+            action = getattr(session, method.lower(), None)
+            if action:
+                try:
+                    response = action(
+                        url=url, data=data, headers=headers, timeout=_req_tout, stream=stream, verify=verify
+                    )
+                except (
+                    requests.exceptions.ConnectTimeout,
+                    requests.exceptions.RequestException,
+                    ValueError,
+                    RetryError,
+                ) as e:
+                    msg = f"Request exception [{e}] - TOUT [{_req_tout}] to URL: {url} - headers: {headers}"
+                    logger.exception(Exception(msg))
+                    response = None
+                    content = str(e)
+            else:
+                response = session.get(url, headers=headers, timeout=self.timeout)
+        finally:
+            if semaphore:
+                if stream and response:
+                    # the body is still to be read: keep the slot until the response is closed
+                    self._release_on_close(response, semaphore)
+                else:
+                    semaphore.release()
         if response:
             try:
                 content = ensure_string(response.content) if not stream else response.raw
@@ -1222,8 +1333,15 @@ def extract_archive(zip_file, dst):
     if not os.path.exists(target_folder):
         os.makedirs(target_folder, exist_ok=True)
 
-    with ZipFile(zip_file, "r", allowZip64=True) as z:
-        z.extractall(target_folder)
+    if is_zipfile(zip_file):
+        with ZipFile(zip_file, "r", allowZip64=True) as z:
+            z.extractall(target_folder)
+    else:
+        with tarfile.open(zip_file, "r:*") as t:
+            if hasattr(tarfile, "data_filter"):
+                t.extractall(target_folder, filter="data")
+            else:
+                t.extractall(target_folder)
 
     return target_folder
 